@@ -0,0 +1,158 @@
+"""
+Benchmarks optimizing the code chunks of long synthetic analyses, which
+happens every time the code is transpiled.
+
+There are two analyses. The first adds a column to one of a few dataframes, 
+sets a formula in it, renames it, and then deletes it again a few steps later, 
+so most code chunks combine with the code chunks right next to them. The second 
+adds a column to each of many dataframes, then sets a formula in each of them, 
+and then renames each of them, so the code chunks can only be combined after 
+being reordered past the edits to all the other dataframes.
+
+To run this file, run python dev/benchmarks/benchmark_optimize_code_chunks.py
+from the mitosheet folder. You can optionally pass the number of steps to
+benchmark, e.g. python dev/benchmarks/benchmark_optimize_code_chunks.py 1000 4000
+"""
+
+import sys
+from time import perf_counter
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from mitosheet.code_chunks.code_chunk_utils import get_code_chunks
+from mitosheet.enterprise.mito_config import MitoConfig
+from mitosheet.pro.code_chunks.code_chunk_pro_utils import optimize_code_chunks
+from mitosheet.steps_manager import StepsManager
+from mitosheet.types import FORMULA_ENTIRE_COLUMN_TYPE
+
+DEFAULT_NUM_STEPS = [1_000, 2_000, 4_000]
+NUM_SHEETS = 4
+NUM_INTERLEAVED_SHEETS = 40
+# The number of columns that are added to a sheet before they are deleted
+NUM_COLUMNS_BEFORE_DELETE = 3
+
+
+def get_add_column_step_data(sheet_index: int, column_header: str) -> Dict[str, Any]:
+    return {
+        'step_type': 'add_column',
+        'params': {
+            'sheet_index': sheet_index,
+            'column_header': column_header,
+            'column_header_index': -1,
+            'public_interface_version': 3
+        }
+    }
+
+
+def get_set_column_formula_step_data(sheet_index: int, column_header: str, new_formula: str) -> Dict[str, Any]:
+    return {
+        'step_type': 'set_column_formula',
+        'params': {
+            'sheet_index': sheet_index,
+            'column_id': column_header,
+            'formula_label': 0,
+            'index_labels_formula_is_applied_to': {'type': FORMULA_ENTIRE_COLUMN_TYPE},
+            'new_formula': new_formula,
+            'public_interface_version': 3
+        }
+    }
+
+
+def get_rename_column_step_data(sheet_index: int, column_header: str, new_column_header: str) -> Dict[str, Any]:
+    return {
+        'step_type': 'rename_column',
+        'params': {
+            'sheet_index': sheet_index,
+            'column_id': column_header,
+            'new_column_header': new_column_header,
+            'public_interface_version': 3
+        }
+    }
+
+
+def get_synthetic_steps_data(num_steps: int) -> List[Dict[str, Any]]:
+    """
+    Returns the steps data for an analysis that cycles through adding a column,
+    setting a formula in it, and renaming it, on each sheet in turn. After every
+    NUM_COLUMNS_BEFORE_DELETE columns on a sheet, the columns are deleted.
+    """
+    steps_data: List[Dict[str, Any]] = []
+    column_index = 0
+    while len(steps_data) < num_steps:
+        sheet_index = column_index % NUM_SHEETS
+        column_header = f'C{column_index}'
+        steps_data.extend([
+            get_add_column_step_data(sheet_index, column_header),
+            get_set_column_formula_step_data(sheet_index, column_header, f'=A + {column_index}'),
+            get_rename_column_step_data(sheet_index, column_header, f'{column_header}_renamed'),
+        ])
+
+        # Every so often, delete the columns we added to this sheet
+        if (column_index // NUM_SHEETS) % NUM_COLUMNS_BEFORE_DELETE == NUM_COLUMNS_BEFORE_DELETE - 1:
+            steps_data.append({
+                'step_type': 'delete_column',
+                'params': {
+                    'sheet_index': sheet_index,
+                    'column_ids': [f'C{column_index - NUM_SHEETS * (NUM_COLUMNS_BEFORE_DELETE - 1)}'],
+                    'public_interface_version': 3
+                }
+            })
+
+        column_index += 1
+
+    return steps_data[:num_steps]
+
+
+def get_interleaved_steps_data(num_steps: int) -> List[Dict[str, Any]]:
+    """
+    Returns the steps data for an analysis that adds a column to each of the
+    NUM_INTERLEAVED_SHEETS sheets, then sets a formula in each of these columns, 
+    and then renames each of them, over and over again.
+    """
+    steps_data: List[Dict[str, Any]] = []
+    round_index = 0
+    while len(steps_data) < num_steps:
+        column_header = f'C{round_index}'
+        sheet_indexes = range(NUM_INTERLEAVED_SHEETS)
+        steps_data.extend(get_add_column_step_data(sheet_index, column_header) for sheet_index in sheet_indexes)
+        steps_data.extend(get_set_column_formula_step_data(sheet_index, column_header, f'=A + {round_index}') for sheet_index in sheet_indexes)
+        steps_data.extend(get_rename_column_step_data(sheet_index, column_header, f'{column_header}_renamed') for sheet_index in sheet_indexes)
+        round_index += 1
+
+    return steps_data[:num_steps]
+
+
+def benchmark_optimize_code_chunks(num_steps: int, interleaved: bool=False) -> Dict[str, Any]:
+    num_sheets = NUM_INTERLEAVED_SHEETS if interleaved else NUM_SHEETS
+    steps_data = get_interleaved_steps_data(num_steps) if interleaved else get_synthetic_steps_data(num_steps)
+
+    dfs = [pd.DataFrame({'A': [1, 2, 3]}) for _ in range(num_sheets)]
+    steps_manager = StepsManager(dfs, MitoConfig()) # type: ignore
+    steps_manager.execute_steps_data(new_steps_data=steps_data)
+
+    code_chunks = get_code_chunks(steps_manager.steps_including_skipped, optimize=False)
+
+    start_time = perf_counter()
+    optimized_code_chunks = optimize_code_chunks(code_chunks)
+    seconds = perf_counter() - start_time
+
+    return {
+        'num_code_chunks': len(code_chunks),
+        'num_optimized_code_chunks': len(optimized_code_chunks),
+        'seconds': seconds,
+    }
+
+
+def main() -> None:
+    all_num_steps = [int(arg) for arg in sys.argv[1:]] if len(sys.argv) > 1 else DEFAULT_NUM_STEPS
+
+    for interleaved in [False, True]:
+        print('Interleaved analysis' if interleaved else 'Analysis')
+        for num_steps in all_num_steps:
+            result = benchmark_optimize_code_chunks(num_steps, interleaved=interleaved)
+            print(f'{num_steps} steps: optimized {result["num_code_chunks"]} code chunks to {result["num_optimized_code_chunks"]} in {result["seconds"]:.4f}s')
+
+
+if __name__ == '__main__':
+    main()
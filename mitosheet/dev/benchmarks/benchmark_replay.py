@@ -0,0 +1,105 @@
+"""
+Benchmarks replaying, undoing, and computing the skipped steps of long
+synthetic analyses in the StepsManager.
+
+This is useful for making sure that the cost of handling the step list
+grows linearly with the number of steps, as analyses created by automated
+scripts can have thousands of steps.
+
+To run this file, run python dev/benchmarks/benchmark_replay.py from the
+mitosheet folder. You can optionally pass the number of steps to benchmark,
+e.g. python dev/benchmarks/benchmark_replay.py 100 1000
+"""
+
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from mitosheet.enterprise.mito_config import MitoConfig
+from mitosheet.step_performers.sort import SORT_DIRECTION_ASCENDING, SORT_DIRECTION_DESCENDING
+from mitosheet.steps_manager import StepsManager, get_step_indexes_to_skip
+from mitosheet.types import FC_NUMBER_GREATER, FORMULA_ENTIRE_COLUMN_TYPE
+
+DEFAULT_NUM_STEPS = [100, 1_000, 5_000]
+
+
+def get_synthetic_steps_data(num_steps: int) -> List[Dict[str, Any]]:
+    """
+    Returns the steps data for an analysis that repeatedly sets a formula in
+    column B, overwrites the filter on column A -- so that every filter skips
+    the filter before it -- and then sorts by column B.
+
+    The dataframe stays the same size throughout, so that we only measure how
+    the cost grows with the number of steps.
+    """
+    steps_data: List[Dict[str, Any]] = []
+    for step_index in range(num_steps):
+        if step_index % 3 == 0:
+            steps_data.append({
+                'step_type': 'set_column_formula',
+                'params': {
+                    'sheet_index': 0,
+                    'column_id': 'B',
+                    'formula_label': 0,
+                    'index_labels_formula_is_applied_to': {'type': FORMULA_ENTIRE_COLUMN_TYPE},
+                    'new_formula': f'=A + {step_index}',
+                    'public_interface_version': 3
+                }
+            })
+        elif step_index % 3 == 1:
+            steps_data.append({
+                'step_type': 'filter_column',
+                'params': {
+                    'sheet_index': 0,
+                    'column_id': 'A',
+                    'operator': 'And',
+                    'filters': [{'condition': FC_NUMBER_GREATER, 'value': -step_index}],
+                    'public_interface_version': 3
+                }
+            })
+        else:
+            steps_data.append({
+                'step_type': 'sort',
+                'params': {
+                    'sheet_index': 0,
+                    'column_id': 'B',
+                    'sort_direction': SORT_DIRECTION_DESCENDING if step_index % 2 == 0 else SORT_DIRECTION_ASCENDING,
+                    'public_interface_version': 3
+                }
+            })
+    return steps_data
+
+
+def time_call(func: Callable[[], Any]) -> float:
+    start_time = perf_counter()
+    func()
+    return perf_counter() - start_time
+
+
+def benchmark_replay(num_steps: int) -> Dict[str, float]:
+    df = pd.DataFrame({'A': list(range(100)), 'B': list(range(100))})
+    steps_manager = StepsManager([df], MitoConfig()) # type: ignore
+    steps_data = get_synthetic_steps_data(num_steps)
+
+    return {
+        'replay': time_call(lambda: steps_manager.execute_steps_data(new_steps_data=steps_data)),
+        'get_step_indexes_to_skip': time_call(lambda: get_step_indexes_to_skip(steps_manager.steps_including_skipped)),
+        'undo': time_call(lambda: steps_manager.execute_undo()),
+        'redo': time_call(lambda: steps_manager.execute_redo()),
+        'undo_to_middle_step': time_call(lambda: steps_manager.execute_undo_to_step_index(num_steps // 2)),
+    }
+
+
+def main() -> None:
+    all_num_steps = [int(arg) for arg in sys.argv[1:]] if len(sys.argv) > 1 else DEFAULT_NUM_STEPS
+
+    for num_steps in all_num_steps:
+        print(f'{num_steps} steps')
+        for name, seconds in benchmark_replay(num_steps).items():
+            print(f'    {name:<28}{seconds:>10.4f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmarks turning dataframes into the sheet data that is sent to the
+frontend, which happens on every edit.
+
+The dataframes are 1,500 rows by 1,000 columns, which is the largest window
+of a dataframe that we send, and contain a mix of dtypes with missing values.
+
+To run this file, run python dev/benchmarks/benchmark_sheet_data.py from the
+mitosheet folder.
+"""
+
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from mitosheet.enterprise.mito_config import MitoConfig
+from mitosheet.steps_manager import StepsManager
+from mitosheet.utils import MAX_ROWS, convert_df_to_parsed_json
+
+NUM_COLUMNS = 1_000
+NUM_REPEATS = 3
+
+
+def get_mixed_dtype_df(num_rows: int, num_columns: int) -> pd.DataFrame:
+    """
+    Returns a dataframe where the columns cycle through float, int, string,
+    boolean, datetime, and timedelta columns, with some missing values.
+    """
+    rng = np.random.default_rng(0)
+    missing = np.arange(num_rows) % 7 == 0
+
+    columns: Dict[str, Any] = {}
+    for column_index in range(num_columns):
+        dtype_index = column_index % 6
+        if dtype_index == 0:
+            values: Any = np.where(missing, np.nan, rng.random(num_rows))
+        elif dtype_index == 1:
+            values = rng.integers(0, 1_000, num_rows)
+        elif dtype_index == 2:
+            values = pd.Series(rng.integers(0, 1_000, num_rows).astype(str)).where(~missing)
+        elif dtype_index == 3:
+            values = rng.random(num_rows) > 0.5
+        elif dtype_index == 4:
+            values = pd.Series(pd.date_range('2020-01-01', periods=num_rows, freq='h')).where(~missing)
+        else:
+            values = pd.Series(pd.to_timedelta(rng.integers(0, 10**6, num_rows), unit='s')).where(~missing)
+        columns[f'column_{column_index}'] = values
+
+    return pd.DataFrame(columns)
+
+
+def time_call(func: Callable[[], Any]) -> float:
+    """Returns the fastest time of NUM_REPEATS calls"""
+    times = []
+    for _ in range(NUM_REPEATS):
+        start_time = perf_counter()
+        func()
+        times.append(perf_counter() - start_time)
+    return min(times)
+
+
+def main() -> None:
+    df = get_mixed_dtype_df(MAX_ROWS, NUM_COLUMNS)
+    steps_manager = StepsManager([df], MitoConfig()) # type: ignore
+
+    def get_sheet_data_json() -> None:
+        # Reset the saved sheet data, so the sheet is serialized again
+        steps_manager.saved_sheet_data = []
+        steps_manager.saved_displayed_dfs = []
+        steps_manager.saved_sheet_fingerprints = ()
+        steps_manager.last_step_index_we_wrote_sheet_json_on = 0
+        steps_manager.sheet_data_json
+
+    print(f'{MAX_ROWS} rows x {NUM_COLUMNS} columns of mixed dtypes')
+    print(f'    {"convert_df_to_parsed_json":<28}{time_call(lambda: convert_df_to_parsed_json(df, max_columns=NUM_COLUMNS)):>10.4f}s')
+    print(f'    {"sheet_data_json":<28}{time_call(get_sheet_data_json):>10.4f}s')
+
+
+if __name__ == '__main__':
+    main()
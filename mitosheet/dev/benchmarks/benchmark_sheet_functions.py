@@ -0,0 +1,90 @@
+"""
+Benchmarks the sheet functions that pick values row by row, like IF and IFS,
+and the lookup functions, like VLOOKUP, on columns with millions of rows.
+
+The columns are int, float, and string columns, and the conditions are True
+in about half of the rows. The lookup tables have NUM_LOOKUP_ROWS rows, and
+about half of the values that are looked up are in them.
+
+To run this file, run python dev/benchmarks/benchmark_sheet_functions.py from the
+mitosheet folder. You can optionally pass the number of rows, e.g.
+python dev/benchmarks/benchmark_sheet_functions.py --rows 1000000 5000000
+"""
+
+import argparse
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from mitosheet.public.v1.sheet_functions.control_functions import IF as IF_V1
+from mitosheet.public.v3.sheet_functions.bool_functions import IF, IFS
+from mitosheet.public.v3.sheet_functions.misc_functions import (INDEX, MATCH,
+                                                                VLOOKUP,
+                                                                XLOOKUP)
+
+DEFAULT_NUM_ROWS = [1_000_000, 5_000_000]
+NUM_LOOKUP_ROWS = 100_000
+NUM_REPEATS = 3
+
+
+def get_df(num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'int': rng.integers(0, 1_000, num_rows),
+        'float': rng.random(num_rows),
+        'string': pd.Series(rng.integers(0, 1_000, num_rows)).astype(str),
+    })
+
+
+def get_lookup_df() -> pd.DataFrame:
+    keys = np.arange(0, 2 * NUM_LOOKUP_ROWS, 2) % 1_000
+    return pd.DataFrame({
+        'int': keys,
+        'string': pd.Series(keys).astype(str).str.upper(),
+        'value': np.arange(NUM_LOOKUP_ROWS),
+    })
+
+
+def get_benchmarks(df: pd.DataFrame) -> Dict[str, Callable[[], Any]]:
+    condition = df['float'] > 0.5
+    lookup_df = get_lookup_df()
+    return {
+        'IF v1 int': lambda: IF_V1(condition, df['int'], df['int'] * 2),
+        'IF v3 int': lambda: IF(condition, df['int'], 0),
+        'IF v3 float': lambda: IF(condition, df['float'], df['int']),
+        'IF v3 string': lambda: IF(condition, df['string'], 'small'),
+        'IFS v3 int': lambda: IFS(df['float'] > 0.75, df['int'], df['float'] > 0.5, 1, df['float'] > 0.25, 2),
+        'IFS v3 string': lambda: IFS(df['float'] > 0.75, df['string'], df['float'] > 0.25, 'medium'),
+        'VLOOKUP int': lambda: VLOOKUP(df['int'], lookup_df[['int', 'value']], 2),
+        'VLOOKUP string': lambda: VLOOKUP(df['string'], lookup_df[['string', 'value']], 2),
+        'XLOOKUP string': lambda: XLOOKUP(df['string'], lookup_df[['string']], lookup_df[['value']]),
+        'INDEX MATCH string': lambda: INDEX(lookup_df[['value']], MATCH(df['string'], lookup_df[['string']], 0)),
+    }
+
+
+def time_call(func: Callable[[], Any]) -> float:
+    """Returns the fastest time of NUM_REPEATS calls"""
+    times = []
+    for _ in range(NUM_REPEATS):
+        start_time = perf_counter()
+        func()
+        times.append(perf_counter() - start_time)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the sheet functions.')
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_NUM_ROWS)
+    args = parser.parse_args()
+
+    for num_rows in args.rows:
+        df = get_df(num_rows)
+        print(f'{num_rows} rows')
+        for name, func in get_benchmarks(df).items():
+            print(f'    {name:<28}{time_call(func):>10.4f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,382 @@
+"""
+Benchmarks each of the step performers on synthetic dataframes, measuring
+the time and peak memory of:
+1. replay: replaying the analysis into a new StepsManager, as happens when
+   a saved analysis is replayed
+2. execute: executing the step as a new step, as happens on every edit
+3. transpile: generating the code for the analysis
+4. sheet_data_json: creating the sheet data that is sent to the frontend
+5. undo: undoing the step
+
+Every step performer in EVENT_TYPE_TO_STEP_PERFORMER is either benchmarked,
+or listed in SKIPPED_STEP_TYPES along with the reason it is skipped.
+
+Time and peak memory are measured in separate runs, as tracing the memory
+allocations slows down the code a lot. Peak memory is the most memory that
+was allocated at once on top of the memory that was already allocated.
+
+The results are compared against the baseline in baselines/step_performers.json,
+and any result that is REGRESSION_THRESHOLD times slower or larger than the
+baseline is reported as a regression. Timings depend on the machine they are
+run on, so save a baseline on your machine before making a change with the
+--save-baseline flag, and then compare against it after the change.
+
+To run this file, run python dev/benchmarks/benchmark_step_performers.py from
+the mitosheet folder. You can optionally pass the sizes of the dataframes, and
+the step types to benchmark, e.g. to benchmark realistic sizes, run:
+python dev/benchmarks/benchmark_step_performers.py --rows 10000 1000000 10000000 --columns 10 500
+NOTE: the largest sizes take many GB of memory, and hours to run.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from mitosheet.enterprise.mito_config import MitoConfig
+from mitosheet.state import get_default_dataframe_format
+from mitosheet.step_performers import EVENT_TYPE_TO_STEP_PERFORMER
+from mitosheet.step_performers.graph_steps.graph_utils import BAR
+from mitosheet.step_performers.graph_steps.plotly_express_graphs import (
+    DO_NOT_CHANGE_PAPER_BGCOLOR_DEFAULT, DO_NOT_CHANGE_PLOT_BGCOLOR_DEFAULT,
+    DO_NOT_CHANGE_TITLE_FONT_COLOR_DEFAULT)
+from mitosheet.step_performers.pivot import PCT_NO_OP
+from mitosheet.step_performers.sort import SORT_DIRECTION_ASCENDING
+from mitosheet.steps_manager import StepsManager
+from mitosheet.types import FC_NUMBER_GREATER, FORMULA_ENTIRE_COLUMN_TYPE
+
+DEFAULT_NUM_ROWS = [10_000]
+DEFAULT_NUM_COLUMNS = [10]
+# The columns cycle through int, float, category-like string, and delimited string columns
+NUM_COLUMN_KINDS = 4
+NUM_CATEGORIES = 10
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baselines', 'step_performers.json')
+REGRESSION_THRESHOLD = 1.5
+# Differences smaller than these are just noise, so they are never regressions
+MIN_REGRESSION_SECONDS = 0.01
+MIN_REGRESSION_PEAK_MEMORY_MB = 1
+
+METRICS = ['replay', 'execute', 'transpile', 'sheet_data_json', 'undo']
+
+SKIPPED_STEP_TYPES = {
+    'simple_import': 'reads files from disk',
+    'excel_import': 'reads files from disk',
+    'excel_range_import': 'reads files from disk',
+    'snowflake_import': 'requires Snowflake credentials',
+    'dataframe_import': 'reads dataframes from the variables of the notebook',
+    'user_defined_import': 'requires importers passed to the mitosheet',
+    'user_defined_edit': 'requires editors passed to the mitosheet',
+    'export_to_file': 'writes files to disk',
+    'bulk_old_rename': 'is only used to upgrade very old analyses',
+}
+
+
+def get_synthetic_df(num_rows: int, num_columns: int) -> pd.DataFrame:
+    """
+    Returns a dataframe where the columns C0, C1, ... cycle through int, float with
+    missing values, category-like string, and delimited string columns.
+    """
+    rng = np.random.default_rng(0)
+    columns: Dict[str, Any] = {}
+    for column_index in range(num_columns):
+        column_kind = column_index % NUM_COLUMN_KINDS
+        if column_kind == 0:
+            values: Any = rng.integers(0, 1_000, num_rows)
+        elif column_kind == 1:
+            values = np.where(np.arange(num_rows) % 7 == 0, np.nan, rng.random(num_rows))
+        elif column_kind == 2:
+            values = np.array([f'category_{i}' for i in range(NUM_CATEGORIES)], dtype=object)[rng.integers(0, NUM_CATEGORIES, num_rows)]
+        else:
+            values = pd.Series(rng.integers(0, 1_000, num_rows).astype(str)).radd('value-')
+        columns[f'C{column_index}'] = values
+
+    return pd.DataFrame(columns)
+
+
+def get_step_data(step_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'step_type': step_type,
+        'params': {**params, 'public_interface_version': 3}
+    }
+
+
+def get_graph_step_data(graph_id: str) -> Dict[str, Any]:
+    return get_step_data('graph', {
+        'graph_id': graph_id,
+        'graph_preprocessing': {'safety_filter_turned_on_by_user': True},
+        'graph_creation': {
+            'graph_type': BAR,
+            'sheet_index': 0,
+            'x_axis_column_ids': ['C2'],
+            'y_axis_column_ids': ['C1'],
+            'color': None,
+            'facet_col_column_id': None,
+            'facet_row_column_id': None,
+            'histfunc': None,
+            'histnorm': None,
+            'line_shape': None,
+            'points': None
+        },
+        'graph_styling': {
+            'title': {'title': None, 'visible': True, 'title_font_color': DO_NOT_CHANGE_TITLE_FONT_COLOR_DEFAULT},
+            'xaxis': {'title': None, 'visible': True, 'title_font_color': DO_NOT_CHANGE_TITLE_FONT_COLOR_DEFAULT, 'type': None, 'showgrid': True, 'rangeslider': {'visible': True}},
+            'yaxis': {'title': None, 'visible': True, 'title_font_color': DO_NOT_CHANGE_TITLE_FONT_COLOR_DEFAULT, 'type': None, 'showgrid': True},
+            'showlegend': True,
+            'legend': {'title': {'text': None}, 'orientation': 'v'},
+            'barmode': None,
+            'barnorm': None,
+            'paper_bgcolor': DO_NOT_CHANGE_PAPER_BGCOLOR_DEFAULT,
+            'plot_bgcolor': DO_NOT_CHANGE_PLOT_BGCOLOR_DEFAULT,
+        },
+        'graph_rendering': {'height': '400px', 'width': '400px'}
+    })
+
+
+# For each step type, the steps data of an analysis that ends with a step of that type.
+# The other steps are just there to set up the step that is benchmarked.
+STEP_TYPE_TO_STEPS_DATA: Dict[str, List[Dict[str, Any]]] = {
+    'pivot': [get_step_data('pivot', {
+        'sheet_index': 0,
+        'pivot_rows_column_ids_with_transforms': [{'column_id': 'C2', 'transformation': PCT_NO_OP}],
+        'pivot_columns_column_ids_with_transforms': [],
+        'values_column_ids_map': {'C1': ['sum', 'mean']},
+        'destination_sheet_index': None,
+        'pivot_filters': [],
+        'flatten_column_headers': True
+    })],
+    'reorder_column': [get_step_data('reorder_column', {'sheet_index': 0, 'column_id': 'C0', 'new_column_index': 2})],
+    'filter_column': [get_step_data('filter_column', {
+        'sheet_index': 0,
+        'column_id': 'C0',
+        'operator': 'And',
+        'filters': [{'condition': FC_NUMBER_GREATER, 'value': 500}]
+    })],
+    'sort': [get_step_data('sort', {'sheet_index': 0, 'column_id': 'C1', 'sort_direction': SORT_DIRECTION_ASCENDING})],
+    'set_cell_value': [get_step_data('set_cell_value', {'sheet_index': 0, 'column_id': 'C0', 'row_index': 0, 'new_value': '5'})],
+    'add_column': [get_step_data('add_column', {'sheet_index': 0, 'column_header': 'new_column', 'column_header_index': -1})],
+    'set_column_formula': [
+        get_step_data('add_column', {'sheet_index': 0, 'column_header': 'new_column', 'column_header_index': -1}),
+        get_step_data('set_column_formula', {
+            'sheet_index': 0,
+            'column_id': 'new_column',
+            'formula_label': 0,
+            'index_labels_formula_is_applied_to': {'type': FORMULA_ENTIRE_COLUMN_TYPE},
+            'new_formula': '=C0 + C1',
+        })
+    ],
+    'change_column_dtype': [get_step_data('change_column_dtype', {'sheet_index': 0, 'column_ids': ['C0'], 'new_dtype': 'float64'})],
+    'merge': [
+        get_step_data('dataframe_duplicate', {'sheet_index': 0}),
+        get_step_data('merge', {
+            'how': 'lookup',
+            'sheet_index_one': 0,
+            'sheet_index_two': 1,
+            'merge_key_column_ids': [['C2', 'C2']],
+            'selected_column_ids_one': ['C0', 'C1', 'C2'],
+            'selected_column_ids_two': ['C0', 'C2'],
+            'destination_sheet_index': None
+        })
+    ],
+    'concat': [
+        get_step_data('dataframe_duplicate', {'sheet_index': 0}),
+        get_step_data('concat', {'join': 'inner', 'ignore_index': True, 'sheet_indexes': [0, 1]})
+    ],
+    'fill_na': [get_step_data('fill_na', {'sheet_index': 0, 'column_ids': ['C1'], 'fill_method': {'type': 'value', 'value': 0}})],
+    'delete_column': [get_step_data('delete_column', {'sheet_index': 0, 'column_ids': ['C1']})],
+    'rename_column': [get_step_data('rename_column', {'sheet_index': 0, 'column_id': 'C0', 'new_column_header': 'renamed', 'level': None})],
+    'dataframe_delete': [get_step_data('dataframe_delete', {'sheet_index': 0})],
+    'dataframe_duplicate': [get_step_data('dataframe_duplicate', {'sheet_index': 0})],
+    'dataframe_rename': [get_step_data('dataframe_rename', {'sheet_index': 0, 'new_dataframe_name': 'renamed'})],
+    'drop_duplicates': [get_step_data('drop_duplicates', {'sheet_index': 0, 'column_ids': ['C2'], 'keep': 'first'})],
+    'graph': [get_graph_step_data('graph_id')],
+    'graph_delete': [get_graph_step_data('graph_id'), get_step_data('graph_delete', {'graph_id': 'graph_id'})],
+    'graph_duplicate': [get_graph_step_data('graph_id'), get_step_data('graph_duplicate', {'old_graph_id': 'graph_id', 'new_graph_id': 'new_graph_id'})],
+    'graph_rename': [get_graph_step_data('graph_id'), get_step_data('graph_rename', {'graph_id': 'graph_id', 'new_graph_tab_name': 'renamed'})],
+    'delete_row': [get_step_data('delete_row', {'sheet_index': 0, 'labels': [0]})],
+    'promote_row_to_header': [get_step_data('promote_row_to_header', {'sheet_index': 0, 'index': 0})],
+    'split_text_to_columns': [get_step_data('split_text_to_columns', {
+        'sheet_index': 0,
+        'column_id': 'C3',
+        'delimiters': ['-'],
+        'new_column_header_suffix': 'split'
+    })],
+    # NOTE: this makes a dataframe with as many columns as there are rows
+    'transpose': [get_step_data('transpose', {'sheet_index': 0})],
+    'melt': [get_step_data('melt', {'sheet_index': 0, 'id_var_column_ids': ['C0'], 'value_var_column_ids': ['C1', 'C2']})],
+    'one_hot_encoding': [get_step_data('one_hot_encoding', {'sheet_index': 0, 'column_id': 'C2'})],
+    'set_dataframe_format': [get_step_data('set_dataframe_format', {'sheet_index': 0, 'df_format': get_default_dataframe_format()})],
+    'reset_index': [get_step_data('reset_index', {'sheet_index': 0, 'drop': True})],
+    'ai_transformation': [get_step_data('ai_transformation', {
+        'user_input': 'double C0',
+        'prompt_version': 'benchmark',
+        'prompt': 'double C0',
+        'completion': "df1['C0'] = df1['C0'] * 2",
+        'edited_completion': "df1['C0'] = df1['C0'] * 2",
+    })],
+    'column_headers_transform': [get_step_data('column_headers_transform', {'sheet_index': 0, 'transformation': {'type': 'lowercase'}})],
+    'replace': [get_step_data('replace', {'sheet_index': 0, 'column_ids': ['C2'], 'search_value': 'category', 'replace_value': 'group'})],
+    'recalculate_dependents': [
+        get_step_data('add_column', {'sheet_index': 0, 'column_header': 'new_column', 'column_header_index': -1}),
+        get_step_data('set_column_formula', {
+            'sheet_index': 0,
+            'column_id': 'new_column',
+            'formula_label': 0,
+            'index_labels_formula_is_applied_to': {'type': FORMULA_ENTIRE_COLUMN_TYPE},
+            'new_formula': '=C0 + C1',
+        }),
+        get_step_data('recalculate_dependents', {'sheet_index': 0, 'column_id': 'C0'})
+    ],
+}
+
+
+def time_call(func: Callable[[], Any]) -> float:
+    start_time = perf_counter()
+    func()
+    return perf_counter() - start_time
+
+
+def measure_peak_memory_mb(func: Callable[[], Any]) -> float:
+    """Returns the most memory allocated at once while calling func, in MB"""
+    start_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    func()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    return (peak_memory - start_memory) / 1024 / 1024
+
+
+def run_step_benchmark(df: pd.DataFrame, steps_data: List[Dict[str, Any]], measure: Callable[[Callable[[], Any]], float]) -> Dict[str, float]:
+    """
+    Measures each of the METRICS with the measure function, where the last step
+    in steps_data is the step that is executed, transpiled, and undone.
+    """
+    results: Dict[str, float] = {}
+    results['replay'] = measure(lambda: StepsManager([df], MitoConfig()).execute_steps_data(new_steps_data=steps_data)) # type: ignore
+
+    steps_manager = StepsManager([df], MitoConfig()) # type: ignore
+    steps_manager.execute_steps_data(new_steps_data=steps_data[:-1])
+
+    def get_sheet_data_json() -> None:
+        # Reset the saved sheet data, so all the sheets are serialized again
+        steps_manager.saved_sheet_data = []
+        steps_manager.saved_displayed_dfs = []
+        steps_manager.saved_sheet_fingerprints = ()
+        steps_manager.last_step_index_we_wrote_sheet_json_on = -1
+        steps_manager.sheet_data_json
+
+    results['execute'] = measure(lambda: steps_manager.execute_steps_data(new_steps_data=steps_data[-1:]))
+    results['transpile'] = measure(lambda: steps_manager.code())
+    results['sheet_data_json'] = measure(get_sheet_data_json)
+    results['undo'] = measure(lambda: steps_manager.execute_undo())
+    return results
+
+
+def benchmark_step_performer(df: pd.DataFrame, step_type: str) -> Dict[str, Dict[str, float]]:
+    steps_data = STEP_TYPE_TO_STEPS_DATA[step_type]
+    seconds = run_step_benchmark(df, steps_data, time_call)
+
+    tracemalloc.start()
+    try:
+        peak_memory_mb = run_step_benchmark(df, steps_data, measure_peak_memory_mb)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        metric: {'seconds': seconds[metric], 'peak_memory_mb': peak_memory_mb[metric]}
+        for metric in METRICS
+    }
+
+
+def get_regressions(results: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """
+    Returns a description of each result that is REGRESSION_THRESHOLD times worse
+    than the baseline for the same size, step type, and metric.
+    """
+    regressions = []
+    for size, size_results in results.items():
+        for step_type, step_results in size_results.items():
+            for metric, result in step_results.items():
+                baseline_result = baseline.get(size, {}).get(step_type, {}).get(metric)
+                if baseline_result is None:
+                    continue
+
+                for measurement, min_difference in [('seconds', MIN_REGRESSION_SECONDS), ('peak_memory_mb', MIN_REGRESSION_PEAK_MEMORY_MB)]:
+                    new_value, baseline_value = result[measurement], baseline_result[measurement]
+                    if new_value > baseline_value * REGRESSION_THRESHOLD and new_value - baseline_value > min_difference:
+                        regressions.append(f'{size} {step_type} {metric}: {baseline_value:.4f} -> {new_value:.4f} {measurement}')
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the step performers on synthetic dataframes.')
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_NUM_ROWS)
+    parser.add_argument('--columns', type=int, nargs='+', default=DEFAULT_NUM_COLUMNS)
+    parser.add_argument('--step-types', nargs='+', default=None)
+    parser.add_argument('--save-baseline', action='store_true', help='Save the results as the new baseline, rather than comparing against it.')
+    args = parser.parse_args()
+
+    # Make sure that every step performer is benchmarked, or skipped on purpose
+    all_step_types = {step_performer.step_type() for step_performer in EVENT_TYPE_TO_STEP_PERFORMER.values()}
+    missing_step_types = all_step_types - set(STEP_TYPE_TO_STEPS_DATA) - set(SKIPPED_STEP_TYPES)
+    if len(missing_step_types) > 0:
+        raise ValueError(f'Add the steps data to benchmark, or the reason to skip, these step types: {sorted(missing_step_types)}')
+
+    step_types: List[str] = args.step_types if args.step_types is not None else list(STEP_TYPE_TO_STEPS_DATA)
+    for step_type, reason in SKIPPED_STEP_TYPES.items():
+        print(f'Skipping {step_type}, as it {reason}')
+
+    results: Dict[str, Any] = {}
+    for num_rows in args.rows:
+        for num_columns in args.columns:
+            if num_columns < NUM_COLUMN_KINDS:
+                raise ValueError(f'The dataframes must have at least {NUM_COLUMN_KINDS} columns')
+
+            size = f'{num_rows}x{num_columns}'
+            print(f'{num_rows} rows x {num_columns} columns')
+            df = get_synthetic_df(num_rows, num_columns)
+            results[size] = {}
+            for step_type in step_types:
+                results[size][step_type] = benchmark_step_performer(df, step_type)
+                print(f'    {step_type}')
+                for metric, result in results[size][step_type].items():
+                    print(f'        {metric:<24}{result["seconds"]:>10.4f}s{result["peak_memory_mb"]:>12.2f}MB')
+
+    if args.save_baseline:
+        baseline: Dict[str, Any] = {}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH) as f:
+                baseline = json.load(f)
+
+        for size, size_results in results.items():
+            baseline.setdefault(size, {}).update(size_results)
+
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+        print(f'Saved the baseline to {BASELINE_PATH}')
+        return
+
+    if not os.path.exists(BASELINE_PATH):
+        print('No baseline to compare against. Save one with --save-baseline')
+        return
+
+    with open(BASELINE_PATH) as f:
+        regressions = get_regressions(results, json.load(f))
+
+    if len(regressions) > 0:
+        print(f'Regressions of more than {REGRESSION_THRESHOLD}x the baseline:')
+        for regression in regressions:
+            print(f'    {regression}')
+        sys.exit(1)
+
+    print('No regressions compared to the baseline')
+
+
+if __name__ == '__main__':
+    main()
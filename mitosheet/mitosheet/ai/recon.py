@@ -26,12 +26,66 @@ from mitosheet.types import (
     AITransformFrontendResult,
     ColumnHeader,
     ColumnID,
+    ColumnReconData,
     DataframeReconData,
     ModifiedDataframeReconData,
 )
 
 
+def is_same_column_data(old_column: pd.Series, new_column: pd.Series) -> bool:
+    """
+    Returns True if the two columns are backed by the same NumPy memory, with 
+    the same dtype, shape, and index. In this case, they are certainly equal, 
+    and we can skip comparing their values.
+
+    Columns that are not backed by NumPy arrays, e.g. Arrow backed columns, 
+    are only the same if they are the same array.
+    """
+    if old_column is new_column:
+        return True
+
+    old_values = old_column.array
+    new_values = new_column.array
+    if old_values is not new_values:
+        old_values = old_column.values
+        new_values = new_column.values
+        if not isinstance(old_values, np.ndarray) or not isinstance(new_values, np.ndarray):
+            return False
+        if (
+            old_values.dtype != new_values.dtype
+            or old_values.shape != new_values.shape
+            or old_values.strides != new_values.strides
+            or old_values.__array_interface__["data"][0] != new_values.__array_interface__["data"][0]
+        ):
+            return False
+
+    old_index = old_column.index
+    new_index = new_column.index
+    return old_index is new_index or (old_index.dtype == new_index.dtype and old_index.equals(new_index))
+
+
+def is_column_changed(old_column: pd.Series, new_column: pd.Series) -> bool:
+    """
+    Returns True if the values or the index of the column changed. We first check
+    if the columns share their memory, which is common as we only copy the columns 
+    a step modifies, and only then compare all the values.
+    """
+    if is_same_column_data(old_column, new_column):
+        return False
+    return not old_column.equals(new_column)
+
+
 def is_df_changed(old: pd.DataFrame, new: pd.DataFrame) -> bool:
+    # If every column still shares its memory with the old dataframe, nothing changed
+    if old is new or (
+        old.columns.equals(new.columns)
+        and all(
+            is_same_column_data(old_column, new_column)
+            for (_, old_column), (_, new_column) in zip(old.items(), new.items())
+        )
+    ):
+        return False
+
     try:
         assert_frame_equal(old, new, check_names=False)
         return False
@@ -286,7 +340,7 @@ def get_modified_dataframe_recon_data(
         old_column = old_df_head[old_ch]
         for new_ch in new_columns_without_shared:
             new_column = new_df_head[new_ch]
-            if old_column.equals(new_column) and new_ch not in renamed_columns.values():
+            if not is_column_changed(old_column, new_column) and new_ch not in renamed_columns.values():
                 renamed_columns[old_ch] = new_ch
 
     added_columns = [
@@ -308,7 +362,7 @@ def get_modified_dataframe_recon_data(
 
     if not rows_added_or_removed:
         modified_columns = [
-            ch for ch in shared_columns if not old_df[ch].equals(new_df[ch])
+            ch for ch in shared_columns if is_column_changed(old_df[ch], new_df[ch])
         ]
     else:
         # If rows were added or removed, then we don't want to detect every column as having changed
@@ -324,11 +378,11 @@ def get_modified_dataframe_recon_data(
                 df2 = new_df
 
             modified_columns = [
-                ch for ch in shared_columns if not df1[ch].equals(df2[ch])
+                ch for ch in shared_columns if is_column_changed(df1[ch], df2[ch])
             ]
         except IndexError:
             modified_columns = [
-                ch for ch in shared_columns if not old_df[ch].equals(new_df[ch])
+                ch for ch in shared_columns if is_column_changed(old_df[ch], new_df[ch])
             ]
 
     return {
@@ -360,53 +414,101 @@ def delete_column_id_from_state_metadata(
     return state
 
 
-def update_state_by_reconing_dataframes(
+def _check_no_duplicated_column_headers(new_df: pd.DataFrame) -> None:
+    c = Counter(new_df.columns)
+    most_common = c.most_common(1)
+    for ch, count in most_common:
+        if count > 1:
+            raise make_column_exists_error(ch)
+
+
+def is_column_recon_consistent(
+    old_df: pd.DataFrame, new_df: pd.DataFrame, column_recon: ColumnReconData
+) -> bool:
+    """
+    Returns True if applying the created, deleted, and renamed columns in the column_recon
+    to the columns of the old dataframe gives exactly the columns of the new dataframe.
+    """
+    renamed_columns = column_recon["renamed_columns"]
+    expected_columns = (
+        set(old_df.columns)
+        .difference(column_recon["deleted_columns"])
+        .difference(renamed_columns.keys())
+        .union(renamed_columns.values())
+        .union(column_recon["created_columns"])
+    )
+    return expected_columns == set(new_df.columns)
+
+
+def update_state_by_column_recon(
     state: State,
     sheet_index: int,
-    old_df: pd.DataFrame,
     new_df: pd.DataFrame,
+    column_recon: ColumnReconData,
     column_headers_to_column_ids: Optional[Dict[ColumnHeader, ColumnID]] = None,
-) -> Tuple[State, ModifiedDataframeReconData]:
+) -> State:
     """
-    This function is the work-horse for modified dataframes. It compares the old dataframe at the index
-    to the new dataframe, and then updates the state accordingly -- making sure all the metadata is correct.
+    Updates the state with the columns that were created, deleted, and renamed in the
+    dataframe at the sheet_index, and then sets the new dataframe.
 
-    This includes: handling deleted columns, added columns, renamed columns, and modified columns.
+    This is useful for callers who already know how the columns of the dataframe
+    changed, as it does not have to compare the old and the new dataframe.
     """
-    # Check there aren't any duplicated columns in the new dataframe
-    c = Counter(new_df.columns)
-    most_common = c.most_common(1)
-    for ch, count in most_common:
-        if count > 1:
-            raise make_column_exists_error(ch)
-
-    modified_dataframe_recon = get_modified_dataframe_recon_data(old_df, new_df)
+    _check_no_duplicated_column_headers(new_df)
 
     # Add new columns to the state
-    if len(modified_dataframe_recon["column_recon"]["created_columns"]) > 0:
+    if len(column_recon["created_columns"]) > 0:
         state.add_columns_to_state(
             sheet_index,
-            modified_dataframe_recon["column_recon"]["created_columns"],
+            column_recon["created_columns"],
             column_headers_to_column_ids=column_headers_to_column_ids,
         )
 
     # Delete removed columns from the state
     deleted_column_ids = state.column_ids.get_column_ids_by_headers(
-        sheet_index, modified_dataframe_recon["column_recon"]["deleted_columns"]
+        sheet_index, column_recon["deleted_columns"]
     )
     for column_id in deleted_column_ids:
         delete_column_id_from_state_metadata(state, sheet_index, column_id)
 
     # Rename renamed columns in the state
-    for old_ch, new_ch in modified_dataframe_recon["column_recon"][
-        "renamed_columns"
-    ].items():
+    for old_ch, new_ch in column_recon["renamed_columns"].items():
         column_id = state.column_ids.get_column_id_by_header(sheet_index, old_ch)
         state.column_ids.set_column_header(sheet_index, column_id, new_ch)
+    state.rename_columns_in_column_formulas(sheet_index, column_recon["renamed_columns"])
 
     # Then, actually set the dataframe
     state.dfs[sheet_index] = new_df
 
+    return state
+
+
+def update_state_by_reconing_dataframes(
+    state: State,
+    sheet_index: int,
+    old_df: pd.DataFrame,
+    new_df: pd.DataFrame,
+    column_headers_to_column_ids: Optional[Dict[ColumnHeader, ColumnID]] = None,
+) -> Tuple[State, ModifiedDataframeReconData]:
+    """
+    This function is the work-horse for modified dataframes. It compares the old dataframe at the index
+    to the new dataframe, and then updates the state accordingly -- making sure all the metadata is correct.
+
+    This includes: handling deleted columns, added columns, renamed columns, and modified columns.
+    """
+    # Check there aren't any duplicated columns in the new dataframe
+    _check_no_duplicated_column_headers(new_df)
+
+    modified_dataframe_recon = get_modified_dataframe_recon_data(old_df, new_df)
+
+    state = update_state_by_column_recon(
+        state,
+        sheet_index,
+        new_df,
+        modified_dataframe_recon["column_recon"],
+        column_headers_to_column_ids=column_headers_to_column_ids,
+    )
+
     return state, modified_dataframe_recon
 
 
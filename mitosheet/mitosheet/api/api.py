@@ -34,6 +34,7 @@ from mitosheet.api.get_parameterizable_params import get_parameterizable_params
 from mitosheet.api.get_params import get_params
 from mitosheet.api.get_path_contents import get_path_contents
 from mitosheet.api.get_path_join import get_path_join
+from mitosheet.api.get_performance_profile import get_performance_profile
 from mitosheet.api.get_pr_url_of_new_pr import get_pr_url_of_new_pr
 from mitosheet.api.get_render_count import get_render_count
 from mitosheet.api.get_search_matches import get_search_matches
@@ -245,6 +246,8 @@ def handle_api_event(
             result = get_pr_url_of_new_pr(params, steps_manager)
         elif event["type"] == "get_saved_analysis_code":
             result = get_saved_analysis_code(params, steps_manager)
+        elif event["type"] == "get_performance_profile":
+            result = get_performance_profile(params, steps_manager)
         # AUTOGENERATED LINE: API.PY CALL (DO NOT DELETE)
         else:
             raise Exception(f"Event: {event} is not a valid API call")
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+
+from typing import Any, Dict
+from mitosheet.performance_profile import get_chrome_trace, get_performance_profile_of_steps, performance_profiler
+from mitosheet.types import StepsManagerType
+
+
+def get_performance_profile(params: Dict[str, Any], steps_manager: StepsManagerType) -> Dict[str, Any]:
+    """
+    Returns how long each of the steps in the analysis took to execute, split up by 
+    saturating, copying the state, transpiling, executing and reconing, as well as 
+    how long it took to create the sheet data after the step.
+
+    If the include_chrome_trace param is True, also returns all of the timed spans
+    as a Chrome trace, which can be saved and opened in chrome://tracing.
+    """
+    # The initialize step has the same step id in every analysis, so we skip it
+    step_ids = [step.step_id for step in steps_manager.steps_including_skipped if step.step_type != 'initialize']
+    spans = performance_profiler.get_spans(step_ids=step_ids)
+
+    performance_profile: Dict[str, Any] = {
+        'steps': get_performance_profile_of_steps(spans)
+    }
+    if params.get('include_chrome_trace', False):
+        performance_profile['chromeTrace'] = get_chrome_trace(spans)
+
+    return performance_profile
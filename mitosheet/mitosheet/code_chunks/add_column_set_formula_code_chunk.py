@@ -13,6 +13,7 @@ from mitosheet.code_chunks.step_performers.column_steps.delete_column_code_chunk
 from mitosheet.code_chunks.step_performers.column_steps.rename_columns_code_chunk import RenameColumnsCodeChunk
 from mitosheet.parser import parse_formula
 from mitosheet.state import State
+from mitosheet.transpiler.optimize_formula_code import optimize_formula_code
 from mitosheet.transpiler.transpile_utils import \
     get_column_header_as_transpiled_code
 from mitosheet.types import ColumnHeader, ColumnID, FormulaAppliedToType
@@ -55,13 +56,15 @@ class AddColumnSetFormulaCodeChunk(CodeChunk):
         column_header_index = self.column_header_index
 
         if self.column_header_index == -1:
-            return [
-                f'{self.df_name}[{transpiled_column_header}] = {python_code}'
-            ], []
+            code = f'{self.df_name}[{transpiled_column_header}] = {python_code}'
+        else:
+            code = f'{self.df_name}.insert({column_header_index}, {transpiled_column_header}, {python_code})'
 
-        return [
-            f'{self.df_name}.insert({column_header_index}, {transpiled_column_header}, {python_code})'
-        ], []
+        if self.public_interface_version == 3:
+            from mitosheet.public.v3 import FUNCTIONS
+            return optimize_formula_code(code, FUNCTIONS.keys(), self.prev_state.df_names), []
+
+        return [code], []
 
     def get_edited_sheet_indexes(self) -> List[int]:
         return [self.sheet_index]
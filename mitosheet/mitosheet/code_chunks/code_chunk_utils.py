@@ -6,6 +6,7 @@
 
 
 from copy import copy
+from threading import Lock
 from typing import TYPE_CHECKING, List, Optional, Any, Type
 from mitosheet.code_chunks.code_chunk import CodeChunk
 from mitosheet.code_chunks.step_performers.column_steps.delete_column_code_chunk import DeleteColumnsCodeChunk
@@ -19,13 +20,56 @@ else:
     Step = Any
     
 
-def get_code_chunks(all_steps: List[Step], optimize: bool=True) -> List[CodeChunk]:
+class OptimizedCodeChunksCache:
+    """
+    Caches the last list of code chunks that was optimized, along with the
+    optimized code chunks.
+
+    Each edit transpiles the analysis a few times (e.g. for the code, for the
+    saved analysis, and for the parameterizable params), and as the code chunks
+    of each step are cached on the step, these all optimize the same list of 
+    code chunks. 
+    
+    NOTE: we cannot only optimize the code chunks of new steps on top of the 
+    previously optimized code chunks, as optimizing a list of code chunks can 
+    combine code chunks that later steps would have optimized out (e.g. a pivot 
+    that is later deleted), and so this does not give the same code.
+    """
+
+    def __init__(self) -> None:
+        self._code_chunks: List[CodeChunk] = []
+        self._optimized_code_chunks: List[CodeChunk] = []
+        # API calls are handled in a separate thread, so we lock the cache
+        self._lock = Lock()
+
+    def optimize(self, code_chunks: List[CodeChunk]) -> List[CodeChunk]:
+        with self._lock:
+            previous_code_chunks = self._code_chunks
+            previous_optimized_code_chunks = self._optimized_code_chunks
+
+        if len(code_chunks) == len(previous_code_chunks) and \
+            all(code_chunk is previous_code_chunk for code_chunk, previous_code_chunk in zip(code_chunks, previous_code_chunks)):
+            return list(previous_optimized_code_chunks)
+
+        optimized_code_chunks = optimize_code_chunks(code_chunks)
+
+        with self._lock:
+            self._code_chunks = code_chunks
+            self._optimized_code_chunks = optimized_code_chunks
+
+        return list(optimized_code_chunks)
+
+
+def get_code_chunks(all_steps: List[Step], optimize: bool=True, optimized_code_chunks_cache: Optional[OptimizedCodeChunksCache]=None) -> List[CodeChunk]:
     """
     A utility for taking all the steps in the steps manager, and returning a list
     of CodeChunks that correspond to these steps. 
 
     optimize is by default True, which results in these CodeChunks being optimized
     down to the smallest possible list of CodeChunks that implements the same ops.
+    If an optimized_code_chunks_cache is passed, and the code chunks are the same ones
+    it last optimized (i.e. the analysis has not changed), the cached optimized code
+    chunks are returned rather than optimizing them again.
     """
     from mitosheet.steps_manager import get_step_indexes_to_skip
     step_indexes_to_skip = get_step_indexes_to_skip(all_steps)
@@ -36,13 +80,11 @@ def get_code_chunks(all_steps: List[Step], optimize: bool=True) -> List[CodeChun
         if step.step_type == 'initialize' or step_index in step_indexes_to_skip:
             continue
 
-        all_code_chunks.extend(step.step_performer.transpile(
-            step.prev_state, # type: ignore
-            step.params,
-            step.execution_data,
-        ))
+        all_code_chunks.extend(step.get_code_chunks())
 
-    if optimize:
+    if optimize and optimized_code_chunks_cache is not None:
+        code_chunks_list = optimized_code_chunks_cache.optimize(all_code_chunks)
+    elif optimize:
         code_chunks_list = optimize_code_chunks(all_code_chunks)
     else:
         code_chunks_list = all_code_chunks
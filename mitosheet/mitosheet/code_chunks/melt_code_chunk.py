@@ -47,7 +47,7 @@ class MeltCodeChunk(CodeChunk):
         return code, []
     
     def get_created_sheet_indexes(self) -> List[int]:
-        return [len(self.prev_state.dfs)]
+        return [self.prev_state.num_sheets]
     
     def get_source_sheet_indexes(self) -> List[int]:
         return [self.sheet_index]
@@ -27,7 +27,7 @@ class OneHotEncodingCodeChunk(CodeChunk):
         
     def get_code(self) -> Tuple[List[str], List[str]]:
         df_name = self.prev_state.df_names[self.sheet_index]
-        column_index = self.prev_state.dfs[self.sheet_index].columns.tolist().index(self.column_header)
+        column_index = self.prev_state.get_df_header(self.sheet_index).columns.tolist().index(self.column_header)
 
         transpiled_column_header = get_column_header_as_transpiled_code(self.column_header)
 
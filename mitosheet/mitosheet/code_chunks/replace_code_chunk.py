@@ -32,7 +32,6 @@ class ReplaceCodeChunk(CodeChunk):
         self.column_ids = column_ids
         self.search_value = search_value
         self.replace_value = replace_value
-        self.df = self.prev_state.dfs[self.sheet_index]
         self.df_name = self.prev_state.df_names[self.sheet_index]
 
     def get_display_name(self) -> str:
@@ -48,15 +47,17 @@ class ReplaceCodeChunk(CodeChunk):
         df_name = self.df_name
         df_name_with_selected_columns = self.df_name
         sheet_index = self.sheet_index
-        df = self.df
+        # NOTE: we only read the header of the dataframe, so we don't load it if it was evicted from the step history
+        df_header = self.prev_state.get_df_header(sheet_index)
+        dtypes = df_header.dtypes
         column_headers: Any = []
 
         if (column_ids is not None and len(column_ids) > 0):
             column_headers = self.prev_state.column_ids.get_column_headers_by_ids(sheet_index, column_ids)
             df_name_with_selected_columns = f'{self.df_name}[{get_column_header_list_as_transpiled_code(column_headers)}]'
-            df = self.df[column_headers]
+            dtypes = df_header.dtypes.iloc[[df_header.columns.get_loc(column_header) for column_header in column_headers]]
         else:
-            column_headers = df.columns.to_list()
+            column_headers = df_header.columns.to_list()
 
         # The shorter code chunk is for dataframes that *don't* have any boolean columns
         # Boolean columns are a special case, because when we convert them to str then back
@@ -66,13 +67,13 @@ class ReplaceCodeChunk(CodeChunk):
             f'{df_name_with_selected_columns} = {df_name_with_selected_columns}.astype(str).replace("(?i){search_value}", "{replace_value}", regex=True).astype({df_name_with_selected_columns}.dtypes.to_dict())',
         ]
 
-        if (any(df.dtypes == 'timedelta') and Version(pd.__version__) < Version("1.4")):
+        if (any(dtypes == 'timedelta') and Version(pd.__version__) < Version("1.4")):
             raise MitoError(
                 'version_error',
                 'Pandas version error',
                 'This version of pandas doesn\'t support replacing values in timedelta columns. Please upgrade to pandas 1.2 or later.',
             )
-        if any(df.dtypes == bool):
+        if any(dtypes == bool):
             code_chunk = [
                 f"non_bool_cols, bool_cols = {df_name_with_selected_columns}.select_dtypes(exclude='bool'), {df_name_with_selected_columns}.select_dtypes(include='bool')",
                 f"{df_name}[non_bool_cols.columns] = non_bool_cols.astype(str).replace('(?i){search_value}', '{replace_value}', regex=True).astype(non_bool_cols.dtypes.to_dict())",
@@ -81,7 +81,7 @@ class SnowflakeImportCodeChunk(CodeChunk):
         return all_code, imports
 
     def get_created_sheet_indexes(self) -> List[int]:
-        return [i for i in range(len(self.prev_state.dfs), len(self.prev_state.dfs) + len(self.new_df_names))]
+        return [i for i in range(self.prev_state.num_sheets, self.prev_state.num_sheets + len(self.new_df_names))]
 
     def _combine_right_with_snowflake_import_code_chunk(self, other_code_chunk: "SnowflakeImportCodeChunk") -> Optional["SnowflakeImportCodeChunk"]:
         if not self.params_match(other_code_chunk, ['connection_params_dict']):
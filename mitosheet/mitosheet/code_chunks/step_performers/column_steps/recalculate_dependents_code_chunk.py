@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+from typing import List, Tuple
+
+from mitosheet.code_chunks.code_chunk import CodeChunk
+from mitosheet.code_chunks.step_performers.column_steps.set_column_formula_code_chunk import \
+    SetColumnFormulaCodeChunk
+from mitosheet.state import State
+from mitosheet.types import ColumnID
+
+
+class RecalculateDependentsCodeChunk(CodeChunk):
+
+    def __init__(self, prev_state: State, sheet_index: int, column_id: ColumnID, set_column_formula_code_chunks: List[SetColumnFormulaCodeChunk]):
+        super().__init__(prev_state)
+        self.sheet_index = sheet_index
+        self.column_id = column_id
+        self.set_column_formula_code_chunks = set_column_formula_code_chunks
+
+        self.column_header = self.prev_state.column_ids.get_column_header_by_id(self.sheet_index, self.column_id)
+
+    def get_display_name(self) -> str:
+        return 'Recalculated dependents'
+
+    def get_description_comment(self) -> str:
+        return f'Recalculated the formulas that depend on {self.column_header}'
+
+    def get_code(self) -> Tuple[List[str], List[str]]:
+        code: List[str] = []
+        for set_column_formula_code_chunk in self.set_column_formula_code_chunks:
+            set_column_formula_code, _ = set_column_formula_code_chunk.get_code()
+            code.extend(set_column_formula_code)
+
+        return code, []
+
+    def get_edited_sheet_indexes(self) -> List[int]:
+        return [self.sheet_index]
@@ -34,7 +34,7 @@ class ReorderColumnCodeChunk(CodeChunk):
 
         transpiled_column_header = get_column_header_as_transpiled_code(self.column_header)
 
-        new_column_index = get_valid_index(self.prev_state.dfs, self.sheet_index, self.new_column_index)
+        new_column_index = get_valid_index(self.prev_state, self.sheet_index, self.new_column_index)
 
         # Get columns in df
         columns_list_line = f'{self.df_name}_columns = [col for col in {self.df_name}.columns if col != {transpiled_column_header}]'
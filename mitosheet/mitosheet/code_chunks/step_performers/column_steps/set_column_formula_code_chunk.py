@@ -16,6 +16,7 @@ from mitosheet.parser import parse_formula
 from mitosheet.state import State
 from mitosheet.types import (FORMULA_ENTIRE_COLUMN_TYPE, ColumnID,
                              FormulaAppliedToType)
+from mitosheet.transpiler.optimize_formula_code import optimize_formula_code
 from mitosheet.transpiler.transpile_utils import get_column_header_list_as_transpiled_code
 
 
@@ -53,6 +54,10 @@ class SetColumnFormulaCodeChunk(CodeChunk):
             self.sheet_index,
         )
 
+        if self.public_interface_version == 3:
+            from mitosheet.public.v3 import FUNCTIONS
+            return optimize_formula_code(python_code, FUNCTIONS.keys(), self.prev_state.df_names), []
+
         return [
             python_code
         ], []
@@ -37,7 +37,7 @@ class ConcatCodeChunk(CodeChunk):
             ], ['import pandas as pd']
 
     def get_created_sheet_indexes(self) -> List[int]:
-        return [len(self.prev_state.dfs)]
+        return [self.prev_state.num_sheets]
     
     def get_source_sheet_indexes(self) -> List[int]:
         return [sheet_index for sheet_index in self.sheet_indexes]
\ No newline at end of file
@@ -29,7 +29,7 @@ class DataframeDuplicateCodeChunk(CodeChunk):
         return [f'{self.new_df_name} = {self.old_df_name}.copy(deep=True)'], []
 
     def get_created_sheet_indexes(self) -> List[int]:
-        return [len(self.prev_state.dfs)]
+        return [self.prev_state.num_sheets]
     
     def get_source_sheet_indexes(self) -> List[int]:
         return [self.sheet_index]
\ No newline at end of file
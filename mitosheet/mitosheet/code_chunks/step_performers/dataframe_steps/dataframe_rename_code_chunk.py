@@ -54,7 +54,7 @@ class DataframeRenameCodeChunk(CodeChunk):
     def _combine_left_with_pivot_code_chunk(self, pivot_code_chunk: PivotCodeChunk) -> Optional[CodeChunk]:
         destination_sheet_index = pivot_code_chunk.destination_sheet_index
         if destination_sheet_index is None:
-            destination_sheet_index = len(pivot_code_chunk.prev_state.dfs)
+            destination_sheet_index = pivot_code_chunk.prev_state.num_sheets
 
         if destination_sheet_index != self.sheet_index:
             return None
@@ -73,7 +73,7 @@ class DataframeRenameCodeChunk(CodeChunk):
         )
 
     def _combine_left_with_merge_code_chunk(self, merge_code_chunk: MergeCodeChunk) -> Optional[CodeChunk]:
-        destination_sheet_index = len(merge_code_chunk.prev_state.dfs)
+        destination_sheet_index = merge_code_chunk.prev_state.num_sheets
         if destination_sheet_index != self.sheet_index:
             return None
 
@@ -101,7 +101,7 @@ class DataframeRenameCodeChunk(CodeChunk):
         new_import_chunk = deepcopy(import_code_chunk)
         
         # Update the new_df_names in these code chunks
-        index_to_update = self.sheet_index - len(new_import_chunk.prev_state.dfs) 
+        index_to_update = self.sheet_index - new_import_chunk.prev_state.num_sheets 
         new_import_chunk.new_df_names[index_to_update] = self.new_dataframe_name
 
 
@@ -111,7 +111,7 @@ class DataframeRenameCodeChunk(CodeChunk):
         self, 
         dataframe_duplicate_code_chunk: DataframeDuplicateCodeChunk
     ) -> Optional[CodeChunk]:
-        if self.sheet_index != len(dataframe_duplicate_code_chunk.prev_state.dfs):
+        if self.sheet_index != dataframe_duplicate_code_chunk.prev_state.num_sheets:
             return None
         
         return DataframeDuplicateCodeChunk(
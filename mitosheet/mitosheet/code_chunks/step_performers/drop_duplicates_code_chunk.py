@@ -40,7 +40,7 @@ class DropDuplicatesCodeChunk(CodeChunk):
         
         # We leave subset and keep empty if they are not used
         param_string = ''
-        if len(column_headers) != len(self.prev_state.dfs[self.sheet_index].keys()):
+        if len(column_headers) != len(self.prev_state.get_df_header(self.sheet_index).columns):
             param_string += 'subset=' + get_column_header_list_as_transpiled_code(column_headers) + ', '
         
         param_string += 'keep=' + get_column_header_as_transpiled_code(self.keep) # not a column header, but we can use the same utility
@@ -352,7 +352,7 @@ def get_entire_filter_string(state: State, sheet_index: int, operator: OperatorT
             column_header = state.column_ids.get_column_header_by_id(
                 sheet_index, column_id
             )
-            column_dtype = str(state.dfs[sheet_index][column_header].dtype)
+            column_dtype = str(state.get_df_header(sheet_index).get_column_dtype(column_header))
         else:
             # If this filter string is for no particular column header, we use a fake column header, 
             # which allows us to change the resulting filter string to filter things other than
@@ -58,7 +58,7 @@ class ExcelImportCodeChunk(CodeChunk):
         ] + df_definitions, ['import pandas as pd']
 
     def get_created_sheet_indexes(self) -> List[int]:
-        return [i for i in range(len(self.prev_state.dfs), len(self.prev_state.dfs) + len(self.sheet_names))]
+        return [i for i in range(self.prev_state.num_sheets, self.prev_state.num_sheets + len(self.sheet_names))]
     
     def get_parameterizable_params(self) -> List[Tuple[ParamValue, ParamType, ParamSubtype]]:
         return [(f'r{get_column_header_as_transpiled_code(self.file_name)}', 'import', 'file_name_import_excel')]
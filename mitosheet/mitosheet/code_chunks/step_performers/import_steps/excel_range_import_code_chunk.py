@@ -188,7 +188,7 @@ class ExcelRangeImportCodeChunk(CodeChunk):
         return code, ['import pandas as pd']
 
     def get_created_sheet_indexes(self) -> Optional[List[int]]:
-        return [i for i in range(len(self.prev_state.dfs), len(self.prev_state.dfs) + len(self.new_df_names))]
+        return [i for i in range(self.prev_state.num_sheets, self.prev_state.num_sheets + len(self.new_df_names))]
 
     def _combine_right_with_excel_range_import_code_chunk(self, excel_range_import_code_chunk: "ExcelRangeImportCodeChunk") -> Optional[CodeChunk]:
         if excel_range_import_code_chunk.file_path == self.file_path and excel_range_import_code_chunk.sheet == self.sheet:
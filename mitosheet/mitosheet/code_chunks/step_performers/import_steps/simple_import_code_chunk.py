@@ -107,7 +107,7 @@ class SimpleImportCodeChunk(CodeChunk):
         return code, ['import pandas as pd']
 
     def get_created_sheet_indexes(self) -> List[int]:
-        return [i for i in range(len(self.prev_state.dfs), len(self.prev_state.dfs) + len(self.new_df_names))]
+        return [i for i in range(self.prev_state.num_sheets, self.prev_state.num_sheets + len(self.new_df_names))]
 
     def _combine_right_simple_import(self, other_code_chunk: "SimpleImportCodeChunk") -> Optional["CodeChunk"]:
         # We can easily combine simple imports, so we do so
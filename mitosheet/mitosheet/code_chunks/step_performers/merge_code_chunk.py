@@ -159,8 +159,8 @@ class MergeCodeChunk(CodeChunk):
             how_to_use = self.how
 
         # If we are only taking some columns, write the code to drop the ones we don't need!
-        deleted_columns_one = set(self.prev_state.dfs[self.sheet_index_one].keys()).difference(set(selected_column_headers_one).union(set(merge_keys_one)))
-        deleted_columns_two = set(self.prev_state.dfs[self.sheet_index_two].keys()).difference(set(selected_column_headers_two).union(set(merge_keys_two)))
+        deleted_columns_one = set(self.prev_state.get_df_header(self.sheet_index_one).columns).difference(set(selected_column_headers_one).union(set(merge_keys_one)))
+        deleted_columns_two = set(self.prev_state.get_df_header(self.sheet_index_two).columns).difference(set(selected_column_headers_two).union(set(merge_keys_two)))
 
         if len(deleted_columns_one) > 0:
             deleted_transpiled_column_header_one_list = get_column_header_list_as_transpiled_code(deleted_columns_one)
@@ -201,7 +201,7 @@ class MergeCodeChunk(CodeChunk):
         return merge_code, []
 
     def get_created_sheet_indexes(self) -> List[int]:
-        return [len(self.prev_state.dfs)]
+        return [self.prev_state.num_sheets]
     
     def get_source_sheet_indexes(self) -> List[int]:
         return [self.sheet_index_one, self.sheet_index_two]
@@ -157,7 +157,7 @@ class PivotCodeChunk(CodeChunk):
         pivot_filters: List[ColumnHeaderWithFilter] = [
             {
                 'column_header': self.prev_state.column_ids.get_column_header_by_id(self.sheet_index, pf['column_id']), 
-                'column_dtype': str(self.prev_state.dfs[self.sheet_index][pf['column_id']].dtype),
+                'column_dtype': str(self.prev_state.get_df_header(self.sheet_index).get_column_dtype(pf['column_id'])),
                 'filter': pf['filter']
             }
             for pf in self.pivot_filters_ids
@@ -283,7 +283,7 @@ class PivotCodeChunk(CodeChunk):
 
     def get_created_sheet_indexes(self) -> Optional[List[int]]:
         if self.destination_sheet_index is None:
-            return [len(self.prev_state.dfs)]
+            return [self.prev_state.num_sheets]
         else:
             # Note: editing a dataframe does not create a sheet index, it 
             # overwrites it instead. See get_edited_sheet_indexes below
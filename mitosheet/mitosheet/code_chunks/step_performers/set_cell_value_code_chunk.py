@@ -32,7 +32,7 @@ class SetCellValueCodeChunk(CodeChunk):
 
         self.df_name = self.prev_state.df_names[self.sheet_index]
         self.column_header = self.prev_state.column_ids.get_column_header_by_id(self.sheet_index, self.column_id)
-        self.column_dtype = str(self.prev_state.dfs[self.sheet_index][self.column_header].dtype)
+        self.column_dtype = str(self.prev_state.get_df_header(self.sheet_index).get_column_dtype(self.column_header))
 
     def get_display_name(self) -> str:
         return 'Set cell value'
@@ -28,7 +28,7 @@ class TransposeCodeChunk(CodeChunk):
         return [f'{self.new_df_name} = {self.df_name}.T'], []
 
     def get_created_sheet_indexes(self) -> List[int]:
-        return [len(self.prev_state.dfs)]
+        return [self.prev_state.num_sheets]
     
     def get_source_sheet_indexes(self) -> List[int]:
         return [self.sheet_index]
@@ -33,4 +33,4 @@ class UserDefinedImportCodeChunk(CodeChunk):
         return [code], []
     
     def get_created_sheet_indexes(self) -> Optional[List[int]]:
-        return [i for i in range(len(self.prev_state.dfs), len(self.prev_state.dfs) + len(self.df_names))]
\ No newline at end of file
+        return [i for i in range(self.prev_state.num_sheets, self.prev_state.num_sheets + len(self.df_names))]
\ No newline at end of file
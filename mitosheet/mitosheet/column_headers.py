@@ -111,6 +111,35 @@ class ColumnIDMap():
                 self.column_id_to_column_header[sheet_index][column_id] = column_header
                 self.column_header_to_column_id[sheet_index][column_header] = column_id
 
+    def copy(self, sheet_indexes_to_copy: Collection[int]) -> "ColumnIDMap":
+        """
+        Returns a copy of this map that only copies the mappings for the
+        sheets in sheet_indexes_to_copy. The mappings for all other sheets
+        are shared with this map, and so must not be mutated in place.
+
+        NOTE: replacing or removing an entire sheet (as add_df and remove_df
+        do) is always safe, as the outer lists are never shared.
+        """
+        new_column_id_map = ColumnIDMap([])
+        new_column_id_map.column_id_to_column_header = [
+            dict(column_id_to_column_header) if sheet_index in sheet_indexes_to_copy else column_id_to_column_header
+            for sheet_index, column_id_to_column_header in enumerate(self.column_id_to_column_header)
+        ]
+        new_column_id_map.column_header_to_column_id = [
+            dict(column_header_to_column_id) if sheet_index in sheet_indexes_to_copy else column_header_to_column_id
+            for sheet_index, column_header_to_column_id in enumerate(self.column_header_to_column_id)
+        ]
+        return new_column_id_map
+
+    def set_sheet_from_column_id_map(self, other_column_id_map: "ColumnIDMap", sheet_index: int) -> None:
+        """
+        Replaces the mappings for the sheet at sheet_index with the mappings
+        for that same sheet in other_column_id_map. The mappings are shared,
+        not copied.
+        """
+        self.column_id_to_column_header[sheet_index] = other_column_id_map.column_id_to_column_header[sheet_index]
+        self.column_header_to_column_id[sheet_index] = other_column_id_map.column_header_to_column_id[sheet_index]
+
     def set_column_header(self, sheet_index: int, column_id: ColumnID, column_header: ColumnHeader) -> None:
         """
         Sets a column id and column header to match to eachother. 
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains functions for building the graph of which columns in a sheet the column
+formulas reference, so that when a column changes, we can recalculate just the
+formulas that depend on it, in an order where each formula is recalculated after
+all the formulas it depends on.
+"""
+from typing import Any, Dict, List, Optional, Set
+
+import pandas as pd
+
+from mitosheet.column_headers import get_column_header_display
+from mitosheet.errors import make_circular_reference_error
+from mitosheet.state import State
+from mitosheet.types import ColumnID, FrontendFormula
+
+
+def get_formula_column_references(frontend_formula: FrontendFormula, column_ids: List[ColumnID], display_column_header_to_column_id: Dict[str, ColumnID]) -> Set[ColumnID]:
+    """
+    Returns the column ids of the columns in the sheet that the formula references, where 
+    a range of columns, like A:C, references all of the columns between A and C. 
+
+    Columns in other sheets, which are always referenced as {SHEET}!{HEADER}:{HEADER},
+    are not included, and neither are column headers that are no longer in the sheet.
+    """
+    references: Set[ColumnID] = set()
+    part_index = 0
+    while part_index < len(frontend_formula):
+        formula_part = frontend_formula[part_index]
+
+        if formula_part['type'] == '{SHEET}':
+            # Skip the !, and the range of columns in the other sheet
+            part_index += 5
+            continue
+
+        if formula_part['type'] == 'string part':
+            part_index += 1
+            continue
+        
+        column_id = display_column_header_to_column_id.get(formula_part['display_column_header'])
+        next_parts = frontend_formula[part_index + 1:part_index + 3]
+        is_range = len(next_parts) == 2 and next_parts[0] == {'type': 'string part', 'string': ':'} and next_parts[1]['type'] != 'string part'
+
+        if is_range:
+            other_column_id = display_column_header_to_column_id.get(next_parts[1]['display_column_header']) # type: ignore
+            if column_id is not None and other_column_id is not None:
+                start, end = sorted([column_ids.index(column_id), column_ids.index(other_column_id)])
+                references.update(column_ids[start:end + 1])
+            part_index += 3
+            continue
+
+        if column_id is not None:
+            references.add(column_id)
+        part_index += 1
+
+    return references
+
+
+def get_formula_dependency_graph(state: State, sheet_index: int) -> Dict[ColumnID, Set[ColumnID]]:
+    """
+    Returns a map from each column in the sheet with a formula to the columns in the
+    sheet that its formulas reference.
+    """
+    column_ids = state.column_ids.get_column_ids(sheet_index)
+    display_column_header_to_column_id = {
+        get_column_header_display(column_header): column_id
+        for column_header, column_id in zip(state.dfs[sheet_index].columns, column_ids)
+    }
+
+    column_ids_in_sheet = set(column_ids)
+
+    graph: Dict[ColumnID, Set[ColumnID]] = {}
+    for column_id, formulas in state.column_formulas[sheet_index].items():
+        if len(formulas) == 0 or column_id not in column_ids_in_sheet:
+            continue
+
+        graph[column_id] = set()
+        for formula in formulas:
+            graph[column_id].update(get_formula_column_references(formula['frontend_formula'], column_ids, display_column_header_to_column_id))
+
+    return graph
+
+
+def get_dependents_in_topological_order(graph: Dict[ColumnID, Set[ColumnID]], column_id: ColumnID) -> List[ColumnID]:
+    """
+    Returns all the columns whose formulas depend on the column, directly or through
+    other formulas, ordered so that each column comes after the columns it depends on.
+
+    Throws a circular reference error if the dependents reference each other in a loop,
+    including a formula that references its own column.
+    """
+    dependents_of: Dict[ColumnID, Set[ColumnID]] = {}
+    for dependent_column_id, references in graph.items():
+        for reference in references:
+            dependents_of.setdefault(reference, set()).add(dependent_column_id)
+
+    # First, find all of the transitive dependents of the column
+    dependents: Set[ColumnID] = set()
+    to_visit = [column_id]
+    while len(to_visit) > 0:
+        for dependent_column_id in dependents_of.get(to_visit.pop(), set()):
+            if dependent_column_id not in dependents:
+                dependents.add(dependent_column_id)
+                to_visit.append(dependent_column_id)
+
+    # Then, order them so each comes after the dependents it references. We sort the
+    # columns that are ready at the same time so the order does not depend on the hash
+    num_references_left = {
+        dependent_column_id: len(graph[dependent_column_id] & dependents)
+        for dependent_column_id in dependents
+    }
+    ready = sorted(dependent_column_id for dependent_column_id, num_references in num_references_left.items() if num_references == 0)
+    ordered_dependents: List[ColumnID] = []
+    while len(ready) > 0:
+        dependent_column_id = ready.pop(0)
+        ordered_dependents.append(dependent_column_id)
+        for next_dependent_column_id in sorted(dependents_of.get(dependent_column_id, set()) & dependents):
+            num_references_left[next_dependent_column_id] -= 1
+            if num_references_left[next_dependent_column_id] == 0:
+                ready.append(next_dependent_column_id)
+
+    if len(ordered_dependents) != len(dependents):
+        raise make_circular_reference_error()
+
+    return ordered_dependents
+
+
+def get_formula_label_for_recalculation(index: pd.Index, frontend_formula: FrontendFormula) -> Optional[Any]:
+    """
+    Formulas are written in a specific row, and reference other rows relative to that
+    row. To write the formula out again, we pick the first row where every row that the
+    formula references exists. Returns None if there is no such row.
+    """
+    row_offsets = [
+        formula_part['row_offset'] or 0 for formula_part in frontend_formula
+        if formula_part['type'] == '{HEADER}{INDEX}'
+    ]
+    # A positive row offset references an earlier row
+    position = max([0] + row_offsets)
+    if position >= len(index) or position - min([0] + row_offsets) >= len(index):
+        return None
+    return index[position]
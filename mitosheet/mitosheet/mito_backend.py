@@ -60,10 +60,14 @@ class MitoBackend():
             default_editing_mode: Optional[DefaultEditingMode]=None,
             theme: Optional[MitoTheme]=None,
             input_cell_execution_count: Optional[int]=None,
+            step_history_memory_budget: Optional[int]=None,
         ):
         """
         Takes a list of dataframes and strings that are paths to CSV files
         passed through *args.
+
+        If a step_history_memory_budget (in bytes) is passed, the old versions of the 
+        dataframes in the step history are evicted from memory to stay within it.
         """
         # Call the DOMWidget constructor to set up the widget properly
         super(MitoBackend, self).__init__()
@@ -109,7 +113,8 @@ class MitoBackend():
             column_definitions=column_definitions,
             theme=theme,
             default_editing_mode=default_editing_mode,
-            input_cell_execution_count=input_cell_execution_count
+            input_cell_execution_count=input_cell_execution_count,
+            step_history_memory_budget=step_history_memory_budget
         )
 
         # And the api
@@ -138,13 +143,23 @@ class MitoBackend():
     def analysis_name(self):
         return self.steps_manager.analysis_name
 
-    def get_shared_state_variables(self) -> Dict[str, Any]:
+    def get_shared_state_variables(self, frontend_sheet_data_version: Optional[int]=None) -> Dict[str, Any]:
         """
         Helper function for updating all the variables that are shared
         between the backend and the frontend through trailets.
+
+        If the frontend tells us the version of the sheet data it has, and it is
+        the same as the version we last sent, then we just send a patch to the 
+        sheet data, rather than all of it.
         """
+        if frontend_sheet_data_version is not None and frontend_sheet_data_version == self.steps_manager.sheet_data_version:
+            sheet_data_variables = {'sheet_data_patch_json': self.steps_manager.sheet_data_patch_json}
+        else:
+            sheet_data_variables = {'sheet_data_json': self.steps_manager.sheet_data_json}
+
         return {
-            'sheet_data_json': self.steps_manager.sheet_data_json,
+            **sheet_data_variables,
+            'sheet_data_version': self.steps_manager.sheet_data_version,
             'analysis_data_json': self.steps_manager.analysis_data_json,
             'user_profile_json': self.get_user_profile_json()
         }
@@ -183,7 +198,7 @@ class MitoBackend():
         self.steps_manager.handle_edit_event(event)
 
         # Also, write the analysis to a file!
-        write_save_analysis_file(self.steps_manager)
+        write_save_analysis_file(self.steps_manager, in_background=True)
 
         # Tell the front-end to render the new sheet and new code with an empty
         # response. NOTE: in the future, we can actually send back some data
@@ -191,7 +206,7 @@ class MitoBackend():
         self.mito_send({
             'event': 'response',
             'id': event['id'],
-            'shared_variables': self.get_shared_state_variables()
+            'shared_variables': self.get_shared_state_variables(event.get('sheet_data_version'))
         })
 
 
@@ -222,14 +237,14 @@ class MitoBackend():
                 raise make_execution_error(error_modal=False)
             raise
         # Also, write the analysis to a file!
-        write_save_analysis_file(self.steps_manager)
+        write_save_analysis_file(self.steps_manager, in_background=True)
 
         # Tell the front-end to render the new sheet and new code with an empty
         # response. 
         self.mito_send({
             'event': 'response',
             'id': event['id'],
-            'shared_variables': self.get_shared_state_variables()
+            'shared_variables': self.get_shared_state_variables(event.get('sheet_data_version'))
         })
 
     def receive_message(self, content: Dict[str, Any]) -> bool:
@@ -321,6 +336,7 @@ def get_mito_backend(
         user_defined_editors: Optional[List[Callable]]=None,
         column_definitions: Optional[List[ColumnDefinitions]]=None,
         input_cell_execution_count: Optional[int]=None,
+        step_history_memory_budget: Optional[int]=None,
     ) -> MitoBackend:
 
     # We pass in the dataframes directly to the widget
@@ -331,7 +347,8 @@ def get_mito_backend(
         user_defined_importers=user_defined_importers,
         user_defined_editors=user_defined_editors,
         column_definitions=column_definitions,
-        input_cell_execution_count=input_cell_execution_count
+        input_cell_execution_count=input_cell_execution_count,
+        step_history_memory_budget=step_history_memory_budget
     ) 
 
     return mito_backend
@@ -392,7 +409,8 @@ def sheet(
         sheet_functions: Optional[List[Callable]]=None,
         importers: Optional[List[Callable]]=None,
         editors: Optional[List[Callable]]=None,
-        input_cell_execution_count: Optional[int]=None # If the sheet is a dataframe mime renderer, we pass the cell_id so we know where to generate the code. 
+        input_cell_execution_count: Optional[int]=None, # If the sheet is a dataframe mime renderer, we pass the cell_id so we know where to generate the code. 
+        step_history_memory_budget: Optional[int]=None # The most bytes the old versions of the dataframes in the step history can use
     ) -> None:
     """
     Renders a Mito sheet. If no arguments are passed, renders an empty sheet. Otherwise, renders
@@ -454,7 +472,8 @@ def sheet(
             user_defined_functions=sheet_functions,
             user_defined_importers=importers,
             user_defined_editors=editors,
-            input_cell_execution_count=input_cell_execution_count
+            input_cell_execution_count=input_cell_execution_count,
+            step_history_memory_budget=step_history_memory_budget
         )
 
         # Setup the comm target on this
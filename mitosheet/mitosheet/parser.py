@@ -9,15 +9,20 @@ as well as the original dataframe, and returns the current state
 of the sheet as a dataframe
 """
 import datetime
+from collections import OrderedDict
+from functools import lru_cache
 from packaging.version import Version
 import re
+import threading
 import warnings
-from typing import Any, List, Optional, Set, Tuple, Union
+import weakref
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 
 from mitosheet.column_headers import get_column_header_display
 from mitosheet.errors import make_invalid_formula_error
+from mitosheet.step_history_memory import DataframeHeader, LazyDataframes, get_dataframe_header
 from mitosheet.is_type_utils import (is_datetime_dtype,
                                                    is_number_dtype,
                                                    is_string_dtype)
@@ -215,6 +220,10 @@ def safe_count_function(formula: str, substring: str) -> int:
     return count
 
 
+# The functions that can reference columns in other sheets
+CROSS_SHEET_LOOKUP_FUNCTIONS = ['VLOOKUP', 'XLOOKUP', 'MATCH', 'INDEX']
+
+
 def check_common_errors(
         formula: str,
         dfs: List[pd.DataFrame],
@@ -239,10 +248,11 @@ def check_common_errors(
         )
 
     for sheet_name in df_names:
-        if safe_contains(formula, f'{sheet_name}!', column_headers) and not safe_contains_function(formula, 'VLOOKUP', column_headers):
+        if safe_contains(formula, f'{sheet_name}!', column_headers) and \
+            not any(safe_contains_function(formula, function, column_headers) for function in CROSS_SHEET_LOOKUP_FUNCTIONS):
             raise make_invalid_formula_error(
                 formula,
-                f'Cross-sheet references are only allowed in calls to VLOOKUP',
+                f'Cross-sheet references are only allowed in calls to VLOOKUP, XLOOKUP, MATCH, and INDEX',
                 error_modal=False
             )
 
@@ -257,14 +267,13 @@ def check_common_errors(
             error_modal=False
         )     
 
-    # TODO: update this with vlookup formula in mind
-    # If the user used a lookup formula, point them to merge instead!
-    LOOKUP_FORMULAS = ['HLOOKUP', 'XLOOKUP']
+    # If the user used a lookup formula we don't support, point them to the ones we do!
+    LOOKUP_FORMULAS = ['HLOOKUP']
     for lookup_formula in LOOKUP_FORMULAS:
         if safe_contains_function(formula.upper(), lookup_formula, column_headers):
             raise make_invalid_formula_error(
                 formula,
-                f'{lookup_formula} is not supported, but VLOOKUP is. See the documentation for more information.',
+                f'{lookup_formula} is not supported, but VLOOKUP and XLOOKUP are. See the documentation for more information.',
                 error_modal=False
             )
 
@@ -419,6 +428,68 @@ def get_index_match_from_string_index(formula: str, formula_label: Union[str, bo
     return None
 
 
+# The most column header tries we keep around. Each sheet that formulas are written in
+# has its own trie, which is rebuilt only when its column headers change
+MAX_COLUMN_HEADER_TRIE_CACHE_SIZE = 64
+
+# The key in a trie node that holds the positions of the column headers that end at that node
+_TRIE_END = ''
+
+
+@lru_cache(maxsize=MAX_COLUMN_HEADER_TRIE_CACHE_SIZE)
+def _get_column_header_trie(column_header_displays: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Returns a trie of the displayed column headers, where each node maps a character to 
+    the next node, and _TRIE_END to the positions of the column headers that end there.
+
+    NOTE: the returned trie is shared between calls, so it must not be changed.
+    """
+    root: Dict[str, Any] = {}
+    for column_header_position, column_header_display in enumerate(column_header_displays):
+        node = root
+        for char in column_header_display:
+            node = node.setdefault(char, {})
+        node.setdefault(_TRIE_END, []).append(column_header_position)
+    return root
+
+
+def get_column_header_occurrences(formula: str, column_headers: List[ColumnHeader]) -> List[List[ParserMatchSubstringRange]]:
+    """
+    Returns the ranges of the formula where each column header is displayed, in the same 
+    order as the passed column headers. 
+
+    We find all of the column headers in a single pass over the formula, by walking a trie
+    of the column headers from each character of the formula. This means the time it takes
+    does not grow with the number of column headers, which matters for wide sheets.
+
+    Like re.finditer, the ranges for a single column header do not overlap each other.
+    """
+    column_header_displays = tuple(get_column_header_display(column_header) for column_header in column_headers)
+    trie = _get_column_header_trie(column_header_displays)
+
+    occurrences: List[List[ParserMatchSubstringRange]] = [[] for _ in column_headers]
+    # As the occurrences are found from left to right, we only need the end of the last one
+    last_occurrence_ends = [-1 for _ in column_headers]
+
+    def add_occurrences(node: Dict[str, Any], start: int, end: int) -> None:
+        for column_header_position in node.get(_TRIE_END, []):
+            if start >= last_occurrence_ends[column_header_position]:
+                occurrences[column_header_position].append((start, end))
+                last_occurrence_ends[column_header_position] = end
+
+    # NOTE: we check the end of the formula as well, so empty column headers are found there too
+    for start in range(len(formula) + 1):
+        node = trie
+        add_occurrences(node, start, start)
+        end = start
+        while end < len(formula) and formula[end] in node:
+            node = node[formula[end]]
+            end += 1
+            add_occurrences(node, start, end)
+
+    return occurrences
+
+
 def get_raw_parser_matches(
         formula: str,
         formula_label: Union[str, bool, int, float], # Where the formula is written,
@@ -494,28 +565,27 @@ def get_raw_parser_matches(
     # column header
     column_headers_sorted = sorted(column_headers, key=lambda ch: len(str(ch)), reverse=True)
 
-    # First, we go through and replace all the column headers
-    for column_header in column_headers_sorted:
-        def find_column_headers(match: Any) -> Any:
-            found_column_header: str = match.group() # type:ignore
-            start = match.start()
-            end = match.end()
-            match_range = (start, end)
+    # First, we go through and find all the column headers
+    column_header_occurrences = get_column_header_occurrences(formula, column_headers_sorted)
+    for column_header, occurrences in zip(column_headers_sorted, column_header_occurrences):
+        for match_range in occurrences:
+            start, end = match_range
+            found_column_header = formula[start:end]
 
-            # Do not replace the column header if it is in a string
+            # Do not match the column header if it is in a string
             if match_covered_by_matches(string_matches, match_range):
                 is_string = isinstance(column_header, str)
                 starts_with_quote = is_quote(str(column_header)[0])
                 ends_with_quote = is_quote(str(column_header)[-1])
 
                 if is_string and not (starts_with_quote and ends_with_quote):
-                    return found_column_header
+                    continue
 
             # If this column header was already covered by another column header
             # that has been found, then this column header is just a substring
             # of another column header, so we avoid matching it
             if match_covered_by_matches([match['substring_range'] for match in raw_parser_matches], match_range):
-                return found_column_header
+                continue
 
             # First, we check if it's an unqualified column header with no index
             if is_no_index_after_column_header_match(formula, index, start, end):
@@ -526,7 +596,7 @@ def get_raw_parser_matches(
                     'unparsed': found_column_header,
                     'row_offset': 0
                 })
-                return
+                continue
 
             # Second, check if column header is follwed by an index of any variety
             number_index_label_match = get_index_match_from_number_index(formula, formula_label, index, end)
@@ -543,17 +613,6 @@ def get_raw_parser_matches(
                     'row_offset': index_label_match['row_offset']
                 })
                 raw_parser_matches.append(index_label_match)
-                return 
-            
-            # NOTE: we add the column_header, not the found column header
-            # as the found column header is a string, and the column_header 
-            # may not be
-            return found_column_header
-
-        # First, just find all of the matches, without changing the string, as this shifts indexes
-        # NOTE: for booleans, and for multi-index headers, we need to make the same transformation 
-        # that we make on the frontend
-        re.sub(re.escape(get_column_header_display(column_header)), find_column_headers, formula)
 
     # Sort the matches from start to end
     raw_parser_matches = sorted(raw_parser_matches, key=lambda x: x['substring_range'][0])
@@ -981,6 +1040,82 @@ def replace_functions(
     return formula_with_functions, functions
 
 
+# The most parsed formulas we keep around. A set column formula step parses its formula when
+# it is saturated, executed, and transpiled, and then again every time it is replayed
+MAX_PARSED_FORMULA_CACHE_SIZE = 1024
+
+ParsedFormula = Tuple[str, Set[str], Set[ColumnHeader], Set[IndexLabel]]
+
+# Maps the cache key to a weak reference to the index of the sheet, if the key uses the 
+# identity of the index, and the parsed formula
+_parsed_formula_cache: "OrderedDict[Hashable, Tuple[Optional[weakref.ref], ParsedFormula]]" = OrderedDict()
+# Steps that edit different sheets can be executed in different threads on replay
+_parsed_formula_cache_lock = threading.Lock()
+
+
+def _get_dataframe_header(dfs: List[pd.DataFrame], sheet_index: int) -> DataframeHeader:
+    # NOTE: the dfs of a state with evicted dataframes are lazy, so we read the header
+    # without loading the dataframe. See step_history_memory.py
+    if isinstance(dfs, LazyDataframes):
+        return dfs.get_header(sheet_index)
+    return get_dataframe_header(dfs[sheet_index])
+
+
+def _get_dataframe_columns(dfs: List[pd.DataFrame], sheet_index: int) -> pd.Index:
+    if isinstance(dfs, LazyDataframes):
+        return dfs.get_header(sheet_index).columns
+    return dfs[sheet_index].columns
+
+
+def _get_parsed_formula_cache_key(
+        formula: str, 
+        column_header: ColumnHeader, 
+        formula_label: Union[str, bool, int, float],
+        index_labels_formula_is_applied_to: FormulaAppliedToType,
+        dfs: List[pd.DataFrame],
+        df_names: List[str],
+        sheet_index: int,
+        include_df_set: bool,
+    ) -> Optional[Hashable]:
+    """
+    Returns a key for everything that parsing a formula depends on: the formula, where it 
+    is written, the column headers and names of all the sheets, the dtypes of the columns 
+    in the sheet, and the index of the sheet. Returns None if the key is not hashable.
+
+    As indexes are immutable, we use the identity of the index in the key, rather than 
+    the index labels. The only exception is a RangeIndex, which we can compare quickly.
+
+    The key is built from the headers of the dataframes, so that dataframes that were
+    evicted from the step history are not loaded to build it. Returns None if the index
+    of an evicted dataframe is no longer in memory.
+    """
+    header = _get_dataframe_header(dfs, sheet_index)
+    if header.index is None:
+        return None
+
+    index_fingerprint: Hashable = ('range', header.index.start, header.index.stop, header.index.step) if isinstance(header.index, pd.RangeIndex) else ('id', id(header.index))
+    # NOTE: we include the types of the column headers and labels, as e.g. 1 == True, but they
+    # are different column headers
+    key = (
+        formula,
+        (type(column_header), column_header),
+        (type(formula_label), formula_label),
+        index_labels_formula_is_applied_to['type'],
+        tuple((type(label), label) for label in index_labels_formula_is_applied_to.get('index_labels', [])), # type: ignore
+        sheet_index,
+        include_df_set,
+        tuple(df_names),
+        tuple(tuple((type(other_column_header), other_column_header) for other_column_header in _get_dataframe_columns(dfs, other_sheet_index)) for other_sheet_index in range(len(dfs))),
+        tuple(header.dtypes),
+        index_fingerprint,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def parse_formula(
         formula: Optional[str], 
         column_header: ColumnHeader, 
@@ -990,7 +1125,7 @@ def parse_formula(
         df_names: List[str],
         sheet_index: int,
         include_df_set: bool=True,
-    ) -> Tuple[str, Set[str], Set[ColumnHeader], Set[IndexLabel]]:
+    ) -> ParsedFormula:
     """
     Returns a representation of the formula that is easy to handle, specifically
     by returning (python_code, functions, column_header_dependencies), where column_headers
@@ -998,6 +1133,50 @@ def parse_formula(
 
     If include_df_set, then will return {df_name}[{column_header}] = {parsed formula}, and if
     not then will just return {parsed formula}
+
+    Formulas that parse successfully are cached, so the same formula on the same sheet is 
+    only parsed once. Formulas that fail to parse are not cached.
+    """
+    if formula is None or formula == '':
+        return '', set(), set(), set()
+
+    key = _get_parsed_formula_cache_key(formula, column_header, formula_label, index_labels_formula_is_applied_to, dfs, df_names, sheet_index, include_df_set)
+
+    if key is not None:
+        index = dfs.get_header(sheet_index).index if isinstance(dfs, LazyDataframes) else dfs[sheet_index].index
+        with _parsed_formula_cache_lock:
+            cached = _parsed_formula_cache.get(key)
+            if cached is not None and (cached[0] is None or cached[0]() is index):
+                _parsed_formula_cache.move_to_end(key)
+                parsed_formula = cached[1]
+                # Return new sets, so callers can change them without changing the cache
+                return parsed_formula[0], set(parsed_formula[1]), set(parsed_formula[2]), set(parsed_formula[3])
+
+    parsed_formula = _parse_formula(formula, column_header, formula_label, index_labels_formula_is_applied_to, dfs, df_names, sheet_index, include_df_set)
+
+    if key is not None:
+        df = dfs[sheet_index]
+        index_ref = None if isinstance(df.index, pd.RangeIndex) else weakref.ref(df.index)
+        with _parsed_formula_cache_lock:
+            _parsed_formula_cache[key] = (index_ref, (parsed_formula[0], set(parsed_formula[1]), set(parsed_formula[2]), set(parsed_formula[3])))
+            if len(_parsed_formula_cache) > MAX_PARSED_FORMULA_CACHE_SIZE:
+                _parsed_formula_cache.popitem(last=False)
+
+    return parsed_formula
+
+
+def _parse_formula(
+        formula: Optional[str], 
+        column_header: ColumnHeader, 
+        formula_label: Union[str, bool, int, float],
+        index_labels_formula_is_applied_to: FormulaAppliedToType,
+        dfs: List[pd.DataFrame],
+        df_names: List[str],
+        sheet_index: int,
+        include_df_set: bool,
+    ) -> ParsedFormula:
+    """
+    Helper function for parse_formula, which actually parses the formula.
     """
     df = dfs[sheet_index]
     df_name = df_names[sheet_index]
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains the PerformanceProfiler, which times each of the parts of executing
+a step (saturating, copying the state, transpiling, executing and reconing),
+as well as creating the sheet data that is sent to the frontend.
+
+This lets us see which steps are slow in real analyses, and why.
+"""
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Collection, Deque, Dict, Iterator, List, Optional
+
+# The number of timed spans we keep around. Once there are more, we drop the oldest ones
+MAX_PERFORMANCE_PROFILE_SPANS = 10_000
+
+STEP_SPAN = 'step'
+SATURATE_SPAN = 'saturate'
+EXECUTE_SPAN = 'execute'
+STATE_COPY_SPAN = 'state_copy'
+TRANSPILE_SPAN = 'transpile'
+EXEC_SPAN = 'exec'
+RECON_SPAN = 'recon'
+SHEET_DATA_JSON_SPAN = 'sheet_data_json'
+
+
+class PerformanceProfiler:
+    """
+    Collects timed spans. A span that is inside of another span belongs to the same
+    step as the span it is inside of, so only the outermost span needs a step_id.
+
+    API calls are handled in a separate thread, so spans are collected under a lock,
+    and the spans that are open are tracked per thread.
+    """
+
+    def __init__(self, max_spans: int=MAX_PERFORMANCE_PROFILE_SPANS):
+        self._spans: Deque[Dict[str, Any]] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self._open_spans = threading.local()
+
+    @contextmanager
+    def span(self, name: str, step_id: Optional[str]=None, step_type: Optional[str]=None) -> Iterator[None]:
+        open_spans: List[Dict[str, Any]] = getattr(self._open_spans, 'spans', None) or []
+        self._open_spans.spans = open_spans
+
+        if step_id is None and len(open_spans) > 0:
+            step_id = open_spans[-1]['step_id']
+            step_type = open_spans[-1]['step_type']
+
+        span: Dict[str, Any] = {
+            'name': name,
+            'step_id': step_id,
+            'step_type': step_type,
+            'thread_id': threading.get_ident(),
+            'depth': len(open_spans),
+            'start': perf_counter(),
+        }
+        open_spans.append(span)
+        try:
+            yield
+        finally:
+            span['duration'] = perf_counter() - span['start']
+            open_spans.pop()
+            with self._lock:
+                self._spans.append(span)
+
+    def get_spans(self, step_ids: Optional[Collection[str]]=None) -> List[Dict[str, Any]]:
+        """
+        Returns the finished spans in the order they started. If step_ids are passed,
+        only returns the spans of those steps.
+        """
+        with self._lock:
+            spans = list(self._spans)
+
+        if step_ids is not None:
+            step_ids = set(step_ids)
+            spans = [span for span in spans if span['step_id'] in step_ids]
+
+        return sorted(spans, key=lambda span: span['start'])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+performance_profiler = PerformanceProfiler()
+
+
+def get_performance_profile_of_steps(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Sums up the spans of each step, in the order the steps first executed. The time
+    of each span is also included in the time of the spans it is inside of, e.g. the
+    exec time is part of the execute time.
+    """
+    steps: Dict[str, Dict[str, Any]] = {}
+    for span in spans:
+        step_id = span['step_id']
+        if step_id is None:
+            continue
+
+        if step_id not in steps:
+            steps[step_id] = {
+                'stepID': step_id,
+                'stepType': span['step_type'],
+                'numExecutions': 0,
+                'totalTime': 0,
+                'times': {},
+            }
+
+        step = steps[step_id]
+        if span['name'] == STEP_SPAN:
+            step['numExecutions'] += 1
+            step['totalTime'] += span['duration']
+        step['times'][span['name']] = step['times'].get(span['name'], 0) + span['duration']
+
+    return list(steps.values())
+
+
+def get_chrome_trace(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Returns the spans in the Chrome trace event format, which can be saved as a JSON
+    file and then opened in chrome://tracing or https://ui.perfetto.dev
+    """
+    pid = os.getpid()
+    return {
+        'traceEvents': [
+            {
+                # We name the step spans by their step type, so it's easy to see which steps are slow
+                'name': span['step_type'] if span['name'] == STEP_SPAN and span['step_type'] is not None else span['name'],
+                'cat': 'mito',
+                'ph': 'X',
+                # Chrome traces are in microseconds
+                'ts': span['start'] * 1_000_000,
+                'dur': span['duration'] * 1_000_000,
+                'pid': pid,
+                'tid': span['thread_id'],
+                'args': {
+                    'step_id': span['step_id'],
+                    'step_type': span['step_type'],
+                }
+            }
+            for span in spans
+        ],
+        'displayTimeUnit': 'ms',
+    }
@@ -127,24 +127,39 @@ def reorder_code_chunks_for_more_optimization(all_code_chunks: List[CodeChunk])
 
 def optimize_code_chunks(all_code_chunks: List[CodeChunk]) -> List[CodeChunk]:
     """
-    Given a list of code chunks, will recursively attempt to optimize them 
+    Given a list of code chunks, will repeatedly attempt to optimize them 
     down to the smallest list of code chunks that have the same effects
     as the original list. 
 
-    This is necessarily recursive, because of a situation like [A, A, B, B], 
-    where A and B can be combined to a No-op. Thus, after one call, we end with 
-    [A, B], and we need to recurse to finish the optimization.
-    """
-    # First, try and remove code chunks we know we can remove
-    optimized_right, all_code_chunks = optimize_code_chunks_combine_right(all_code_chunks)
-    optimized_left, all_code_chunks = optimize_code_chunks_combine_left(all_code_chunks)
-
-    # Then, reorder the code chunks to be more optimal
-    reordered, all_code_chunks = reorder_code_chunks_for_more_optimization(all_code_chunks)
+    This is necessarily repeated, because of a situation like [A, A, B, B], 
+    where A and B can be combined to a No-op. Thus, after one pass, we end with 
+    [A, B], and we need to optimize again to finish the optimization.
 
-    # As long as we optimized in this iteration, recurse as we might
-    # need to optimize again
-    if optimized_right or optimized_left or reordered:
-        return optimize_code_chunks(all_code_chunks)
+    NOTE: the optimized code depends on the order code chunks are combined in, 
+    e.g. combining a pivot with a later edit of it stops a delete of the pivot 
+    from removing both. So we keep the passes the same, and instead make sure
+    to not repeat a reorder pass that we know will not change anything.
 
-    return all_code_chunks
\ No newline at end of file
+    NOTE: this is still quadratic in the worst case, as each pass goes over all the
+    code chunks, and reordering a code chunk checks it against every code chunk it 
+    can be moved past (e.g. the edits to all the other sheets). Only checking the
+    neighbours of the code chunks that changed would combine code chunks in a 
+    different order, and so would change the optimized code.
+    """
+    # If the last reorder did not change the code chunks, then reordering the same
+    # code chunks again will not change them either
+    reordered = True
+    while True:
+        # First, try and remove code chunks we know we can remove
+        optimized_right, all_code_chunks = optimize_code_chunks_combine_right(all_code_chunks)
+        optimized_left, all_code_chunks = optimize_code_chunks_combine_left(all_code_chunks)
+
+        if not (optimized_right or optimized_left or reordered):
+            return all_code_chunks
+
+        # Then, reorder the code chunks to be more optimal
+        reordered, all_code_chunks = reorder_code_chunks_for_more_optimization(all_code_chunks)
+
+        # As long as we optimized in this pass, we might need to optimize again
+        if not (optimized_right or optimized_left or reordered):
+            return all_code_chunks
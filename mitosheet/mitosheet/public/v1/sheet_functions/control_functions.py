@@ -18,7 +18,7 @@ import functools
 import pandas as pd
 
 from mitosheet.public.v1.sheet_functions.sheet_function_utils import (
-    fill_series_with_one_index, try_extend_series_to_index)
+    fill_series_with_one_index, select_from_series, try_extend_series_to_index)
 from mitosheet.public.v1.sheet_functions.types.decorators import (
     convert_arg_to_series_type, convert_args_to_series_type, fill_nans,
     filter_nans, handle_sheet_function_errors)
@@ -134,10 +134,7 @@ def IF(condition: pd.Series, true_series: pd.Series, false_series: pd.Series) ->
     true_series = try_extend_series_to_index(true_series, condition.index)
     false_series = try_extend_series_to_index(false_series, condition.index)
 
-    return pd.Series(
-        data=[true_series.loc[i] if c else false_series.loc[i] for i, c in condition.items()],
-        index=condition.index
-    )
+    return select_from_series([condition], [true_series], false_series, condition.index)
 
 
 @handle_sheet_function_errors
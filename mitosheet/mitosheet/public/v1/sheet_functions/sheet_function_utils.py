@@ -6,7 +6,8 @@
 """
 Contains utilities used in multiple sheet functions.
 """
-from typing import Tuple, Union
+from typing import Optional, Sequence, Tuple, Union
+import numpy as np
 import pandas as pd
 
 def try_extend_series_to_index(series: pd.Series, index_to_fill: Union[pd.Index, pd.MultiIndex]) -> pd.Series:
@@ -59,4 +60,63 @@ def is_series_of_constant(series: pd.Series) -> bool:
     We need to make sure to extend these series, so that we can operate on
     them with sheet functions properly. 
     """
-    return series.size == 1 and series.index.tolist() == [0]
\ No newline at end of file
+    return series.size == 1 and series.index.tolist() == [0]
+
+
+def _get_values_aligned_to_index(series: pd.Series, index: pd.Index, fill_value: object=np.nan) -> pd.Series:
+    if series.index.equals(index):
+        return series
+    return series.reindex(index, fill_value=fill_value)
+
+
+def _get_selected_dtype(selected_choices: Sequence[pd.Series]) -> Optional[np.dtype]:
+    """
+    Returns the numpy dtype of the values selected from the choices, if numpy can
+    select between them without changing the values, which is when they all have 
+    the same dtype, or are all numbers (but not both signed and unsigned ints). 
+    Otherwise, returns None, as the dtype has to be inferred from the selected values.
+
+    We only look at the choices that a value is actually selected from, so that 
+    e.g. selecting only from an int series gives an int series, even if the other
+    choice is a float series.
+    """
+    dtypes = [choice.dtype for choice in selected_choices]
+    if len(dtypes) == 0 or not all(isinstance(dtype, np.dtype) and dtype.kind != 'O' for dtype in dtypes):
+        return None
+    if len(set(dtypes)) == 1 or all(dtype.kind in 'if' for dtype in dtypes) or all(dtype.kind in 'uf' for dtype in dtypes):
+        return np.result_type(*dtypes)
+    return None
+
+
+def select_from_series(conditions: Sequence[pd.Series], choices: Sequence[pd.Series], default: pd.Series, index: pd.Index) -> pd.Series:
+    """
+    Returns a series with the given index, that in each row has the value of the choice
+    for the first condition that is True, or the value of the default if none are True.
+
+    The series are aligned to the index by label. We select with numpy, rather than 
+    row by row, so that this is fast on millions of rows. The result has the dtype the
+    series would have if it was built from the selected values one at a time.
+    """
+    condition_values = [
+        _get_values_aligned_to_index(condition, index, fill_value=False).to_numpy(dtype=bool)
+        for condition in conditions
+    ]
+    aligned_choices = [_get_values_aligned_to_index(series, index) for series in list(choices) + [default]]
+
+    # The position of the choice that each row takes its value from
+    if len(condition_values) == 1:
+        choice_positions = np.where(condition_values[0], 0, 1)
+    else:
+        choice_positions = np.select(condition_values, list(range(len(condition_values))), default=len(condition_values))
+    is_choice_selected = np.bincount(choice_positions, minlength=len(aligned_choices)) > 0
+
+    selected_dtype = _get_selected_dtype([choice for choice, is_selected in zip(aligned_choices, is_choice_selected) if is_selected])
+    values = np.empty(len(index), dtype=selected_dtype if selected_dtype is not None else object)
+    for choice_position, (choice, is_selected) in enumerate(zip(aligned_choices, is_choice_selected)):
+        if is_selected:
+            choice_mask = choice_positions == choice_position
+            values[choice_mask] = choice.to_numpy(dtype=values.dtype)[choice_mask]
+
+    if selected_dtype is None:
+        return pd.Series(values.tolist(), index=index)
+    return pd.Series(values, index=index)
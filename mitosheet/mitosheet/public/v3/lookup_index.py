@@ -0,0 +1,92 @@
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GNU Affero General Public License v3.0 License.
+
+import threading
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+
+from mitosheet.is_type_utils import is_string_dtype
+
+# The number of columns we keep lookup indexes for. Each one keeps a copy of the
+# column it was built from, so we keep just a few
+MAX_LOOKUP_INDEX_CACHE_SIZE = 4
+
+
+def get_case_insensitive_values(series: pd.Series) -> pd.Series:
+    """
+    Lookups are case insensitive, like in Excel, so we lowercase the strings
+    in the series. Values that are not strings are left as they are.
+    """
+    if not is_string_dtype(str(series.dtype)):
+        return series
+
+    lowercase_series = series.str.lower()
+    return lowercase_series.where(lowercase_series.notna(), series)
+
+
+class LookupIndex():
+    """
+    A lookup index is a hash index from the values in a column to the position of the
+    first row they are in, which is the row that VLOOKUP, XLOOKUP, and MATCH return.
+
+    Building the index means lowercasing and hashing the whole column, which is slow on
+    large columns, so we cache the lookup indexes of the last few columns we looked up
+    in. A new dataframe is passed to VLOOKUP each time the formula is run, so we find
+    the cached index by comparing the values in the column, rather than by the dataframe.
+    """
+
+    def __init__(self, column: pd.Series):
+        self.column = column.reset_index(drop=True).copy()
+
+        case_insensitive_column = get_case_insensitive_values(self.column)
+        is_first_match = ~case_insensitive_column.duplicated(keep='first').to_numpy()
+        self.first_match_positions = np.flatnonzero(is_first_match)
+        self.index = pd.Index(case_insensitive_column[is_first_match])
+
+    def is_index_of(self, column: pd.Series) -> bool:
+        return len(self.column) == len(column) and self.column.equals(column.reset_index(drop=True))
+
+    def get_positions(self, lookup_values: pd.Series) -> np.ndarray:
+        """
+        Returns the position of the row each value is first in, or -1 if the value is
+        not in the column.
+        """
+        index_positions = self.index.get_indexer(get_case_insensitive_values(lookup_values))
+        return np.where(index_positions == -1, -1, self.first_match_positions[index_positions])
+
+    def get_position(self, lookup_value: Any) -> int:
+        return int(self.get_positions(pd.Series([lookup_value]))[0])
+
+
+_lookup_index_cache: List[LookupIndex] = []
+# Steps that edit different sheets can be executed in different threads on replay
+_lookup_index_cache_lock = threading.Lock()
+
+
+def get_lookup_index(column: pd.Series) -> LookupIndex:
+    """
+    Returns the lookup index for the column, building it if it is not cached.
+    """
+    with _lookup_index_cache_lock:
+        for position, lookup_index in enumerate(_lookup_index_cache):
+            if lookup_index.is_index_of(column):
+                # Move it to the front, so the least recently used index is removed first
+                _lookup_index_cache.insert(0, _lookup_index_cache.pop(position))
+                return lookup_index
+
+    # We build the index without holding the lock, as it is slow on large columns
+    lookup_index = LookupIndex(column)
+    with _lookup_index_cache_lock:
+        _lookup_index_cache.insert(0, lookup_index)
+        del _lookup_index_cache[MAX_LOOKUP_INDEX_CACHE_SIZE:]
+    return lookup_index
+
+
+def get_values_at_positions(column: pd.Series, positions: np.ndarray, index: pd.Index) -> pd.Series:
+    """
+    Returns the values in the column at the positions, with a missing value where
+    the position is -1.
+    """
+    return pd.Series(column.array.take(positions, allow_fill=True), index=index)
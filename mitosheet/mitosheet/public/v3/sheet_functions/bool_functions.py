@@ -18,6 +18,8 @@ from typing import Optional
 import pandas as pd
 
 from mitosheet.errors import MitoError
+from mitosheet.public.v1.sheet_functions.sheet_function_utils import \
+    select_from_series
 from mitosheet.public.v3.errors import handle_sheet_function_errors
 from mitosheet.public.v3.sheet_functions.utils import (
     get_final_result_series_or_primitive, get_series_from_primitive_or_series)
@@ -125,10 +127,7 @@ def IF(condition: pd.Series, true_series: AnyPrimitiveOrSeriesInputType, false_s
     true_series = get_series_from_primitive_or_series(true_series, condition.index)
     false_series = get_series_from_primitive_or_series(false_series, condition.index)
 
-    return pd.Series(
-        data=[true_series.loc[i] if c else false_series.loc[i] for i, c in condition.items()],
-        index=condition.index
-    )
+    return select_from_series([condition], [true_series], false_series, condition.index)
 
 
 @handle_sheet_function_errors
@@ -170,26 +169,22 @@ def IFS(*argv: Optional[IfsInputType]) -> pd.Series:
                     return argv[index+1]
         return None
 
-    else:
-        # Otherwise, we have at least one series -- so we can go through and turn all of the constants into series.
-        argv_series = tuple([get_series_from_primitive_or_series(arg, base_index) for arg in argv])
-        results = pd.Series(index=base_index)
+    # Otherwise, we have at least one series -- so we can go through and turn all of the constants into series.
+    argv_series = tuple([get_series_from_primitive_or_series(arg, base_index) for arg in argv])
+    conditions = argv_series[::2]
+    if any(condition.dtype != bool for condition in conditions):
+        raise MitoError(
+            'invalid_args_error',
+            'IFS',
+            f"IFS requires all even indexed arguments to be boolean.",
+            error_modal=False
+        )
+
+    results = pd.Series(index=base_index)
+    for condition, true_series in zip(conditions, argv_series[1::2]):
+        # Fill the rows that are still missing with the "true_series" of this condition
+        results = results.combine_first(true_series[condition])
 
-        for index, condition in enumerate(argv_series):
-            if index % 2 == 0:
-                if condition.dtype != bool:
-                    raise MitoError(
-                        'invalid_args_error',
-                        'IFS',
-                        f"IFS requires all even indexed arguments to be boolean.",
-                        error_modal=False
-                    )
-                
-                # If it is, use the "true_series" to fill the value in the result series
-                true_series = argv_series[index+1]
-                new_series = true_series[condition]
-                results = results.combine_first(new_series)
-                
     return results
 
 @cast_values_in_all_args_to_type('bool')
@@ -2,7 +2,7 @@
 # Distributed under the terms of the GNU Affero General Public License v3.0 License.
 
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -12,12 +12,14 @@ from mitosheet.is_type_utils import (is_bool_dtype, is_datetime_dtype,
                                      is_float_dtype, is_int_dtype,
                                      is_string_dtype)
 from mitosheet.public.v3.errors import handle_sheet_function_errors
+from mitosheet.public.v3.lookup_index import (get_lookup_index,
+                                              get_values_at_positions)
 from mitosheet.public.v3.sheet_functions.utils import \
     get_series_from_primitive_or_series
 from mitosheet.public.v3.types.decorators import cast_values_in_arg_to_type
 from mitosheet.public.v3.types.sheet_function_types import (
     AnyPrimitiveOrSeriesInputType, BoolRestrictedInputType,
-    IntRestrictedInputType)
+    IntRestrictedInputType, NumberRestrictedInputType)
 
 
 @handle_sheet_function_errors
@@ -187,10 +189,9 @@ def VLOOKUP(lookup_value: AnyPrimitiveOrSeriesInputType, where: pd.DataFrame, in
         ]
     }
     """
-    where_first_column_case_insensitive = where.iloc[:,0].copy()
-    where_first_column_case_insensitive.name = str(where_first_column_case_insensitive.name) + 'MITO_CASE_INSENSITIVE'
+    where_first_column = where.iloc[:,0]
 
-    # If the lookup value and index are both a primitive, we don't need to merge. 
+    # If the lookup value and index are both a primitive, we just look up the one value
     if not isinstance(lookup_value, pd.Series) and isinstance(index, int):
         if type(lookup_value) != type(where.iloc[0,0]):
             raise MitoError(
@@ -199,59 +200,194 @@ def VLOOKUP(lookup_value: AnyPrimitiveOrSeriesInputType, where: pd.DataFrame, in
                 f'VLOOKUP requires the lookup value and the first column of the where range to be the same type. The lookup value is of type {type(lookup_value)} and the first column of the where range is of type {type(where.iloc[0,0])}.'
             )
 
-        # If the lookup value and the first column are strings, make them lowecase for case-insensitive matching
-        if isinstance(lookup_value, str) and isinstance(where.iloc[0,0], str):
-            lookup_value = lookup_value.lower()
-            where_first_column_case_insensitive = where_first_column_case_insensitive.str.lower()
-
-        matching_row = where.loc[where_first_column_case_insensitive == lookup_value]
-        if matching_row.empty:
+        position = get_lookup_index(where_first_column).get_position(lookup_value)
+        if position == -1:
             return None
         else:
-            return matching_row.iloc[0, index-1]
+            return where.iloc[position, index-1]
 
     value = get_series_from_primitive_or_series(lookup_value, where.index)
 
-    value.name = 'lookup_value'
-    indices_to_return_from_range = get_series_from_primitive_or_series(index, value.index)
-
     # If the lookup value and the first column of the where range are different types, we raise an error
-    if value.dtype != where_first_column_case_insensitive.dtype:
+    if value.dtype != where_first_column.dtype:
         raise MitoError(
             'invalid_args_error',
             'VLOOKUP',
-            f'VLOOKUP requires the lookup value and the first column of the where range to be the same type. The lookup value is of type {value.dtype} and the first column of the where range is of type {where_first_column_case_insensitive.dtype}.'
+            f'VLOOKUP requires the lookup value and the first column of the where range to be the same type. The lookup value is of type {value.dtype} and the first column of the where range is of type {where_first_column.dtype}.'
         )
 
-    # If the series is a string, convert it to lowercase because Excel's vlookup is case insensitive
-    if is_string_dtype(str(value.dtype)):
-        value = value.str.lower()
-        where_first_column_case_insensitive = where_first_column_case_insensitive.str.lower()
-
-    # Add where_first_column_case_insensitive to the front of the dataframe so we can use the case insensitive merge 
-    # without effecting the return values
-    where = pd.concat([where_first_column_case_insensitive, where], axis=1)
-    indices_to_return_from_range = indices_to_return_from_range + 1
-
-    where_deduplicated = where.drop_duplicates(subset=where_first_column_case_insensitive.name)
-    
-    # Update first column to use the deduplicated version
-    where_first_column = where_deduplicated.iloc[:,0]
-    
-    # Then merge on the column we're looking up from, and the df we're looking up in.
-    merged = pd.merge(value, where_deduplicated, left_on='lookup_value', right_on=where_first_column, how='left')
-
-    # Change the indexes back to the indexes of the lookup value so the results 
-    # can be added back to the calling dataframe.
-    merged.index = value.index
-    
-    def get_value_at_index_in_row(row):
-        try:
-            return row.iloc[indices_to_return_from_range[row.name]]
-        # Because we can't control what the user puts in the index, we need to catch any errors
-        except Exception:
-            return None
-    return merged.apply(get_value_at_index_in_row, axis=1)
+    positions = get_lookup_index(where_first_column).get_positions(value)
+
+    if isinstance(index, int):
+        if index < 1 or index > len(where.columns):
+            return pd.Series(None, index=value.index, dtype='object')
+        return get_values_at_positions(where.iloc[:, index-1], positions, value.index)
+
+    # If there is a different index in each row, we get the values from each column that is
+    # used, and then put them together. Rows with an invalid index are None
+    indices_to_return_from_range = index if index.index.equals(value.index) else index.reindex(value.index)
+    result = np.full(len(value), None, dtype='object')
+    for index_to_return_from_range in indices_to_return_from_range.dropna().unique():
+        if index_to_return_from_range < 1 or index_to_return_from_range > len(where.columns):
+            continue
+
+        rows = (indices_to_return_from_range == index_to_return_from_range).to_numpy()
+        values = get_values_at_positions(where.iloc[:, int(index_to_return_from_range)-1], positions[rows], value.index[rows])
+        result[rows] = values.to_numpy(dtype='object')
+
+    return pd.Series(result.tolist(), index=value.index)
+
+
+def _get_first_column(where: Union[pd.DataFrame, pd.Series]) -> pd.Series:
+    if isinstance(where, pd.DataFrame):
+        return where.iloc[:, 0]
+    return where
+
+
+@handle_sheet_function_errors
+def XLOOKUP(lookup_value: AnyPrimitiveOrSeriesInputType, lookup_range: Union[pd.DataFrame, pd.Series], return_range: Union[pd.DataFrame, pd.Series], if_not_found: Optional[AnyPrimitiveOrSeriesInputType]=None) -> AnyPrimitiveOrSeriesInputType:
+    """
+    {
+        "function": "XLOOKUP",
+        "description": "Looks up a value in a column, and returns the value in the same row of another column.",
+        "search_terms": ["xlookup", "vlookup", "merge", "join", "search", "lookup"],
+        "category": "REFERENCE",
+        "examples": [
+            "XLOOKUP(Names0, Ids:Ids, Ages:Ages)",
+            "XLOOKUP('John Smith', Names:Names, Ages:Ages, 0)"
+        ],
+        "syntax": "XLOOKUP(lookup_value, lookup_range, return_range, [if_not_found])",
+        "syntax_elements": [{
+                "element": "lookup_value",
+                "description": "The value to look up."
+            }, {
+                "element": "lookup_range",
+                "description": "The column to look up the value in."
+            }, {
+                "element": "return_range",
+                "description": "The column to return the value from. It must have the same number of rows as the lookup_range."
+            }, {
+                "element": "if_not_found [OPTIONAL]",
+                "description": "The value to return if the lookup value is not found. Default is None."
+            }
+        ]
+    }
+    """
+    lookup_column = _get_first_column(lookup_range)
+    return_column = _get_first_column(return_range)
+
+    if len(lookup_column) != len(return_column):
+        raise MitoError(
+            'invalid_args_error',
+            'XLOOKUP',
+            f'XLOOKUP requires the lookup range and the return range to have the same number of rows. The lookup range has {len(lookup_column)} rows and the return range has {len(return_column)} rows.',
+            error_modal=False
+        )
+
+    if not isinstance(lookup_value, pd.Series):
+        position = get_lookup_index(lookup_column).get_position(lookup_value)
+        return if_not_found if position == -1 else return_column.iloc[position]
+
+    positions = get_lookup_index(lookup_column).get_positions(lookup_value)
+    result = get_values_at_positions(return_column, positions, lookup_value.index)
+    if if_not_found is None:
+        return result
+    return result.where(positions != -1, if_not_found)
+
+
+@handle_sheet_function_errors
+def MATCH(lookup_value: AnyPrimitiveOrSeriesInputType, lookup_range: Union[pd.DataFrame, pd.Series], match_type: int=0) -> AnyPrimitiveOrSeriesInputType:
+    """
+    {
+        "function": "MATCH",
+        "description": "Returns the position of the first row a value is in, starting from 1. Use with INDEX to look up values.",
+        "search_terms": ["match", "index", "position", "search", "lookup"],
+        "category": "REFERENCE",
+        "examples": [
+            "MATCH(Names0, Ids:Ids, 0)",
+            "INDEX(Ages:Ages, MATCH(Names0, Ids:Ids, 0))"
+        ],
+        "syntax": "MATCH(lookup_value, lookup_range, [match_type])",
+        "syntax_elements": [{
+                "element": "lookup_value",
+                "description": "The value to find the position of."
+            }, {
+                "element": "lookup_range",
+                "description": "The column to look up the value in."
+            }, {
+                "element": "match_type [OPTIONAL]",
+                "description": "Only exact matches, with a match_type of 0, are supported."
+            }
+        ]
+    }
+    """
+    if match_type != 0:
+        raise MitoError(
+            'invalid_args_error',
+            'MATCH',
+            'MATCH only supports exact matches, with a match_type of 0.',
+            error_modal=False
+        )
+
+    lookup_index = get_lookup_index(_get_first_column(lookup_range))
+
+    if not isinstance(lookup_value, pd.Series):
+        position = lookup_index.get_position(lookup_value)
+        return None if position == -1 else position + 1
+
+    positions = lookup_index.get_positions(lookup_value)
+    return pd.Series(positions + 1, index=lookup_value.index).where(positions != -1)
+
+
+@handle_sheet_function_errors
+def INDEX(where: Union[pd.DataFrame, pd.Series], row_number: Optional[NumberRestrictedInputType], column_number: int=1) -> AnyPrimitiveOrSeriesInputType:
+    """
+    {
+        "function": "INDEX",
+        "description": "Returns the value in a row and column of a range, where the first row and column are 1. Use with MATCH to look up values.",
+        "search_terms": ["index", "match", "position", "lookup"],
+        "category": "REFERENCE",
+        "examples": [
+            "INDEX(Ages:Ages, 3)",
+            "INDEX(Ages:Ages, MATCH(Names0, Ids:Ids, 0))",
+            "INDEX(Ids:Ages, MATCH(Names0, Ids:Ids, 0), 2)"
+        ],
+        "syntax": "INDEX(where, row_number, [column_number])",
+        "syntax_elements": [{
+                "element": "where",
+                "description": "The range to return the value from."
+            }, {
+                "element": "row_number",
+                "description": "The row to return the value from."
+            }, {
+                "element": "column_number [OPTIONAL]",
+                "description": "The column to return the value from. Default is 1."
+            }
+        ]
+    }
+    """
+    where = where.to_frame() if isinstance(where, pd.Series) else where
+    if column_number < 1 or column_number > len(where.columns):
+        raise MitoError(
+            'invalid_args_error',
+            'INDEX',
+            f'INDEX requires the column number to be between 1 and {len(where.columns)}, the number of columns in the range.',
+            error_modal=False
+        )
+    column = where.iloc[:, column_number-1]
+
+    # MATCH returns None if it does not find the value
+    if row_number is None:
+        return None
+
+    if not isinstance(row_number, pd.Series):
+        return column.iloc[int(row_number)-1] if 1 <= row_number <= len(column) else None
+
+    # Rows that are missing or out of the range, like when MATCH does not find a value, are missing
+    positions = pd.to_numeric(row_number, errors='coerce').fillna(0).to_numpy() - 1
+    positions = np.where((positions >= 0) & (positions < len(column)), positions, -1).astype(int)
+    return get_values_at_positions(column, positions, row_number.index)
+
 
 # TODO: we should see if we can list these automatically!
 MISC_FUNCTIONS = {
@@ -259,5 +395,8 @@ MISC_FUNCTIONS = {
     'GETPREVIOUSVALUE': GETPREVIOUSVALUE,
     'GETNEXTVALUE': GETNEXTVALUE,
     'TYPE': TYPE,
-    'VLOOKUP': VLOOKUP
+    'VLOOKUP': VLOOKUP,
+    'XLOOKUP': XLOOKUP,
+    'MATCH': MATCH,
+    'INDEX': INDEX,
 }
\ No newline at end of file
@@ -155,5 +155,9 @@ def get_series_from_primitive_or_series(
     ) -> pd.Series:
     if isinstance(arg, pd.Series):
         return arg
+    elif isinstance(arg, (str, int, float)):
+        # These have the same dtype when we fill the series with them directly, 
+        # which is much faster than building a list on columns with many rows
+        return pd.Series(arg, index=index)
     else:
         return pd.Series([arg] * len(index), index=index)
\ No newline at end of file
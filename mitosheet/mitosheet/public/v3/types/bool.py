@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Union
 
 import numpy as np
+import pandas as pd
 
 
 def cast_string_to_bool(
@@ -63,4 +64,11 @@ def cast_to_bool(unknown: Union[str, int, float, bool, datetime, timedelta]) ->
     elif isinstance(unknown, bool):
         return unknown
 
-    return None
\ No newline at end of file
+    return None
+
+def cast_series_to_bool(series: pd.Series) -> pd.Series:
+    # Series that are already bools stay the same, so we don't cast each value
+    if series.dtype == bool:
+        return series
+
+    return series.apply(cast_to_bool)
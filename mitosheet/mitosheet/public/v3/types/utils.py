@@ -8,7 +8,7 @@ import pandas as pd
 from mitosheet.is_type_utils import is_bool_dtype, is_datetime_dtype, is_float_dtype, is_int_dtype, is_string_dtype, is_timedelta_dtype
 
 from mitosheet.public.v3.rolling_range import RollingRange
-from mitosheet.public.v3.types.bool import cast_to_bool
+from mitosheet.public.v3.types.bool import cast_series_to_bool, cast_to_bool
 from mitosheet.public.v3.types.datetime import cast_series_to_datetime, cast_to_datetime
 from mitosheet.public.v3.types.float import cast_to_float
 from mitosheet.public.v3.types.int import cast_to_int
@@ -22,7 +22,7 @@ SERIES_CONVERSION_FUNCTIONS: Dict[PrimitiveTypeName, Optional[Callable[[pd.Serie
     'int': None,
     'float': None,
     'number': None,
-    'bool': None,
+    'bool': cast_series_to_bool,
     'datetime': cast_series_to_datetime,
     'timedelta': None,
 }
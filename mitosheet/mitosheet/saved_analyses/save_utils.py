@@ -9,18 +9,82 @@ in analyses.
 """
 
 from mitosheet.step import Step
+import atexit
 import os
 import json
+from threading import Lock, Timer
 from typing import Any, Dict, List, Optional
 from mitosheet._version import __version__
 from mitosheet.types import CodeOptions, StepsManagerType
-from mitosheet.utils import NpEncoder
+from mitosheet.utils import NpEncoder, get_new_id
 from mitosheet.save_paths import MITO_FOLDER
 
 # The current version of the saved Mito analysis
 # where we save all the analyses for this version
 SAVED_ANALYSIS_FOLDER = os.path.join(MITO_FOLDER, 'saved_analyses')
 
+# The number of seconds we wait before writing an analysis in the background, 
+# so that a burst of edits only writes the analysis file once
+SAVED_ANALYSIS_WRITE_DELAY_SECONDS = 0.5
+
+
+class SavedAnalysisWriter:
+    """
+    Writes saved analyses in a background thread, so that writing the analysis
+    after every edit does not slow down the edit.
+
+    Analyses are written SAVED_ANALYSIS_WRITE_DELAY_SECONDS after the first write
+    that is waiting, and only the most recent analysis for each file is written. 
+    Files are written atomically, so a reader never sees a partially written file.
+    """
+
+    def __init__(self, delay_seconds: float=SAVED_ANALYSIS_WRITE_DELAY_SECONDS):
+        self.delay_seconds = delay_seconds
+        # A map from analysis path to the analysis that is waiting to be written there
+        self._pending_analyses: Dict[str, Dict[str, Any]] = {}
+        self._timer: Optional[Timer] = None
+        self._lock = Lock()
+        # Held while writing, so that an older analysis never overwrites a newer one
+        self._write_lock = Lock()
+
+    def write_in_background(self, analysis_path: str, analysis: Dict[str, Any]) -> None:
+        with self._lock:
+            self._pending_analyses[analysis_path] = analysis
+            if self._timer is None:
+                self._timer = Timer(self.delay_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def write(self, analysis_path: str, analysis: Dict[str, Any]) -> None:
+        """Writes the analysis now, replacing any analysis waiting to be written there"""
+        with self._write_lock:
+            with self._lock:
+                self._pending_analyses.pop(analysis_path, None)
+            _write_analysis_file_atomically(analysis_path, analysis)
+
+    def flush(self) -> None:
+        """Writes all the analyses that are waiting to be written"""
+        with self._write_lock:
+            with self._lock:
+                pending_analyses = self._pending_analyses
+                self._pending_analyses = {}
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+            for analysis_path, analysis in pending_analyses.items():
+                try:
+                    _write_analysis_file_atomically(analysis_path, analysis)
+                except:
+                    # The saved analysis is a backup of the analysis, and so if we 
+                    # cannot write it in the background, we just skip it
+                    pass
+
+
+saved_analysis_writer = SavedAnalysisWriter()
+# Make sure we write any waiting analyses before the kernel shuts down
+atexit.register(saved_analysis_writer.flush)
+
 
 def get_analysis_exists(analysis_name: Optional[str]) -> bool:
     """
@@ -31,6 +95,7 @@ def get_analysis_exists(analysis_name: Optional[str]) -> bool:
     if analysis_name is None:
         return False
 
+    saved_analysis_writer.flush()
     analysis_path = f'{SAVED_ANALYSIS_FOLDER}/{analysis_name}.json'
     return os.path.exists(analysis_path)
 
@@ -41,6 +106,7 @@ def read_analysis(analysis_name: str) -> Optional[Dict[str, Any]]:
     representing it.
     """
 
+    saved_analysis_writer.flush()
     analysis_path = f'{SAVED_ANALYSIS_FOLDER}/{analysis_name}.json'
     if not os.path.exists(analysis_path):
         return None
@@ -66,6 +132,7 @@ def _get_all_analysis_filenames():
     """
     Returns the names of the files in the SAVED_ANALYSIS_FOLDER
     """
+    saved_analysis_writer.flush()
     if not os.path.exists(SAVED_ANALYSIS_FOLDER):
         return set()
 
@@ -117,21 +184,37 @@ def rename_saved_analysis(old_analysis_name, new_analysis_name):
     else:
         raise Exception(f'Invalid rename, with old and new analysis are {old_analysis_name} and {new_analysis_name}')
 
-def get_saved_analysis_string(steps_manager: StepsManagerType) -> str:
-    saved_analysis_string = json.dumps({
+def get_saved_analysis(steps_manager: StepsManagerType) -> Dict[str, Any]:
+    return {
         'version': __version__,
         'steps_data': get_steps_obj_for_saved_analysis(steps_manager.steps_including_skipped),
         'public_interface_version': steps_manager.public_interface_version,
-        'args': steps_manager.original_args_raw_strings,
+        'args': list(steps_manager.original_args_raw_strings),
         'code': steps_manager.code(),
-        'code_options': steps_manager.code_options
-    }, cls=NpEncoder)
-    return saved_analysis_string
+        'code_options': dict(steps_manager.code_options)
+    }
+
+def get_saved_analysis_string(steps_manager: StepsManagerType) -> str:
+    return json.dumps(get_saved_analysis(steps_manager), cls=NpEncoder)
+
+def _write_analysis_file_atomically(analysis_path: str, analysis: Dict[str, Any]) -> None:
+    """
+    Writes the analysis to a temporary file in the same folder, and then moves it
+    to analysis_path, so the file at analysis_path is always a complete analysis.
 
-def _write_saved_analysis_file(analysis_path: str, steps_manager: StepsManagerType) -> None:
-    saved_analysis_string = get_saved_analysis_string(steps_manager)
-    with open(analysis_path, 'w+') as f:
-        f.write(saved_analysis_string)
+    The temporary file is created with open, so it has the default permissions 
+    of a new file, and has a unique name, so concurrent writes do not clash.
+    """
+    saved_analysis_string = json.dumps(analysis, cls=NpEncoder)
+    tmp_analysis_path = f'{analysis_path}.{get_new_id()}.tmp'
+    try:
+        with open(tmp_analysis_path, 'x') as f:
+            f.write(saved_analysis_string)
+        os.replace(tmp_analysis_path, analysis_path)
+    except:
+        if os.path.exists(tmp_analysis_path):
+            os.remove(tmp_analysis_path)
+        raise
 
 
 def get_steps_obj_for_saved_analysis(
@@ -185,12 +268,16 @@ def get_steps_obj_for_saved_analysis(
 
     return steps_json_obj
 
-def write_save_analysis_file(steps_manager: StepsManagerType, analysis_name: Optional[str]=None) -> None:
+def write_save_analysis_file(steps_manager: StepsManagerType, analysis_name: Optional[str]=None, in_background: bool=False) -> None:
     """
     Writes the analysis saved in steps_manager to
     ~/.mito/{analysis_name}. If analysis_name is none, gets the temporary
     name from the steps_manager.
 
+    If in_background is True, the analysis is written by the saved_analysis_writer
+    in a background thread, together with any other edits made shortly after. 
+    Reading an analysis first writes any analyses waiting to be written.
+
     Note that a step container may contain invalid steps/out of
     date steps, but we save them all, as they will play back validly
     as they were valid when they were added.
@@ -206,4 +293,10 @@ def write_save_analysis_file(steps_manager: StepsManagerType, analysis_name: Opt
         analysis_name = steps_manager.analysis_name
 
     analysis_path = f'{SAVED_ANALYSIS_FOLDER}/{analysis_name}.json'
-    _write_saved_analysis_file(analysis_path, steps_manager)
\ No newline at end of file
+    # NOTE: the code of the analysis is cached on the steps_manager, as it is also
+    # sent to the frontend after each edit, so only writing the file is slow
+    analysis = get_saved_analysis(steps_manager)
+    if in_background:
+        saved_analysis_writer.write_in_background(analysis_path, analysis)
+    else:
+        saved_analysis_writer.write(analysis_path, analysis)
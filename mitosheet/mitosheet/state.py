@@ -5,11 +5,12 @@
 # Distributed under the terms of the GPL License.
 from collections import OrderedDict
 from copy import deepcopy
-from typing import Any, Callable, Collection, List, Dict, Optional, Set, Union
+from typing import Any, Callable, Collection, List, Dict, Optional, Set, Union, cast
 import pandas as pd
 
-from mitosheet.column_headers import ColumnIDMap
-from mitosheet.types import FrontendFormulaAndLocation, OverwriteSheetIndexParams
+from mitosheet.column_headers import ColumnIDMap, get_column_header_display
+from mitosheet.step_history_memory import DataframeHeader, EvictedDataframe, LazyDataframes, get_dataframe_header
+from mitosheet.types import FrontendFormula, FrontendFormulaAndLocation, OverwriteSheetIndexParams
 from mitosheet.types import ColumnHeader, ColumnID, DataframeFormat
 from mitosheet.utils import  get_first_unused_dataframe_name
 
@@ -72,8 +73,11 @@ class State:
         user_defined_editors: Optional[List[Callable]]=None,
     ):
 
-        # The dataframes that are in the state
-        self.dfs = list(dfs)
+        # The dataframes that are in the state. Some of these might have been evicted
+        # from memory to keep the step history in its memory budget, and so this should
+        # be accessed through dfs. See step_history_memory.py for more details
+        self._dfs: List[Union[pd.DataFrame, EvictedDataframe]] = list(dfs)
+        self.has_evicted_dfs = False
 
         self.public_interface_version = public_interface_version
 
@@ -144,17 +148,86 @@ class State:
         self.user_defined_importers = user_defined_importers if user_defined_importers is not None else []
         self.user_defined_editors = user_defined_editors if user_defined_editors is not None else []
 
-    def copy(self, deep_sheet_indexes: Optional[Union[List[int], Set[int], None]]=None) -> "State":
+    @property
+    def dfs(self) -> List[pd.DataFrame]:
+        if not self.has_evicted_dfs:
+            return cast(List[pd.DataFrame], self._dfs)
+
+        # NOTE: states with evicted dataframes are only in the step history, and 
+        # so are never changed in place, which is why we can return a read only list
+        # that only loads the evicted dataframes that are read from it
+        return cast(List[pd.DataFrame], LazyDataframes(self._dfs))
+
+    @dfs.setter
+    def dfs(self, dfs: List[pd.DataFrame]) -> None:
+        self._dfs = list(dfs)
+        self.has_evicted_dfs = False
+
+    @property
+    def num_sheets(self) -> int:
+        return len(self._dfs)
+
+    def get_df(self, sheet_index: int) -> pd.DataFrame:
+        """
+        Returns the dataframe at sheet_index, loading it back into memory if it
+        was evicted, without loading any of the other dataframes in this state.
+        """
+        df = self._dfs[sheet_index]
+        return df.load() if isinstance(df, EvictedDataframe) else df
+
+    def get_df_header(self, sheet_index: int) -> DataframeHeader:
+        """
+        Returns the column headers, dtypes, and index of the dataframe at sheet_index,
+        without loading it back into memory if it was evicted. 
+        """
+        df = self._dfs[sheet_index]
+        return df.get_header() if isinstance(df, EvictedDataframe) else get_dataframe_header(df)
+
+    def is_df_evicted(self, sheet_index: int) -> bool:
+        return isinstance(self._dfs[sheet_index], EvictedDataframe)
+
+    def evict_df(self, sheet_index: int, evicted_df: EvictedDataframe) -> None:
+        self._dfs[sheet_index] = evicted_df
+        self.has_evicted_dfs = True
+
+    def restore_evicted_dfs(self) -> None:
+        """
+        Loads any evicted dataframes in this state back into memory.
+        """
+        if self.has_evicted_dfs:
+            self.dfs = [self.get_df(sheet_index) for sheet_index in range(len(self._dfs))]
+
+    def copy(
+            self,
+            deep_sheet_indexes: Optional[Union[List[int], Set[int], None]]=None,
+            metadata_sheet_indexes: Optional[Union[List[int], Set[int], None]]=None,
+            deep_column_ids: Optional[Collection[ColumnID]]=None
+        ) -> "State":
         """
         Returns a copy of the state, while only making deep copies of
-        those dataframes in the deep_sheet_indexes. Ideally, we'd copy
-        even less than that deeply.
+        those dataframes in the deep_sheet_indexes. 
+
+        If deep_column_ids is passed, then the dataframes in deep_sheet_indexes
+        only get new copies of these columns, and share the data for all of 
+        their other columns with this state. The caller must then only change
+        the data of these columns in place (adding, removing, or renaming columns
+        is always safe).
+
+        If metadata_sheet_indexes is None, all of the metadata is deep copied.
+        Otherwise, the copy is copy-on-write: only the per-sheet metadata (column
+        ids, formulas, filters, and formats) of the sheets in metadata_sheet_indexes
+        is copied, and the metadata for every other sheet is shared with this state.
+        The caller must then only mutate metadata for the sheets it passed, or
+        add, replace, or remove entire sheets.
         """
         if deep_sheet_indexes is None:
             deep_sheet_indexes = []
-        
+
+        if metadata_sheet_indexes is not None:
+            return self._copy_on_write(deep_sheet_indexes, metadata_sheet_indexes, deep_column_ids)
+
         return State(
-            [df.copy(deep=index in deep_sheet_indexes) for index, df in enumerate(self.dfs)],
+            self._copy_dfs(deep_sheet_indexes, deep_column_ids),
             self.public_interface_version,
             df_names=deepcopy(self.df_names),
             df_sources=deepcopy(self.df_sources),
@@ -168,6 +241,71 @@ class State:
             user_defined_editors=deepcopy(self.user_defined_editors),
         )
 
+    def _copy_on_write(
+            self,
+            deep_sheet_indexes: Union[List[int], Set[int]],
+            metadata_sheet_indexes: Union[List[int], Set[int]],
+            deep_column_ids: Optional[Collection[ColumnID]]
+        ) -> "State":
+        """
+        Helper function for State.copy that structurally shares all per-sheet
+        metadata except for the sheets in metadata_sheet_indexes.
+
+        The outer lists are always new lists, so that sheets can be added or
+        removed from the copy without effecting this state. The graph data and
+        user defined functions are shared as well, as they are only ever changed
+        by steps that do a full copy of the state.
+        """
+        return State(
+            self._copy_dfs(deep_sheet_indexes, deep_column_ids),
+            self.public_interface_version,
+            df_names=list(self.df_names),
+            df_sources=list(self.df_sources),
+            column_ids=self.column_ids.copy(metadata_sheet_indexes),
+            column_formulas=[
+                deepcopy(column_formulas) if sheet_index in metadata_sheet_indexes else column_formulas
+                for sheet_index, column_formulas in enumerate(self.column_formulas)
+            ],
+            column_filters=[
+                deepcopy(column_filters) if sheet_index in metadata_sheet_indexes else column_filters
+                for sheet_index, column_filters in enumerate(self.column_filters)
+            ],
+            df_formats=[
+                deepcopy(df_format) if sheet_index in metadata_sheet_indexes else df_format
+                for sheet_index, df_format in enumerate(self.df_formats)
+            ],
+            graph_data_array=list(self.graph_data_array),
+            user_defined_functions=list(self.user_defined_functions),
+            user_defined_importers=list(self.user_defined_importers),
+            user_defined_editors=list(self.user_defined_editors),
+        )
+
+    def _copy_dfs(
+            self,
+            deep_sheet_indexes: Union[List[int], Set[int]],
+            deep_column_ids: Optional[Collection[ColumnID]]
+        ) -> List[pd.DataFrame]:
+        """
+        Helper function for State.copy that copies the dataframes, only
+        copying the data of deep_column_ids if they are passed.
+        """
+        new_dfs = []
+        for sheet_index, df in enumerate(self.dfs):
+            if sheet_index not in deep_sheet_indexes:
+                new_dfs.append(df.copy(deep=False))
+            elif deep_column_ids is None:
+                new_dfs.append(df.copy(deep=True))
+            else:
+                new_df = df.copy(deep=False)
+                column_id_to_column_header = self.column_ids.get_column_ids_map(sheet_index)
+                column_headers = [column_id_to_column_header[column_id] for column_id in deep_column_ids if column_id in column_id_to_column_header]
+                for column_index, column_header in enumerate(df.columns):
+                    if column_header in column_headers:
+                        # NOTE: isetitem always sets a new array, rather than writing into the shared one
+                        new_df.isetitem(column_index, df.iloc[:, column_index].copy())
+                new_dfs.append(new_df)
+        return new_dfs
+
     def add_df_to_state(
         self,
         new_df: pd.DataFrame,
@@ -185,6 +323,9 @@ class State:
         that is currently at the index. Otherwise, if sheet_index is
         not defined, then will append the df to the end of the state
         """
+        # States with evicted dataframes return a new list from dfs, so adding to it would do nothing
+        assert not self.has_evicted_dfs, 'Cannot add a dataframe to a state with evicted dataframes'
+
         if overwrite is None:
             # Update dfs by appending new df
             self.dfs.append(new_df)
@@ -290,11 +431,98 @@ class State:
         return new_column_ids
 
 
+    def rename_columns_in_column_formulas(self, sheet_index: int, renamed_column_headers: Dict[ColumnHeader, ColumnHeader]) -> None:
+        """
+        Column formulas reference columns by their header, so when columns in the sheet at
+        sheet_index are renamed, this renames them in the formulas that reference them. These
+        are the formulas in the sheet, and the formulas in other sheets that reference the 
+        sheet with {SHEET}!{HEADER}:{HEADER}.
+
+        Formulas that are shared with other states are replaced rather than mutated.
+        """
+        renamed_display_column_headers = {
+            get_column_header_display(old_column_header): get_column_header_display(new_column_header)
+            for old_column_header, new_column_header in renamed_column_headers.items()
+        }
+        if len(renamed_display_column_headers) == 0:
+            return
+
+        def get_renamed_frontend_formula(frontend_formula: FrontendFormula, formula_sheet_index: int) -> FrontendFormula:
+            renamed_frontend_formula: FrontendFormula = []
+            # The number of parts left that reference columns in another sheet, and that sheet
+            num_other_sheet_parts_left = 0
+            references_renamed_sheet = False
+            for formula_part in frontend_formula:
+                if formula_part['type'] == '{SHEET}':
+                    # The sheet is followed by !, and the range of columns in the sheet
+                    num_other_sheet_parts_left = 4
+                    references_renamed_sheet = formula_part['display_sheet_name'] == self.df_names[sheet_index] # type: ignore
+                    renamed_frontend_formula.append(formula_part)
+                    continue
+
+                is_in_renamed_sheet = references_renamed_sheet if num_other_sheet_parts_left > 0 else formula_sheet_index == sheet_index
+                num_other_sheet_parts_left = max(num_other_sheet_parts_left - 1, 0)
+
+                if formula_part['type'] != 'string part' and is_in_renamed_sheet and formula_part['display_column_header'] in renamed_display_column_headers: # type: ignore
+                    formula_part = {**formula_part, 'display_column_header': renamed_display_column_headers[formula_part['display_column_header']]} # type: ignore
+                renamed_frontend_formula.append(formula_part)
+
+            return renamed_frontend_formula
+
+        for formula_sheet_index, column_formulas in enumerate(self.column_formulas):
+            renamed_column_formulas: Dict[ColumnID, List[FrontendFormulaAndLocation]] = {}
+            for column_id, formulas in column_formulas.items():
+                renamed_formulas: List[FrontendFormulaAndLocation] = [
+                    {**formula, 'frontend_formula': get_renamed_frontend_formula(formula['frontend_formula'], formula_sheet_index)} # type: ignore
+                    for formula in formulas
+                ]
+                if renamed_formulas != formulas:
+                    renamed_column_formulas[column_id] = renamed_formulas
+
+            if len(renamed_column_formulas) > 0:
+                self.column_formulas[formula_sheet_index] = {**column_formulas, **renamed_column_formulas}
+
+    def get_sheet_indexes_with_formulas_referencing(self, sheet_indexes: Collection[int]) -> Set[int]:
+        """
+        Returns the indexes of the other sheets that have formulas that reference any of
+        the sheets at sheet_indexes with {SHEET}!{HEADER}:{HEADER}. When columns in these
+        sheets are renamed, the formulas in these other sheets are renamed too.
+        """
+        df_names = {self.df_names[sheet_index] for sheet_index in sheet_indexes if self.does_sheet_index_exist_within_state(sheet_index)}
+        if len(df_names) == 0:
+            return set()
+
+        return {
+            formula_sheet_index
+            for formula_sheet_index, column_formulas in enumerate(self.column_formulas)
+            if formula_sheet_index not in sheet_indexes and any(
+                formula_part['type'] == '{SHEET}' and formula_part['display_sheet_name'] in df_names # type: ignore
+                for formulas in column_formulas.values()
+                for formula in formulas
+                for formula_part in formula['frontend_formula']
+            )
+        }
+
+    def set_sheet_from_state(self, other_state: "State", sheet_index: int) -> None:
+        """
+        Helper function for replacing the dataframe at sheet_index, and all of
+        its metadata, with the same sheet from other_state. The metadata is shared
+        with the other_state, and so must be copied before it is mutated.
+        """
+        assert not self.has_evicted_dfs, 'Cannot set a sheet in a state with evicted dataframes'
+        self.dfs[sheet_index] = other_state.get_df(sheet_index).copy(deep=False)
+        self.df_names[sheet_index] = other_state.df_names[sheet_index]
+        self.df_sources[sheet_index] = other_state.df_sources[sheet_index]
+        self.column_ids.set_sheet_from_column_id_map(other_state.column_ids, sheet_index)
+        self.column_formulas[sheet_index] = other_state.column_formulas[sheet_index]
+        self.column_filters[sheet_index] = other_state.column_filters[sheet_index]
+        self.df_formats[sheet_index] = other_state.df_formats[sheet_index]
+
     def does_sheet_index_exist_within_state(self, sheet_index: int) -> bool:
         """
         Returns true iff a sheet_index exists within this state
         """
-        return not (sheet_index < 0 or sheet_index >= len(self.dfs))
+        return not (sheet_index < 0 or sheet_index >= self.num_sheets)
 
     def move_to_deprecated_id_algorithm(self) -> None:
         """
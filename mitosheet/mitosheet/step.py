@@ -4,15 +4,17 @@
 # Copyright (c) Saga Inc.
 # Distributed under the terms of the GPL License.
 
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 import json
 from mitosheet.code_chunks.code_chunk import CodeChunk
+from mitosheet.performance_profile import EXECUTE_SPAN, SATURATE_SPAN, STEP_SPAN, performance_profiler
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.step_performers.column_steps.set_column_formula import SetColumnFormulaStepPerformer
 from mitosheet.step_performers.filter import FilterStepPerformer
 from mitosheet.state import State
 from mitosheet.step_performers import STEP_TYPE_TO_STEP_PERFORMER
 from mitosheet.types import FORMULA_SPECIFIC_INDEX_LABELS_TYPE, ColumnHeader, ColumnID, FORMULA_ENTIRE_COLUMN_TYPE
+from mitosheet.utils import get_new_id
 
 
 class Step:
@@ -64,11 +66,24 @@ class Step:
         # work if it has already been done. See simple_import for an example
         self.execution_data = execution_data if execution_data is not None else {}
 
+        # Each sheet in the post_state has a fingerprint, which changes whenever a step
+        # modifies that sheet. We also store the fingerprints of the sheets this step read
+        # when it executed, so that we can tell if we can reuse this execution on replay
+        self.sheet_fingerprints: Optional[Tuple[str, ...]] = None
+        self.read_sheet_fingerprints: Optional[Tuple[int, Tuple[str, ...]]] = None
+
+        # The code chunks this step transpiles to, which are cached until the step
+        # is executed again, as they only depend on the prev_state, params, and execution_data
+        self._code_chunks: Optional[Tuple[CodeChunk, ...]] = None
 
     @property
     def dfs(self):
         return self.post_state.dfs
 
+    @property
+    def num_sheets(self):
+        return self.post_state.num_sheets
+
     @property
     def df_names(self):
         return self.post_state.df_names
@@ -131,7 +146,104 @@ class Step:
         return self.post_state if self.post_state is not None else \
             (self.prev_state if self.prev_state is not None else State([], 1))
 
-    def set_prev_state_and_execute(self, new_prev_state: State, previous_steps: List["Step"]) -> bool:
+    def get_sheet_fingerprints(self) -> Tuple[str, ...]:
+        """
+        Returns the fingerprints of the sheets in the final defined state
+        of this step. Steps that were not executed through a replay (e.g. the
+        initialize step) get new fingerprints the first time this is called.
+        """
+        if self.sheet_fingerprints is None or len(self.sheet_fingerprints) != self.final_defined_state.num_sheets:
+            self.sheet_fingerprints = tuple(get_new_id() for _ in range(self.final_defined_state.num_sheets))
+        return self.sheet_fingerprints
+
+    def get_code_chunks(self) -> List[CodeChunk]:
+        """
+        Returns the unoptimized code chunks that this step transpiles to. These are
+        cached, so transpiling an analysis only transpiles the steps that changed.
+        """
+        if self._code_chunks is None:
+            self._code_chunks = tuple(self.step_performer.transpile(
+                self.prev_state, # type: ignore
+                self.params,
+                self.execution_data,
+            ))
+        return list(self._code_chunks)
+
+    def get_read_dataframe_indexes(self, params: Dict[str, Any], prev_state: State) -> Optional[Set[int]]:
+        """
+        Returns the sheets that this step reads with these params when executed on the 
+        prev_state, or None if the step might read anything. 
+        
+        Renaming columns in the sheets this step modifies also renames them in the formulas
+        in other sheets that reference these sheets, and so the step reads (and might modify)
+        these other sheets too.
+        """
+        read_dataframe_indexes = self.step_performer.get_read_dataframe_indexes(params)
+        if read_dataframe_indexes is None:
+            return None
+
+        modified_dataframe_indexes = self.step_performer.get_modified_dataframe_indexes(params)
+        return read_dataframe_indexes | prev_state.get_sheet_indexes_with_formulas_referencing(modified_dataframe_indexes)
+
+    def _get_read_sheet_fingerprints(self, params: Dict[str, Any], prev_state: State, prev_sheet_fingerprints: Tuple[str, ...]) -> Optional[Tuple[int, Tuple[str, ...]]]:
+        """
+        Returns the number of sheets and the fingerprints of the sheets that this step
+        reads with these params, or None if the step might read anything.
+        """
+        read_dataframe_indexes = self.get_read_dataframe_indexes(params, prev_state)
+        if read_dataframe_indexes is None or any(index < 0 or index >= len(prev_sheet_fingerprints) for index in read_dataframe_indexes):
+            return None
+        
+        return (len(prev_sheet_fingerprints), tuple(prev_sheet_fingerprints[index] for index in sorted(read_dataframe_indexes)))
+
+    def set_prev_state_from_cached_step(self, cached_step: "Step", new_prev_state: State, prev_sheet_fingerprints: Tuple[str, ...]) -> bool:
+        """
+        Tries to change the prev_state of this step without reexecuting it, by reusing
+        the execution of the cached_step, which has the same params. This is possible
+        if none of the sheets the cached step read have changed since it last executed,
+        and the step only modifies existing sheets.
+
+        Returns True if the cached execution was reused. If it returns False, this 
+        step is not changed and must be executed with set_prev_state_and_execute.
+        """
+        if cached_step.post_state is None or cached_step.read_sheet_fingerprints is None or cached_step.sheet_fingerprints is None:
+            return False
+
+        modified_dataframe_indexes = self.step_performer.get_modified_dataframe_indexes(cached_step.params)
+        if len(modified_dataframe_indexes) == 0 or -1 in modified_dataframe_indexes:
+            return False
+
+        if cached_step.post_state.num_sheets != new_prev_state.num_sheets or len(prev_sheet_fingerprints) != new_prev_state.num_sheets:
+            return False
+        
+        if self._get_read_sheet_fingerprints(cached_step.params, new_prev_state, prev_sheet_fingerprints) != cached_step.read_sheet_fingerprints:
+            return False
+
+        # Take the sheets this step modified from the cached execution, and everything else from the new prev_state
+        new_post_state = new_prev_state.copy(metadata_sheet_indexes=set())
+        sheet_fingerprints = list(prev_sheet_fingerprints)
+        for sheet_index in modified_dataframe_indexes:
+            new_post_state.set_sheet_from_state(cached_step.post_state, sheet_index)
+            sheet_fingerprints[sheet_index] = cached_step.sheet_fingerprints[sheet_index]
+
+        # As well as the formulas in the other sheets it read that it renamed columns in, 
+        # which are the sheets the cached execution gave a new fingerprint
+        for sheet_index in self.get_read_dataframe_indexes(cached_step.params, new_prev_state) or set():
+            if sheet_index not in modified_dataframe_indexes and cached_step.sheet_fingerprints[sheet_index] != prev_sheet_fingerprints[sheet_index]:
+                new_post_state.column_formulas[sheet_index] = cached_step.post_state.column_formulas[sheet_index]
+                sheet_fingerprints[sheet_index] = cached_step.sheet_fingerprints[sheet_index]
+
+        self.prev_state = new_prev_state
+        self.post_state = new_post_state
+        self.execution_data = cached_step.execution_data
+        self.params = cached_step.params
+        self._code_chunks = None
+        self.sheet_fingerprints = tuple(sheet_fingerprints)
+        self.read_sheet_fingerprints = cached_step.read_sheet_fingerprints
+
+        return True
+
+    def set_prev_state_and_execute(self, new_prev_state: State, previous_steps: List["Step"], prev_sheet_fingerprints: Optional[Tuple[str, ...]]=None) -> bool:
         """
         Changes the prev_state of this step, which in turns triggers
         a reexecution with the same parameters. 
@@ -142,16 +254,23 @@ class Step:
         NOTE: this is the only function you should use to get a step
         to execute!
 
+        If the prev_sheet_fingerprints of the new_prev_state are passed, then
+        the step records which sheets it read and modified, so that this 
+        execution can be reused on replay. 
+
         Returns True if the step returns a new post_state, meaning an
         execution actually occured.
         """        
         # Saturate the event to get up to date parameters
         # TODO: this should fill in the execution data - hopefully
         # we can get all of it without executing. I think we probably can
-        params = self.step_performer.saturate(new_prev_state, self.params, previous_steps)
+        with performance_profiler.span(STEP_SPAN, self.step_id, self.step_type):
+            with performance_profiler.span(SATURATE_SPAN):
+                params = self.step_performer.saturate(new_prev_state, self.params, previous_steps)
 
-        # Actually execute the data transformation
-        post_state_and_execution_data = self.step_performer.execute(new_prev_state, params)
+            # Actually execute the data transformation
+            with performance_profiler.span(EXECUTE_SPAN):
+                post_state_and_execution_data = self.step_performer.execute(new_prev_state, params)
 
         if post_state_and_execution_data is not None:
             # If we don't get anything new back, then we just make this
@@ -169,52 +288,88 @@ class Step:
         self.post_state = new_post_state
         self.execution_data = execution_data if execution_data is not None else {}
         self.params = params
+        self._code_chunks = None
+        self._set_sheet_fingerprints(prev_sheet_fingerprints, post_state_and_execution_data is not None)
 
         return post_state_and_execution_data is not None
+
+    def _set_sheet_fingerprints(self, prev_sheet_fingerprints: Optional[Tuple[str, ...]], executed: bool) -> None:
+        """
+        After an execution, gives every sheet this step modified a new fingerprint, 
+        and keeps the fingerprints of the sheets it did not modify.
+        """
+        if prev_sheet_fingerprints is None:
+            self.sheet_fingerprints = None
+            self.read_sheet_fingerprints = None
+            return
+
+        self.read_sheet_fingerprints = self._get_read_sheet_fingerprints(self.params, self.prev_state, prev_sheet_fingerprints) # type: ignore
+
+        if not executed:
+            self.sheet_fingerprints = prev_sheet_fingerprints
+            return
+
+        num_sheets = self.final_defined_state.num_sheets
+        modified_dataframe_indexes = self.step_performer.get_modified_dataframe_indexes(self.params)
+
+        # If every sheet was modified, or sheets were removed and so the indexes shifted, then all sheets change
+        if len(modified_dataframe_indexes) == 0 or num_sheets < len(prev_sheet_fingerprints):
+            self.sheet_fingerprints = tuple(get_new_id() for _ in range(num_sheets))
+            return
+
+        sheet_fingerprints = list(prev_sheet_fingerprints) + [get_new_id() for _ in range(len(prev_sheet_fingerprints), num_sheets)]
+        for sheet_index in modified_dataframe_indexes:
+            if 0 <= sheet_index < num_sheets:
+                sheet_fingerprints[sheet_index] = get_new_id()
+
+        # Renaming columns replaces the formulas in the other sheets that reference them, 
+        # and so these other sheets are modified too
+        for sheet_index in self.prev_state.get_sheet_indexes_with_formulas_referencing(modified_dataframe_indexes): # type: ignore
+            if self.post_state.column_formulas[sheet_index] is not self.prev_state.column_formulas[sheet_index]: # type: ignore
+                sheet_fingerprints[sheet_index] = get_new_id()
+        self.sheet_fingerprints = tuple(sheet_fingerprints)
     
 
-    def step_indexes_to_skip(self, all_steps_before_this_step: List['Step']) -> Set[int]:
+    @property
+    def skip_keys(self) -> List[Tuple[Any, ...]]:
+        """
+        A step skips every step before it that shares a skip key with it. 
+        See skips_previous_step for more details.
+        """
+        skip_keys: List[Tuple[Any, ...]] = [('step_id', self.step_id)]
+        if self.step_type == FilterStepPerformer.step_type():
+            skip_keys.append(('filter', self.params['sheet_index'], self.params['column_id']))
+        return skip_keys
+
+    def skips_previous_step(self, previous_step: 'Step') -> bool:
         """
-        Given the steps that come before it, any step has the ability
-        to skip these steps. 
+        Given the step that comes directly before it, returns true if 
+        this step skips it. 
 
         Currently, a step only skips the steps before it if:
         1. This step is a filter step that is trying to replace an older filter step
         2. This step has the same id as any step before it (like for pivot tables)
         3. This step is a formula step overwriting the step that came just before it AND they both set the entire column
         4. This step is a formula step overwriting the step that came just before it AND they both set the same indexes
-        """
-
-        step_indexes_to_skip = set()
 
-        for step_index, step in enumerate(all_steps_before_this_step):
-            # Check (1)
-            if step.step_type == FilterStepPerformer.step_type() and self.step_type == FilterStepPerformer.step_type():
-                if step.params['sheet_index'] == self.params['sheet_index'] \
-                    and step.params['column_id'] == self.params['column_id']:
-                   step_indexes_to_skip.add(step_index) 
+        Checks (1) and (2) apply to any step before this step, and so are handled with 
+        the skip_keys, which lets us find all skipped steps in a single pass. See 
+        get_step_indexes_to_skip in the steps manager.
+        """
+        # Check (3) and (4)
+        if self.step_type == SetColumnFormulaStepPerformer.step_type() and previous_step.step_type == SetColumnFormulaStepPerformer.step_type():
+            both_entire_column = self.params['index_labels_formula_is_applied_to']['type'] == FORMULA_ENTIRE_COLUMN_TYPE and previous_step.params['index_labels_formula_is_applied_to']['type'] == FORMULA_ENTIRE_COLUMN_TYPE
+            same_indexes = (
+                self.params['index_labels_formula_is_applied_to']['type'] == FORMULA_SPECIFIC_INDEX_LABELS_TYPE and previous_step.params['index_labels_formula_is_applied_to']['type'] == FORMULA_SPECIFIC_INDEX_LABELS_TYPE \
+                and self.params['index_labels_formula_is_applied_to']['index_labels'] == previous_step.params['index_labels_formula_is_applied_to']['index_labels']
+            )
             
-            # Check (2)
-            elif step.step_id == self.step_id:
-                step_indexes_to_skip.add(step_index)
+            if (both_entire_column or same_indexes) \
+                and self.params['sheet_index'] == previous_step.params['sheet_index'] \
+                and self.params['column_id'] == previous_step.params['column_id']:
+                return True
 
-        if len(all_steps_before_this_step) > 0:
-            previous_step: Step = all_steps_before_this_step[-1]
-            
-            # Check (3) and (4)
-            if self.step_type == SetColumnFormulaStepPerformer.step_type() and previous_step.step_type == SetColumnFormulaStepPerformer.step_type():
-                both_entire_column = self.params['index_labels_formula_is_applied_to']['type'] == FORMULA_ENTIRE_COLUMN_TYPE and previous_step.params['index_labels_formula_is_applied_to']['type'] == FORMULA_ENTIRE_COLUMN_TYPE
-                same_indexes = (
-                    self.params['index_labels_formula_is_applied_to']['type'] == FORMULA_SPECIFIC_INDEX_LABELS_TYPE and previous_step.params['index_labels_formula_is_applied_to']['type'] == FORMULA_SPECIFIC_INDEX_LABELS_TYPE \
-                    and self.params['index_labels_formula_is_applied_to']['index_labels'] == previous_step.params['index_labels_formula_is_applied_to']['index_labels']
-                )
-                
-                if (both_entire_column or same_indexes) \
-                    and self.params['sheet_index'] == previous_step.params['sheet_index'] \
-                    and self.params['column_id'] == previous_step.params['column_id']:
-                    step_indexes_to_skip.add(len(all_steps_before_this_step) - 1)
-
-        return step_indexes_to_skip
+        return False
 
     def get_column_headers_by_ids(self, sheet_index: int, column_ids: List[ColumnID]) -> List[Any]:
         """
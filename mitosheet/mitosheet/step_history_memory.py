@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+
+"""
+Every step in the StepsManager holds the state that it creates, and so a long
+analysis on a large dataframe can end up holding many versions of that dataframe
+in memory at once.
+
+To bound this memory, the StepsManager can be given a memory budget. After the
+steps are updated, the StepHistoryMemoryManager evicts the least recently used
+versions of the dataframes in the step history until the history fits in the budget.
+
+Versions of a dataframe are identified by the sheet fingerprints of the steps that
+hold them (see Step.get_sheet_fingerprints). When a version is evicted:
+1.  If it is in the post_state of a checkpoint step, which is every checkpoint_interval
+    steps, it is spilled to a temporary directory on disk.
+2.  Otherwise, it is dropped, and is recomputed by reexecuting the step that created
+    it. As every checkpoint is kept on disk, this reexecutes at most checkpoint_interval
+    steps back to the nearest checkpoint.
+
+Evicted dataframes are re-materialized when they are read from State.dfs, so the rest
+of the codebase does not need to know about any of this. For states with evicted 
+dataframes, State.dfs is a lazy list that only loads the dataframes that are indexed,
+and code that only needs the column headers and dtypes of a sheet (e.g. transpiling
+the step history) should use State.get_df_header, which never loads a dataframe.
+"""
+
+import os
+import shutil
+import tempfile
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union, overload
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from mitosheet.state import State
+    from mitosheet.step import Step
+
+# By default, we keep every 10th step's state on disk when it is evicted
+DEFAULT_CHECKPOINT_INTERVAL = 10
+
+# The number of re-materialized dataframes we keep in memory, so that reading the
+# same evicted dataframe many times in a row (e.g. in the transpiler) is fast
+NUM_RECENTLY_LOADED_DATAFRAMES = 8
+
+
+class DataframeHeader:
+    """
+    The column headers, dtypes, and index of a dataframe. The index is None
+    if the dataframe was evicted, and its index is no longer in memory.
+    """
+
+    def __init__(self, columns: pd.Index, dtypes: pd.Series, index: Optional[pd.Index]):
+        self.columns = columns
+        self.dtypes = dtypes
+        self.index = index
+
+    def get_column_dtype(self, column_header: Any) -> Any:
+        return self.dtypes.iloc[self.columns.get_loc(column_header)]
+
+
+def get_dataframe_header(df: pd.DataFrame) -> DataframeHeader:
+    return DataframeHeader(df.columns, df.dtypes, df.index)
+
+
+class EvictedDataframe(ABC):
+    """
+    A dataframe that has been evicted from the states in the step history,
+    and that can be loaded back into memory when it is needed.
+    """
+
+    def __init__(self, memory_manager: "StepHistoryMemoryManager", fingerprint: str, df: pd.DataFrame):
+        self.memory_manager = memory_manager
+        self.fingerprint = fingerprint
+        # We keep a weak reference to the loaded dataframe, so that all the states
+        # that share this dataframe also share the loaded copy of it
+        self._loaded_df_ref: Optional["weakref.ref[pd.DataFrame]"] = None
+
+        # We keep the column headers and dtypes, so that they can be read without loading
+        # the dataframe. The index is usually shared with other versions of the dataframe
+        # that are in memory, so we only keep a weak reference to it, unless it is a RangeIndex
+        self.columns = df.columns
+        self.dtypes = df.dtypes
+        self._range_index: Optional[pd.RangeIndex] = df.index if isinstance(df.index, pd.RangeIndex) else None
+        self._index_ref: Optional["weakref.ref[pd.Index]"] = weakref.ref(df.index) if self._range_index is None else None
+
+    def get_header(self) -> DataframeHeader:
+        index = self._range_index if self._index_ref is None else self._index_ref()
+        return DataframeHeader(self.columns, self.dtypes, index)
+
+    def load(self) -> pd.DataFrame:
+        df = self._loaded_df_ref() if self._loaded_df_ref is not None else None
+        if df is None:
+            df = self._read()
+            self._loaded_df_ref = weakref.ref(df)
+
+        self.memory_manager.mark_used(self.fingerprint, df)
+        return df
+
+    @abstractmethod
+    def _read(self) -> pd.DataFrame:
+        pass
+
+
+class SpilledDataframe(EvictedDataframe):
+    """
+    A dataframe that has been written to the spill directory. The file
+    is removed once no state in the step history refers to it.
+
+    NOTE: we use pickle rather than Parquet, as it round trips every
+    dataframe exactly, including non-string and multi-index column headers.
+    """
+
+    def __init__(self, memory_manager: "StepHistoryMemoryManager", fingerprint: str, df: pd.DataFrame):
+        super().__init__(memory_manager, fingerprint, df)
+        self.path = os.path.join(memory_manager.spill_directory, f'{fingerprint}.pkl')
+        df.to_pickle(self.path)
+        weakref.finalize(self, _remove_file, self.path)
+
+    def _read(self) -> pd.DataFrame:
+        return pd.read_pickle(self.path)
+
+
+class RecomputedDataframe(EvictedDataframe):
+    """
+    A dataframe that has been dropped from memory, and is recomputed by
+    reexecuting the step that created it from that step's prev_state.
+    """
+
+    def __init__(self, memory_manager: "StepHistoryMemoryManager", fingerprint: str, df: pd.DataFrame, step: "Step", sheet_index: int):
+        super().__init__(memory_manager, fingerprint, df)
+        self.step = step
+        self.sheet_index = sheet_index
+
+    def _read(self) -> pd.DataFrame:
+        prev_state: "State" = self.step.prev_state # type: ignore
+        post_state_and_execution_data = self.step.step_performer.execute(prev_state, self.step.params)
+        post_state = post_state_and_execution_data[0] if post_state_and_execution_data is not None else prev_state
+        return post_state.get_df(self.sheet_index)
+
+
+class LazyDataframes(Sequence[pd.DataFrame]):
+    """
+    The dataframes in a state with evicted dataframes, which only loads the 
+    evicted dataframes that are indexed. This is read only, as states with 
+    evicted dataframes are only in the step history, and so are never changed.
+    """
+
+    def __init__(self, dfs: List[Union[pd.DataFrame, EvictedDataframe]]):
+        self._dfs = dfs
+
+    def __len__(self) -> int:
+        return len(self._dfs)
+
+    @overload
+    def __getitem__(self, sheet_index: int) -> pd.DataFrame: ...
+    @overload
+    def __getitem__(self, sheet_index: slice) -> List[pd.DataFrame]: ...
+    def __getitem__(self, sheet_index: Union[int, slice]) -> Union[pd.DataFrame, List[pd.DataFrame]]:
+        if isinstance(sheet_index, slice):
+            return [self[i] for i in range(len(self._dfs))[sheet_index]]
+
+        df = self._dfs[sheet_index]
+        return df.load() if isinstance(df, EvictedDataframe) else df
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for sheet_index in range(len(self._dfs)):
+            yield self[sheet_index]
+
+    def get_header(self, sheet_index: int) -> DataframeHeader:
+        df = self._dfs[sheet_index]
+        return df.get_header() if isinstance(df, EvictedDataframe) else get_dataframe_header(df)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def can_recompute_sheets_created_by_step(step: "Step") -> bool:
+    """
+    Returns True if we can recreate the sheets that this step modified by reexecuting
+    it. This is only the case for steps that just transform the sheets they read,
+    rather than e.g. importing data that might have changed since.
+    """
+    if step.prev_state is None or step.post_state is None:
+        return False
+
+    modified_dataframe_indexes = step.step_performer.get_modified_dataframe_indexes(step.params)
+    if len(modified_dataframe_indexes) == 0 or -1 in modified_dataframe_indexes:
+        return False
+
+    return step.step_performer.get_read_dataframe_indexes(step.params) is not None
+
+
+class StepHistoryMemoryManager:
+    """
+    Keeps the memory used by the dataframes in the step history under
+    the memory_budget, which is in bytes. See the top of this file.
+    """
+
+    def __init__(self, memory_budget: int, checkpoint_interval: int=DEFAULT_CHECKPOINT_INTERVAL):
+        self.memory_budget = memory_budget
+        self.checkpoint_interval = max(checkpoint_interval, 1)
+
+        self._spill_directory: Optional[str] = None
+
+        # The dataframes we have evicted, by fingerprint, so that we only evict each version
+        # once. This is weak so that the files are cleaned up once no state uses them
+        self.evicted_dataframes: "weakref.WeakValueDictionary[str, EvictedDataframe]" = weakref.WeakValueDictionary()
+
+        # The memory usage of each version, and when it was last used, by fingerprint
+        self.memory_usage: Dict[str, int] = {}
+        self.last_used: Dict[str, int] = {}
+        self.use_count = 0
+
+        self.recently_loaded_dataframes: Deque[pd.DataFrame] = deque(maxlen=NUM_RECENTLY_LOADED_DATAFRAMES)
+
+    @property
+    def spill_directory(self) -> str:
+        if self._spill_directory is None:
+            self._spill_directory = tempfile.mkdtemp(prefix='mito-step-history-')
+            weakref.finalize(self, shutil.rmtree, self._spill_directory, True)
+        return self._spill_directory
+
+    def mark_used(self, fingerprint: str, loaded_df: Optional[pd.DataFrame]=None) -> None:
+        self.use_count += 1
+        self.last_used[fingerprint] = self.use_count
+        if loaded_df is not None:
+            self.recently_loaded_dataframes.append(loaded_df)
+
+    def get_memory_usage(self) -> int:
+        """
+        Returns the memory used by the versions of dataframes that were in memory
+        the last time the memory budget was enforced.
+        """
+        return sum(self.memory_usage.values())
+
+    def enforce_memory_budget(self, steps: List["Step"], curr_step: "Step") -> None:
+        """
+        Evicts the least recently used versions of the dataframes held by these steps
+        until they fit in the memory budget. The dataframes in the curr_step are never
+        evicted, and are loaded back into memory if they were evicted previously.
+        """
+        # Find all the states that hold each version of a dataframe, and the first step
+        # that holds it, which is the step that created it
+        holders: Dict[str, List[Tuple["State", int]]] = {}
+        creators: Dict[str, Tuple["Step", int]] = {}
+        checkpointed_fingerprints: Set[str] = set()
+        seen_step_ids: Set[int] = set()
+
+        for step_index, step in enumerate(steps):
+            if id(step) in seen_step_ids or step.post_state is None:
+                continue
+            seen_step_ids.add(id(step))
+
+            for sheet_index, fingerprint in enumerate(step.get_sheet_fingerprints()):
+                holders.setdefault(fingerprint, []).append((step.post_state, sheet_index))
+                creators.setdefault(fingerprint, (step, sheet_index))
+                if step_index % self.checkpoint_interval == 0:
+                    checkpointed_fingerprints.add(fingerprint)
+
+        # The curr step is always in memory, and is the most recently used
+        curr_step.final_defined_state.restore_evicted_dfs()
+        pinned_fingerprints = set(curr_step.get_sheet_fingerprints())
+        for fingerprint in pinned_fingerprints:
+            self.mark_used(fingerprint)
+
+        in_memory_fingerprints: List[str] = []
+        for fingerprint, states in holders.items():
+            state_and_sheet_index = next(((state, sheet_index) for state, sheet_index in states if not state.is_df_evicted(sheet_index)), None)
+            if state_and_sheet_index is None:
+                continue
+
+            if fingerprint not in self.memory_usage:
+                state, sheet_index = state_and_sheet_index
+                self.memory_usage[fingerprint] = int(state.get_df(sheet_index).memory_usage(index=True, deep=True).sum())
+                self.mark_used(fingerprint)
+            in_memory_fingerprints.append(fingerprint)
+
+        # Forget about any versions that are no longer in memory
+        in_memory_fingerprints_set = set(in_memory_fingerprints)
+        self.memory_usage = {fingerprint: memory_usage for fingerprint, memory_usage in self.memory_usage.items() if fingerprint in in_memory_fingerprints_set}
+        self.last_used = {fingerprint: last_used for fingerprint, last_used in self.last_used.items() if fingerprint in holders}
+
+        total_memory_usage = self.get_memory_usage()
+        in_memory_fingerprints.sort(key=lambda fingerprint: self.last_used.get(fingerprint, 0))
+
+        for fingerprint in in_memory_fingerprints:
+            if total_memory_usage <= self.memory_budget:
+                break
+            if fingerprint in pinned_fingerprints:
+                continue
+
+            evicted_df = self._get_evicted_dataframe(fingerprint, holders[fingerprint], creators[fingerprint], fingerprint in checkpointed_fingerprints)
+            for state, sheet_index in holders[fingerprint]:
+                state.evict_df(sheet_index, evicted_df)
+
+            total_memory_usage -= self.memory_usage.pop(fingerprint)
+
+        # Make sure we don't keep any evicted dataframes in memory
+        self.recently_loaded_dataframes.clear()
+
+    def _get_evicted_dataframe(
+            self,
+            fingerprint: str,
+            states: List[Tuple["State", int]],
+            creator: Tuple["Step", int],
+            checkpointed: bool
+        ) -> EvictedDataframe:
+        evicted_df: Any = self.evicted_dataframes.get(fingerprint)
+        if evicted_df is not None:
+            return evicted_df
+
+        creator_step, creator_sheet_index = creator
+        state, sheet_index = next((state, sheet_index) for state, sheet_index in states if not state.is_df_evicted(sheet_index))
+        df = state.get_df(sheet_index)
+        if not checkpointed and can_recompute_sheets_created_by_step(creator_step):
+            evicted_df = RecomputedDataframe(self, fingerprint, df, creator_step, creator_sheet_index)
+        else:
+            evicted_df = SpilledDataframe(self, fingerprint, df)
+
+        self.evicted_dataframes[fingerprint] = evicted_df
+        return evicted_df
@@ -55,6 +55,7 @@ from mitosheet.step_performers.replace import ReplaceStepPerformer
 from mitosheet.step_performers.replace import ReplaceStepPerformer
 from mitosheet.step_performers.replace import ReplaceStepPerformer
 from mitosheet.step_performers.user_defined_edit import UserDefinedEditStepPerformer
+from mitosheet.step_performers.column_steps.recalculate_dependents import RecalculateDependentsStepPerformer
 # AUTOGENERATED LINE: IMPORT (DO NOT DELETE)
 
 # All steps must be listed in this variable. Note the Type annotation allows for
@@ -101,6 +102,7 @@ STEP_PERFORMERS: List[Type[StepPerformer]] = [
     UserDefinedImportStepPerformer,
     ReplaceStepPerformer,
     UserDefinedEditStepPerformer,
+    RecalculateDependentsStepPerformer,
     # AUTOGENERATED LINE: EXPORT (DO NOT DELETE)
 ]
 
@@ -120,5 +120,7 @@ def rename_column_headers_in_state(
     pandas_start_time = perf_counter()
     post_state.column_ids.set_column_header(sheet_index, column_id, new_column_header)
     pandas_processing_time = perf_counter() - pandas_start_time
+
+    post_state.rename_columns_in_column_formulas(sheet_index, {old_column_header: new_column_header})
     
     return old_column_header, pandas_processing_time
\ No newline at end of file
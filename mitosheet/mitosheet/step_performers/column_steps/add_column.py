@@ -12,6 +12,7 @@ from mitosheet.column_headers import get_column_header_id
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.step_performers.utils.utils import get_param
+from mitosheet.types import ColumnID, ColumnReconData
 
 
 class AddColumnStepPerformer(StepPerformer):
@@ -71,4 +72,21 @@ class AddColumnStepPerformer(StepPerformer):
 
     @classmethod
     def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
+        return {get_param(params, 'sheet_index')}
+
+    @classmethod
+    def get_column_recon(cls, prev_state: State, params: Dict[str, Any], execution_data: Dict[str, Any]) -> Optional[ColumnReconData]:
+        return {
+            'created_columns': [get_param(params, 'column_header')],
+            'deleted_columns': [],
+            'modified_columns': [],
+            'renamed_columns': {},
+        }
+
+    @classmethod
+    def get_modified_column_ids(cls, params: Dict[str, Any]) -> Optional[Set[ColumnID]]:
+        return set()
+
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
         return {get_param(params, 'sheet_index')}
\ No newline at end of file
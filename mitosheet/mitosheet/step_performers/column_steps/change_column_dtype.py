@@ -106,4 +106,12 @@ class ChangeColumnDtypeStepPerformer(StepPerformer):
 
     @classmethod
     def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
+        return {get_param(params, 'sheet_index')}
+
+    @classmethod
+    def get_modified_column_ids(cls, params: Dict[str, Any]) -> Optional[Set[ColumnID]]:
+        return set(get_param(params, 'column_ids'))
+
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
         return {get_param(params, 'sheet_index')}
\ No newline at end of file
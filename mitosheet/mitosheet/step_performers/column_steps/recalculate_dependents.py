@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from mitosheet.code_chunks.code_chunk import CodeChunk
+from mitosheet.code_chunks.step_performers.column_steps.recalculate_dependents_code_chunk import \
+    RecalculateDependentsCodeChunk
+from mitosheet.code_chunks.step_performers.column_steps.set_column_formula_code_chunk import \
+    SetColumnFormulaCodeChunk
+from mitosheet.formula_dependency_graph import (
+    get_dependents_in_topological_order, get_formula_dependency_graph,
+    get_formula_label_for_recalculation)
+from mitosheet.parser import get_backend_formula_from_frontend_formula
+from mitosheet.state import State
+from mitosheet.step_performers.step_performer import StepPerformer
+from mitosheet.step_performers.utils.utils import get_param
+from mitosheet.types import ColumnID, ColumnReconData
+
+
+class RecalculateDependentsStepPerformer(StepPerformer):
+    """
+    A recalculate_dependents step, which recalculates the formulas of all the columns
+    that depend on a column, after the column changed. Only these formulas are run
+    again, in an order where each formula is run after the formulas it references.
+    """
+
+    @classmethod
+    def step_version(cls) -> int:
+        return 1
+
+    @classmethod
+    def step_type(cls) -> str:
+        return 'recalculate_dependents'
+
+    @classmethod
+    def execute(cls, prev_state: State, params: Dict[str, Any]) -> Tuple[State, Optional[Dict[str, Any]]]:
+        sheet_index: int = get_param(params, 'sheet_index')
+        column_id: ColumnID = get_param(params, 'column_id')
+
+        graph = get_formula_dependency_graph(prev_state, sheet_index)
+        dependent_column_ids = get_dependents_in_topological_order(graph, column_id)
+
+        return cls.execute_through_transpile(
+            prev_state,
+            params,
+            {'dependent_column_ids': dependent_column_ids}
+        )
+
+    @classmethod
+    def transpile(
+        cls,
+        prev_state: State,
+        params: Dict[str, Any],
+        execution_data: Optional[Dict[str, Any]],
+    ) -> List[CodeChunk]:
+        sheet_index: int = get_param(params, 'sheet_index')
+        column_id: ColumnID = get_param(params, 'column_id')
+        dependent_column_ids: List[ColumnID] = execution_data['dependent_column_ids'] if execution_data is not None else []
+        index = prev_state.dfs[sheet_index].index
+
+        set_column_formula_code_chunks: List[SetColumnFormulaCodeChunk] = []
+        for dependent_column_id in dependent_column_ids:
+            # Columns with formulas on specific rows have a formula for each of these rows
+            for formula in prev_state.column_formulas[sheet_index][dependent_column_id]:
+                formula_label = get_formula_label_for_recalculation(index, formula['frontend_formula'])
+                if formula_label is None:
+                    continue
+
+                set_column_formula_code_chunks.append(SetColumnFormulaCodeChunk(
+                    prev_state,
+                    sheet_index,
+                    dependent_column_id,
+                    formula_label,
+                    formula['location'],
+                    get_backend_formula_from_frontend_formula(formula['frontend_formula'], formula_label, prev_state.dfs[sheet_index]),
+                    prev_state.public_interface_version
+                ))
+
+        return [
+            RecalculateDependentsCodeChunk(prev_state, sheet_index, column_id, set_column_formula_code_chunks)
+        ]
+
+    @classmethod
+    def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
+        return {get_param(params, 'sheet_index')}
+
+    @classmethod
+    def get_column_recon(cls, prev_state: State, params: Dict[str, Any], execution_data: Dict[str, Any]) -> Optional[ColumnReconData]:
+        sheet_index: int = get_param(params, 'sheet_index')
+        return {
+            'created_columns': [],
+            'deleted_columns': [],
+            'modified_columns': prev_state.column_ids.get_column_headers_by_ids(sheet_index, execution_data['dependent_column_ids']),
+            'renamed_columns': {},
+        }
@@ -14,6 +14,7 @@ from mitosheet.errors import make_column_exists_error
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.step_performers.utils.utils import get_param
+from mitosheet.types import ColumnID, ColumnReconData
 
 
 class RenameColumnStepPerformer(StepPerformer):
@@ -78,4 +79,24 @@ class RenameColumnStepPerformer(StepPerformer):
     
     @classmethod
     def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
+        return {get_param(params, 'sheet_index')}
+
+    @classmethod
+    def get_column_recon(cls, prev_state: State, params: Dict[str, Any], execution_data: Dict[str, Any]) -> Optional[ColumnReconData]:
+        sheet_index: int = get_param(params, 'sheet_index')
+        column_id: ColumnID = get_param(params, 'column_id')
+        old_column_header = prev_state.column_ids.get_column_header_by_id(sheet_index, column_id)
+        return {
+            'created_columns': [],
+            'deleted_columns': [],
+            'modified_columns': [],
+            'renamed_columns': {old_column_header: get_param(params, 'new_column_header')},
+        }
+
+    @classmethod
+    def get_modified_column_ids(cls, params: Dict[str, Any]) -> Optional[Set[ColumnID]]:
+        return set()
+
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
         return {get_param(params, 'sheet_index')}
\ No newline at end of file
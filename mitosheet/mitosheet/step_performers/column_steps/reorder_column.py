@@ -5,8 +5,6 @@
 # Distributed under the terms of the GPL License.
 from typing import Any, Dict, List, Optional, Set
 
-import pandas as pd
-
 from mitosheet.code_chunks.code_chunk import CodeChunk
 from mitosheet.code_chunks.step_performers.column_steps.reorder_column_code_chunk import \
     ReorderColumnCodeChunk
@@ -15,13 +13,14 @@ from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.step_performers.utils.utils import get_param
 
 
-def get_valid_index(dfs: List[pd.DataFrame], sheet_index: int, new_column_index: int) -> int:
+def get_valid_index(state: State, sheet_index: int, new_column_index: int) -> int:
     # make sure new_column_index is valid
     if new_column_index < 0:
         new_column_index = 0
 
-    if new_column_index >= len(dfs[sheet_index].columns):
-        new_column_index = len(dfs[sheet_index].columns) - 1
+    num_columns = len(state.get_df_header(sheet_index).columns)
+    if new_column_index >= num_columns:
+        new_column_index = num_columns - 1
 
     return new_column_index
 
@@ -58,4 +57,8 @@ class ReorderColumnStepPerformer(StepPerformer):
     
     @classmethod
     def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
+        return {get_param(params, 'sheet_index')}
+
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
         return {get_param(params, 'sheet_index')}
\ No newline at end of file
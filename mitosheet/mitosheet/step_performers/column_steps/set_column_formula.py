@@ -19,7 +19,7 @@ from mitosheet.parser import get_frontend_formula, parse_formula
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.step_performers.utils.utils import get_param
-from mitosheet.types import FORMULA_ENTIRE_COLUMN_TYPE, ColumnHeader, ColumnID, FormulaAppliedToType, StepType
+from mitosheet.types import FORMULA_ENTIRE_COLUMN_TYPE, ColumnHeader, ColumnID, ColumnReconData, FormulaAppliedToType, FormulaIndex, FrontendFormula, StepType
 
 
 
@@ -118,13 +118,15 @@ class SetColumnFormulaStepPerformer(StepPerformer):
                 sheet_index
             )
             
+            formula_index = get_formula_index(df.index, frontend_formula)
+
             # If the user is setting the entire column, then there is only one formula for every cell in
             # the entire column. But if they are just setting specific indexes, we need to store the formulas
             # before this as well, so that we can figure out what formula is applied to each index
             if index_labels_formula_is_applied_to['type'] == FORMULA_ENTIRE_COLUMN_TYPE:
-                post_state.column_formulas[sheet_index][column_id] = [{'frontend_formula': frontend_formula, 'location': index_labels_formula_is_applied_to, 'index': df.index.to_list()}]
+                post_state.column_formulas[sheet_index][column_id] = [{'frontend_formula': frontend_formula, 'location': index_labels_formula_is_applied_to, 'index': formula_index}]
             else:
-                post_state.column_formulas[sheet_index][column_id].append({'frontend_formula': frontend_formula, 'location': index_labels_formula_is_applied_to, 'index': df.index.to_list()})
+                post_state.column_formulas[sheet_index][column_id].append({'frontend_formula': frontend_formula, 'location': index_labels_formula_is_applied_to, 'index': formula_index})
 
             return post_state, execution_data
         except TypeError as e:
@@ -180,6 +182,29 @@ class SetColumnFormulaStepPerformer(StepPerformer):
     def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
         return {get_param(params, 'sheet_index')}
 
+    @classmethod
+    def get_column_recon(cls, prev_state: State, params: Dict[str, Any], execution_data: Dict[str, Any]) -> Optional[ColumnReconData]:
+        sheet_index: int = get_param(params, 'sheet_index')
+        column_id: ColumnID = get_param(params, 'column_id')
+        return {
+            'created_columns': [],
+            'deleted_columns': [],
+            'modified_columns': [prev_state.column_ids.get_column_header_by_id(sheet_index, column_id)],
+            'renamed_columns': {},
+        }
+
+    @classmethod
+    def get_modified_column_ids(cls, params: Dict[str, Any]) -> Optional[Set[ColumnID]]:
+        return {get_param(params, 'column_id')}
+
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
+        # Formulas reference other sheets with a !, e.g. VLOOKUP(A, df2!A:B, 2), and
+        # in this case we just say the formula might read anything
+        if '!' in get_param(params, 'new_formula'):
+            return None
+        return {get_param(params, 'sheet_index')}
+
 
 def _get_fixed_invalid_formula(
         new_formula: str, 
@@ -219,6 +244,26 @@ def _get_fixed_invalid_formula(
     return new_formula
 
 
+def get_formula_index(index: pd.Index, frontend_formula: FrontendFormula) -> Optional[FormulaIndex]:
+    """
+    The frontend only needs the index a formula was written against to turn the 
+    row offsets in the formula back into index labels. So we only store it if the 
+    formula has a row offset, and then we only list out the labels if they cannot
+    be described by the bounds of a RangeIndex.
+    """
+    has_row_offset = any(
+        formula_part['type'] == '{HEADER}{INDEX}' and formula_part['row_offset'] 
+        for formula_part in frontend_formula
+    )
+    if not has_row_offset:
+        return None
+
+    if isinstance(index, pd.RangeIndex):
+        return {'type': 'range', 'start': index.start, 'stop': index.stop, 'step': index.step}
+
+    return {'type': 'labels', 'labels': index.to_list()}
+
+
 def get_details_from_operator_type_error(error: TypeError) -> Optional[Tuple[str, str, str]]:
     """
     We detect operator errors by checking the error string, which has the format:
@@ -96,3 +96,7 @@ class SplitTextToColumnsStepPerformer(StepPerformer):
     @classmethod
     def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
         return {get_param(params, 'sheet_index')}
+
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
+        return {get_param(params, 'sheet_index')}
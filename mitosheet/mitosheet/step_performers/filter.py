@@ -15,7 +15,7 @@ from mitosheet.code_chunks.code_chunk import CodeChunk
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.step_performers.utils.utils import get_param
-from mitosheet.types import ColumnHeader, ColumnID, Filter, FilterGroup, OperatorType, StepType
+from mitosheet.types import ColumnHeader, ColumnID, ColumnReconData, Filter, FilterGroup, OperatorType, StepType
 from mitosheet.types import (
     FC_BOOLEAN_IS_FALSE, FC_BOOLEAN_IS_TRUE, FC_DATETIME_EXACTLY,
     FC_DATETIME_GREATER, FC_DATETIME_GREATER_THAN_OR_EQUAL, FC_DATETIME_LESS,
@@ -117,6 +117,21 @@ class FilterStepPerformer(StepPerformer):
     def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
         return {get_param(params, 'sheet_index')}
 
+    @classmethod
+    def get_column_recon(cls, prev_state: State, params: Dict[str, Any], execution_data: Dict[str, Any]) -> Optional[ColumnReconData]:
+        # Filtering removes rows from every column, but does not change which columns there are
+        sheet_index: int = get_param(params, 'sheet_index')
+        return {
+            'created_columns': [],
+            'deleted_columns': [],
+            'modified_columns': prev_state.dfs[sheet_index].columns.to_list(),
+            'renamed_columns': {},
+        }
+
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
+        return {get_param(params, 'sheet_index')}
+
 
 def get_applied_filter(
     df: pd.DataFrame, column_header: ColumnHeader, filter_: Filter
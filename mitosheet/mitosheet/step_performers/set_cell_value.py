@@ -107,6 +107,10 @@ class SetCellValueStepPerformer(StepPerformer):
     def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
         return {get_param(params, 'sheet_index')}
 
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
+        return {get_param(params, 'sheet_index')}
+
 
 def cast_value_to_type(value: Union[str, None], column_dtype: str) -> Optional[Any]:
     """
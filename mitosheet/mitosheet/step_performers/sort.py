@@ -12,7 +12,7 @@ from mitosheet.errors import make_invalid_sort_error
 from mitosheet.state import State
 from mitosheet.step_performers.step_performer import StepPerformer
 from mitosheet.step_performers.utils.utils import get_param
-from mitosheet.types import ColumnID
+from mitosheet.types import ColumnID, ColumnReconData
 
 # CONSTANTS USED IN THE SORT STEP ITSELF
 SORT_DIRECTION_ASCENDING = 'ascending'
@@ -70,3 +70,18 @@ class SortStepPerformer(StepPerformer):
     @classmethod
     def get_modified_dataframe_indexes(cls, params: Dict[str, Any]) -> Set[int]:
         return {get_param(params, 'sheet_index')}
+
+    @classmethod
+    def get_column_recon(cls, prev_state: State, params: Dict[str, Any], execution_data: Dict[str, Any]) -> Optional[ColumnReconData]:
+        # Sorting reorders the rows of every column, but does not change which columns there are
+        sheet_index: int = get_param(params, 'sheet_index')
+        return {
+            'created_columns': [],
+            'deleted_columns': [],
+            'modified_columns': prev_state.dfs[sheet_index].columns.to_list(),
+            'renamed_columns': {},
+        }
+
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
+        return {get_param(params, 'sheet_index')}
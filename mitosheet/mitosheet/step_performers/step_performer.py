@@ -8,9 +8,12 @@ from time import perf_counter
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from mitosheet.code_chunks.code_chunk import CodeChunk
+from mitosheet.performance_profile import (EXEC_SPAN, RECON_SPAN,
+                                          STATE_COPY_SPAN, TRANSPILE_SPAN,
+                                          performance_profiler)
 from mitosheet.state import State
-from mitosheet.transpiler.transpile_utils import get_globals_for_exec
-from mitosheet.types import (ColumnHeader, ColumnID,
+from mitosheet.transpiler.transpile_utils import get_compiled_code_for_exec, get_globals_for_exec
+from mitosheet.types import (ColumnHeader, ColumnID, ColumnReconData,
                              ExecuteThroughTranspileNewDataframeParams, StepType)
 
 
@@ -125,86 +128,116 @@ class StepPerformer(ABC, object):
         it expects to change, so the various parameters are how the caller of this method can tell this function what
         should be different before and after in dataframes.
         """
-        from mitosheet.ai.recon import update_state_by_reconing_dataframes
+        from mitosheet.ai.recon import (is_column_recon_consistent,
+                                        update_state_by_column_recon,
+                                        update_state_by_reconing_dataframes)
 
         if execution_data is None:
             execution_data = {}
 
         modified_dataframe_indexes = cls.get_modified_dataframe_indexes(params)
+        # We only copy the metadata of the sheets this step modifies, and share the rest
+        # with the prev_state. An empty set means every sheet is modified, so we copy it all
+        metadata_sheet_indexes: Optional[Set[int]] = set(modified_dataframe_indexes) if len(modified_dataframe_indexes) > 0 else None
+
         # If the modified indexes are -1, then only new dataframes have been created -- and in this
         # case we just don't detect modifications
         if modified_dataframe_indexes == {-1}:
             modified_dataframe_indexes = set()
+            metadata_sheet_indexes = set()
+
+        # And if the step tells us which columns it modifies, we only copy the data in those columns
+        with performance_profiler.span(STATE_COPY_SPAN):
+            post_state = prev_state.copy(
+                deep_sheet_indexes=modified_dataframe_indexes, 
+                metadata_sheet_indexes=metadata_sheet_indexes,
+                deep_column_ids=cls.get_modified_column_ids(params)
+            )
 
-        post_state = prev_state.copy(deep_sheet_indexes=modified_dataframe_indexes)
-
-        code_chunks = cls.transpile(post_state, params, execution_data)
-        code = []
-        for chunk in code_chunks:
-            _code, imports = chunk.get_code()
-            code.extend(imports)
-            code.extend(_code)
+        with performance_profiler.span(TRANSPILE_SPAN):
+            code_chunks = cls.transpile(post_state, params, execution_data)
+            code = []
+            for chunk in code_chunks:
+                _code, imports = chunk.get_code()
+                code.extend(imports)
+                code.extend(_code)
 
-        final_code = "\n".join(code)
+            final_code = "\n".join(code)
 
         # TODO: this is weird. This will not always be updated, accoring to exec documentation, 
         # but in practice is seems to work...
         exec_globals = get_globals_for_exec(post_state, post_state.public_interface_version)
         exec_locals = {**exec_globals}
         
-        pandas_start_time = perf_counter()
-        exec(final_code, exec_globals, exec_locals)
-
-        # Go through the optional code lines
-        optional_code_that_successfully_executed: Tuple[List[str], List[str]] = ([], [])
-        if optional_code is not None:
-            for optional_import in optional_code[1]:
-                try:
-                    exec(optional_import, exec_globals, exec_locals)
-                    optional_code_that_successfully_executed = (
-                        optional_code_that_successfully_executed[0],
-                        optional_code_that_successfully_executed[1] + [optional_import],
-                    )
-                except:
-                    break
+        with performance_profiler.span(EXEC_SPAN):
+            pandas_start_time = perf_counter()
+            exec(get_compiled_code_for_exec(final_code), exec_globals, exec_locals)
+
+            # Go through the optional code lines
+            optional_code_that_successfully_executed: Tuple[List[str], List[str]] = ([], [])
+            if optional_code is not None:
+                for optional_import in optional_code[1]:
+                    try:
+                        exec(get_compiled_code_for_exec(optional_import), exec_globals, exec_locals)
+                        optional_code_that_successfully_executed = (
+                            optional_code_that_successfully_executed[0],
+                            optional_code_that_successfully_executed[1] + [optional_import],
+                        )
+                    except:
+                        break
             
-            # Take special care to not add the comments for the code unless 
-            # the code itself executes successfully
-
-            non_code_lines_before_optional_line = []
-            for optional_code_line in optional_code[0]:
-
-                # We don't need to exec spaces
-                if optional_code_line == '' or optional_code_line.strip().startswith('#'):
-                    non_code_lines_before_optional_line.append(optional_code_line)
-                    continue
-
-                # TODO: we should make it so it rolls back the state if this fails
-                # but it's fine for now -- since partial updates don't seem to 
-                # manifest in practice
-                try:
-                    exec(optional_code_line, exec_globals, exec_locals)
-                    optional_code_that_successfully_executed = (
-                        optional_code_that_successfully_executed[0] + non_code_lines_before_optional_line + [optional_code_line],
-                        optional_code_that_successfully_executed[1],
+                # Take special care to not add the comments for the code unless 
+                # the code itself executes successfully
+
+                non_code_lines_before_optional_line = []
+                for optional_code_line in optional_code[0]:
+
+                    # We don't need to exec spaces
+                    if optional_code_line == '' or optional_code_line.strip().startswith('#'):
+                        non_code_lines_before_optional_line.append(optional_code_line)
+                        continue
+
+                    # TODO: we should make it so it rolls back the state if this fails
+                    # but it's fine for now -- since partial updates don't seem to 
+                    # manifest in practice
+                    try:
+                        exec(get_compiled_code_for_exec(optional_code_line), exec_globals, exec_locals)
+                        optional_code_that_successfully_executed = (
+                            optional_code_that_successfully_executed[0] + non_code_lines_before_optional_line + [optional_code_line],
+                            optional_code_that_successfully_executed[1],
+                        )
+                        non_code_lines_before_optional_line = []
+                    except:
+                        break
+
+
+            pandas_processing_time = perf_counter() - pandas_start_time
+
+        with performance_profiler.span(RECON_SPAN):
+            column_recon = cls.get_column_recon(prev_state, params, execution_data)
+            for modified_dataframe_index in modified_dataframe_indexes:
+                df_name = prev_state.df_names[modified_dataframe_index]
+                old_df = prev_state.dfs[modified_dataframe_index]
+                new_df = exec_locals[df_name]
+
+                # If the step told us how the columns changed, we don't need to compare the dataframes, 
+                # but we still make sure that the columns we end up with are the ones we expect
+                if column_recon is not None and is_column_recon_consistent(old_df, new_df, column_recon):
+                    post_state = update_state_by_column_recon(
+                        post_state,
+                        modified_dataframe_index,
+                        new_df,
+                        column_recon,
+                        column_headers_to_column_ids=column_headers_to_column_ids
+                    )
+                else:
+                    post_state, _ = update_state_by_reconing_dataframes(
+                        post_state, 
+                        modified_dataframe_index, 
+                        old_df,
+                        new_df, 
+                        column_headers_to_column_ids=column_headers_to_column_ids
                     )
-                    non_code_lines_before_optional_line = []
-                except:
-                    break
-
-
-        pandas_processing_time = perf_counter() - pandas_start_time
-
-        for modified_dataframe_index in modified_dataframe_indexes:
-            df_name = prev_state.df_names[modified_dataframe_index]
-            new_df = exec_locals[df_name]
-            post_state, _ = update_state_by_reconing_dataframes(
-                post_state, 
-                modified_dataframe_index, 
-                prev_state.dfs[modified_dataframe_index],
-                new_df, 
-                column_headers_to_column_ids=column_headers_to_column_ids
-            )
 
         if new_dataframe_params:
             for new_df_name in new_dataframe_params['new_df_names']:
@@ -239,4 +272,44 @@ class StepPerformer(ABC, object):
         If it returned -1, then it modified all new dataframes (on
         the left side of the dfs array).
         """
-        pass
\ No newline at end of file
+        pass
+
+    @classmethod
+    def get_modified_column_ids(cls, params: Dict[str, Any]) -> Optional[Set[ColumnID]]:
+        """
+        Returns a set of the column ids of the existing columns that this
+        step changes the data of, in the sheets that it modifies. Adding, 
+        removing, or renaming columns does not change the data of any column.
+
+        If it returns None, then this step might change the data of any column
+        in the sheets it modifies, and so they are deep copied before the step
+        executes. Otherwise, only these columns are copied.
+        """
+        return None
+
+    @classmethod
+    def get_column_recon(cls, prev_state: State, params: Dict[str, Any], execution_data: Dict[str, Any]) -> Optional[ColumnReconData]:
+        """
+        Returns the columns that this step creates, deletes, renames, and modifies
+        in the one sheet that it modifies, if the step knows them before it executes.
+
+        When execute_through_transpile knows these columns, it updates the state with
+        them directly, rather than comparing the dataframe before and after the step 
+        to figure out what changed, which requires comparing every column. 
+
+        If it returns None, then the dataframes are compared.
+        """
+        return None
+
+    @classmethod
+    def get_read_dataframe_indexes(cls, params: Dict[str, Any]) -> Optional[Set[int]]:
+        """
+        Returns a set of all the sheet indexes that this step reads
+        from, which must include the sheets it modifies.
+
+        If it returns None, then this step might read any part of the
+        state, and so it is always reexecuted on replay. Steps that return
+        a set can instead reuse their previous execution when none of the
+        sheets they read have changed.
+        """
+        return None
\ No newline at end of file
@@ -5,18 +5,22 @@
 # Distributed under the terms of the GPL License.
 
 import json
+import os
 import random
 import string
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy, deepcopy
 from typing import Any, Callable, Collection, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 from mitosheet.api.get_parameterizable_params import get_parameterizable_params_metadata
 from mitosheet.api.get_path_contents import get_path_parts
+from mitosheet.code_chunks.code_chunk_utils import OptimizedCodeChunksCache
 
 from mitosheet.enterprise.mito_config import MitoConfig
 from mitosheet.enterprise.telemetry.mito_log_uploader import MitoLogUploader
 from mitosheet.experiments.experiment_utils import get_current_experiment
+from mitosheet.performance_profile import SHEET_DATA_JSON_SPAN, performance_profiler
 from mitosheet.step_performers.column_steps.set_column_formula import get_user_defined_sheet_function_objects
 from mitosheet.step_performers.import_steps.dataframe_import import DataframeImportStepPerformer
 from mitosheet.step_performers.import_steps.excel_range_import import ExcelRangeImportStepPerformer
@@ -26,6 +30,7 @@ from mitosheet.preprocessing import PREPROCESS_STEP_PERFORMERS
 from mitosheet.saved_analyses.save_utils import get_analysis_exists
 from mitosheet.state import State
 from mitosheet.step import Step
+from mitosheet.step_history_memory import DEFAULT_CHECKPOINT_INTERVAL, StepHistoryMemoryManager
 from mitosheet.step_performers import EVENT_TYPE_TO_STEP_PERFORMER
 from mitosheet.step_performers.import_steps.excel_import import \
     ExcelImportStepPerformer
@@ -38,7 +43,7 @@ from mitosheet.transpiler.transpile_utils import get_default_code_options
 from mitosheet.types import CodeOptions, ColumnDefinintion, ColumnDefinitions, DefaultEditingMode, MitoTheme, ParamMetadata
 from mitosheet.updates import UPDATES
 from mitosheet.user.utils import is_enterprise, is_pro, is_running_test
-from mitosheet.utils import NpEncoder, dfs_to_array_for_json, get_default_df_formats, get_new_id, is_default_df_names
+from mitosheet.utils import NpEncoder, dfs_to_array_for_json, get_default_df_formats, get_displayed_df, get_new_id, get_sheet_data_patch, is_default_df_names
 from mitosheet.step_performers.utils.user_defined_function_utils import get_user_defined_importers_for_frontend, get_user_defined_editors_for_frontend
 from mitosheet.step_performers.utils.user_defined_function_utils import validate_and_wrap_sheet_functions, validate_user_defined_editors
 
@@ -46,19 +51,167 @@ def get_step_indexes_to_skip(step_list: List[Step]) -> Set[int]:
     """
     Given a list of steps, will collect all of the steps
     from this list that should be skipped.
+
+    This runs in a single pass over the steps. A step skips all steps before 
+    it that share a skip key, but any of these steps before the most recent one
+    with that key were already skipped by that most recent step, so we only 
+    need to track the last step index for each skip key.
     """
     step_indexes_to_skip: Set[int] = set()
+    last_step_index_for_skip_key: Dict[Tuple[Any, ...], int] = {}
 
     for step_index, step in enumerate(step_list):
-        step_indexes_to_skip = step_indexes_to_skip.union(
-            step.step_indexes_to_skip(step_list[:step_index])
-        )
+        for skip_key in step.skip_keys:
+            if skip_key in last_step_index_for_skip_key:
+                step_indexes_to_skip.add(last_step_index_for_skip_key[skip_key])
+            last_step_index_for_skip_key[skip_key] = step_index
+
+        if step_index > 0 and step.skips_previous_step(step_list[step_index - 1]):
+            step_indexes_to_skip.add(step_index - 1)
 
     return step_indexes_to_skip
 
 
+def get_first_step_index_skipped_by_steps(step_list: List[Step], start_index: int) -> Optional[int]:
+    """
+    Returns the smallest step index that is skipped by any of the steps
+    in step_list[start_index:], or None if these steps skip nothing.
+    """
+    first_step_index_skipped: Optional[int] = None
+    first_step_index_for_skip_key: Dict[Tuple[Any, ...], int] = {}
+
+    for step_index, step in enumerate(step_list):
+        if step_index >= start_index:
+            skipped_step_indexes = [
+                first_step_index_for_skip_key[skip_key] for skip_key in step.skip_keys 
+                if skip_key in first_step_index_for_skip_key
+            ]
+            if step_index > 0 and step.skips_previous_step(step_list[step_index - 1]):
+                skipped_step_indexes.append(step_index - 1)
+
+            for skipped_step_index in skipped_step_indexes:
+                if first_step_index_skipped is None or skipped_step_index < first_step_index_skipped:
+                    first_step_index_skipped = skipped_step_index
+
+        for skip_key in step.skip_keys:
+            first_step_index_for_skip_key.setdefault(skip_key, step_index)
+
+    return first_step_index_skipped
+
+
+# The most threads used to execute the steps that edit different sheets at the same time
+# on replay. Pandas releases the GIL in many of its operations, so these threads can use
+# more than one core
+MAX_REPLAY_THREADS = min(8, os.cpu_count() or 1)
+
+
+def _execute_step(step: Step, last_valid_step: Step, non_skipped_steps: List[Step]) -> Step:
+    """
+    Returns a new step with the same params as step, executed on the final state
+    of the last_valid_step. If none of the sheets the step reads changed since it
+    last executed, it reuses its previous execution.
+    """
+    new_step = Step(step.step_type, step.step_id, step.params)
+    prev_sheet_fingerprints = last_valid_step.get_sheet_fingerprints()
+    if not new_step.set_prev_state_from_cached_step(step, last_valid_step.final_defined_state, prev_sheet_fingerprints):
+        new_step.set_prev_state_and_execute(last_valid_step.final_defined_state, non_skipped_steps, prev_sheet_fingerprints=prev_sheet_fingerprints)
+    return new_step
+
+
+def _get_independent_read_sheet_indexes(step: Step, prev_state: State) -> Optional[Set[int]]:
+    """
+    Returns the sheets that the step reads, if the step only reads and modifies
+    sheets that already exist in the prev_state. Otherwise, returns None, as the 
+    step might depend on any other step.
+    """
+    read_dataframe_indexes = step.get_read_dataframe_indexes(step.params, prev_state)
+    modified_dataframe_indexes = step.step_performer.get_modified_dataframe_indexes(step.params)
+    if read_dataframe_indexes is None or len(modified_dataframe_indexes) == 0 or not modified_dataframe_indexes.issubset(read_dataframe_indexes):
+        return None
+    if any(sheet_index < 0 or sheet_index >= prev_state.num_sheets for sheet_index in read_dataframe_indexes):
+        return None
+    return read_dataframe_indexes
+
+
+def get_independent_step_groups(
+    step_list: List[Step], start_index: int, step_indexes_to_skip: Set[int], prev_state: State
+) -> Tuple[int, List[List[int]]]:
+    """
+    Finds the longest run of steps starting at start_index that only read and modify
+    sheets that already exist in the prev_state the run starts from, and splits the steps in this run into groups that read
+    disjoint sheets. The steps in a group depend on each other, but not on the steps
+    in any other group.
+
+    Returns the index of the first step after the run, and the step indexes of each
+    group in order. Skipped steps are part of the run, but not of any group.
+    """
+    groups: List[Tuple[Set[int], List[int]]] = []
+    step_index = start_index
+    while step_index < len(step_list):
+        if step_index in step_indexes_to_skip:
+            step_index += 1
+            continue
+
+        read_sheet_indexes = _get_independent_read_sheet_indexes(step_list[step_index], prev_state)
+        if read_sheet_indexes is None:
+            break
+
+        # This step joins all the groups that read any of the same sheets
+        joined_groups = [group for group in groups if not group[0].isdisjoint(read_sheet_indexes)]
+        if len(joined_groups) == 1:
+            joined_groups[0][0].update(read_sheet_indexes)
+            joined_groups[0][1].append(step_index)
+        else:
+            group_sheet_indexes = set(read_sheet_indexes)
+            group_step_indexes: List[int] = []
+            for sheet_indexes, step_indexes in joined_groups:
+                group_sheet_indexes.update(sheet_indexes)
+                group_step_indexes.extend(step_indexes)
+            groups = [group for group in groups if group[0].isdisjoint(read_sheet_indexes)]
+            groups.append((group_sheet_indexes, sorted(group_step_indexes) + [step_index]))
+        step_index += 1
+
+    return step_index, sorted((step_indexes for _, step_indexes in groups), key=lambda step_indexes: step_indexes[0])
+
+
+def execute_independent_step_groups(
+    step_list: List[Step], step_groups: List[List[int]], last_valid_step: Step, non_skipped_steps: List[Step]
+) -> Tuple[Dict[int, Step], Dict[int, Exception]]:
+    """
+    Executes each group of steps on the final state of the last_valid_step, with the
+    groups running at the same time in different threads. Returns the executed steps
+    by their index in the step_list, and the error of each step that failed. The steps
+    in a group after a failed step are not executed.
+
+    As the groups read disjoint sheets, each step modifies its sheets exactly as it 
+    would if all the steps were executed in order, and so the steps in order can reuse
+    these executions with Step.set_prev_state_from_cached_step.
+    """
+    # Make sure the fingerprints exist before the threads read them
+    last_valid_step.get_sheet_fingerprints()
+
+    def execute_step_group(step_indexes: List[int]) -> Tuple[Dict[int, Step], Dict[int, Exception]]:
+        executed_steps: Dict[int, Step] = {}
+        group_last_valid_step = last_valid_step
+        for step_index in step_indexes:
+            try:
+                group_last_valid_step = _execute_step(step_list[step_index], group_last_valid_step, non_skipped_steps)
+            except Exception as e:
+                return executed_steps, {step_index: e}
+            executed_steps[step_index] = group_last_valid_step
+        return executed_steps, {}
+
+    executed_steps: Dict[int, Step] = {}
+    failed_steps: Dict[int, Exception] = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_REPLAY_THREADS, len(step_groups))) as executor:
+        for group_executed_steps, group_failed_steps in executor.map(execute_step_group, step_groups):
+            executed_steps.update(group_executed_steps)
+            failed_steps.update(group_failed_steps)
+    return executed_steps, failed_steps
+
+
 def execute_step_list_from_index(
-    step_list: List[Step], start_index: Optional[int]=None
+    step_list: List[Step], start_index: Optional[int]=None, step_indexes_to_skip: Optional[Set[int]]=None
 ) -> List[Step]:
     """
     Given a list of steps, and a specific index to start from, will assume that
@@ -69,7 +222,16 @@ def execute_step_list_from_index(
     means that the returned step list will only have valid prev_state/post_states
     for the steps that are not skipped.
 
-    If start_index is not given, will start from the initialize step.
+    Steps that only read sheets that have not changed since they last executed are
+    also not reexecuted, and instead reuse the modified sheets from their previous
+    post_state. See Step.set_prev_state_from_cached_step for more details.
+
+    Runs of steps that edit different existing sheets are executed at the same time
+    in different threads, and then put in order by reusing these executions. See
+    get_independent_step_groups for more details.
+
+    If start_index is not given, will start from the initialize step. If the 
+    step_indexes_to_skip are not given, they are computed from the step_list.
     """
 
     # Make sure start index is not None
@@ -77,31 +239,57 @@ def execute_step_list_from_index(
         start_index = 0
 
     # Get the steps to skip, so that we can skip them
-    step_indexes_to_skip = get_step_indexes_to_skip(step_list)
+    if step_indexes_to_skip is None:
+        step_indexes_to_skip = get_step_indexes_to_skip(step_list)
 
-    # Get the steps that are valid, and the last valid step, so we can execute from there
+    # Get the steps that are valid, and the last valid step, so we can execute from there.
+    # We keep the list of steps that are actually executed up to date as we go
     new_step_list = step_list[: start_index + 1]
+    non_skipped_steps = [step for index, step in enumerate(new_step_list) if index not in step_indexes_to_skip]
     last_valid_step = step_list[start_index]
 
-    for partial_index, step in enumerate(step_list[start_index + 1 :]):
-        step_index = partial_index + start_index + 1
-        # If we're skipping a step, add it to the new step list (since we don't
-        # want to lose it), but don't reexecute it
-        if step_index in step_indexes_to_skip:
-            new_step_list.append(step)
-            continue
-            
-        # Create a new step with the same params
-        new_step = Step(step.step_type, step.step_id, step.params)
+    run_start_index = start_index + 1
+    while run_start_index < len(step_list):
+        prev_state = last_valid_step.final_defined_state
+        run_end_index = run_start_index
+        step_groups: List[List[int]] = []
+        if MAX_REPLAY_THREADS > 1 and not prev_state.has_evicted_dfs:
+            run_end_index, step_groups = get_independent_step_groups(step_list, run_start_index, step_indexes_to_skip, prev_state)
+        # A step that might depend on any other step is a run on its own
+        run_end_index = max(run_end_index, run_start_index + 1)
+
+        executed_steps: Dict[int, Step] = {}
+        failed_steps: Dict[int, Exception] = {}
+        if len(step_groups) > 1:
+            executed_steps, failed_steps = execute_independent_step_groups(step_list, step_groups, last_valid_step, non_skipped_steps)
+
+        for step_index in range(run_start_index, run_end_index):
+            step = step_list[step_index]
+            # If we're skipping a step, add it to the new step list (since we don't
+            # want to lose it), but don't reexecute it
+            if step_index in step_indexes_to_skip:
+                new_step_list.append(step)
+                continue
+
+            # If the step failed in its thread, it fails in the same way in order, as it 
+            # reads the same sheets, so we raise the error once we get to it
+            if step_index in failed_steps:
+                raise failed_steps[step_index]
 
-        # Set the previous state of the new step, and then update
-        # what the last valid step is. Note that we find the actually
-        # executed steps before passing them
-        non_skipped_steps = [step for index, step in enumerate(new_step_list) if index not in step_indexes_to_skip]
-        new_step.set_prev_state_and_execute(last_valid_step.final_defined_state, non_skipped_steps)
-        last_valid_step = new_step
+            # Set the previous state of the new step, and then update what the last 
+            # valid step is. We reuse the execution from the threads if there is one, 
+            # or the previous execution if none of the sheets the step reads changed. 
+            # Otherwise, we reexecute it -- and note that we only pass the actually executed steps
+            new_step = Step(step.step_type, step.step_id, step.params)
+            executed_step = executed_steps.get(step_index)
+            if executed_step is None or not new_step.set_prev_state_from_cached_step(executed_step, last_valid_step.final_defined_state, last_valid_step.get_sheet_fingerprints()):
+                new_step = _execute_step(step, last_valid_step, non_skipped_steps)
+            last_valid_step = new_step
 
-        new_step_list.append(new_step)
+            new_step_list.append(new_step)
+            non_skipped_steps.append(new_step)
+
+        run_start_index = run_end_index
 
     return new_step_list
 
@@ -125,7 +313,7 @@ def get_modified_sheet_indexes(
 
         # If the set is empty, then we modified everything
         if len(modified_indexes) == 0:
-            modified_indexes = {j for j in range(len(step.dfs))}
+            modified_indexes = {j for j in range(step.num_sheets)}
         # If -1 is modified, then all new dataframes are modified, which
         # if nothing new was created, means there was a live updated event,
         # and so we should just take the last element
@@ -133,14 +321,14 @@ def get_modified_sheet_indexes(
             prev_step = steps[ending_step_index - 1]
             modified_indexes.remove(-1)
 
-            if len(prev_step.dfs) != len(step.dfs):
+            if prev_step.num_sheets != step.num_sheets:
                 modified_indexes.update(
-                    {j for j in range(len(prev_step.dfs), len(step.dfs))}
+                    {j for j in range(prev_step.num_sheets, step.num_sheets)}
                 )
             else:
-                modified_indexes.add(len(step.dfs) - 1)
+                modified_indexes.add(step.num_sheets - 1)
     else:
-        modified_indexes = {i for i in range(len(steps[ending_step_index].dfs))}
+        modified_indexes = {i for i in range(steps[ending_step_index].num_sheets)}
 
     return modified_indexes
 
@@ -191,6 +379,8 @@ class StepsManager:
             default_editing_mode: Optional[DefaultEditingMode]=None,
             theme: Optional[MitoTheme]=None,
             input_cell_execution_count: Optional[int]=None,
+            step_history_memory_budget: Optional[int]=None,
+            step_history_checkpoint_interval: int=DEFAULT_CHECKPOINT_INTERVAL,
         ):
         """
         When initalizing the StepsManager, we also do preprocessing
@@ -198,6 +388,10 @@ class StepsManager:
 
         All preprocessing can be found in mitosheet/preprocessing, and each of
         the transformations are applied before the data is considered imported.
+
+        If a step_history_memory_budget (in bytes) is passed, then the dataframes 
+        in old steps are evicted from memory to keep the step history under this 
+        budget. See step_history_memory.py for more details.
         """
 
         # We just randomly generate analysis names as a string of 10 letters
@@ -323,6 +517,26 @@ class StepsManager:
             self.curr_step.df_formats,
         )
         self.last_step_index_we_wrote_sheet_json_on = 0
+        # We keep the displayed part of the dataframes that the saved sheet data was created from, 
+        # so that when a sheet is modified, we only have to convert the columns that changed. We 
+        # keep the fingerprints of these sheets too, so we only copy the sheets that changed
+        self.saved_displayed_dfs: List[pd.DataFrame] = [get_displayed_df(df) for df in self.curr_step.dfs]
+        self.saved_sheet_fingerprints: Tuple[str, ...] = self.curr_step.get_sheet_fingerprints()
+        # The version of the saved sheet data, which increases every time it changes. The frontend 
+        # sends back the version it has, so that we can send it just a patch when it is up to date
+        self.sheet_data_version = 0
+
+        # We also cache the optimized code chunks of the analysis, so that transpiling the same 
+        # analysis more than once (e.g. for the code and the saved analysis) only 
+        # optimizes its code chunks once
+        self.optimized_code_chunks_cache = OptimizedCodeChunksCache()
+        # And the last code we transpiled, along with what it was transpiled from, as 
+        # after each edit the code is both sent to the frontend and saved in the analysis
+        self._code_cache: Optional[Tuple[Tuple[Any, ...], List[str]]] = None
+
+        # We keep track of the steps that are skipped, and update this whenever
+        # the steps change, so that we don't need to recompute it
+        self.step_indexes_to_skip: Set[int] = set()
 
         # We store the number of update events that have been processed successfully,
         # which allows us to have some awareness about undos and redos in the front-end
@@ -356,6 +570,11 @@ class StepsManager:
         self.theme = theme
         self.default_apply_formula_to_column = False if default_editing_mode == 'cell' else True
 
+        self.step_history_memory_manager = StepHistoryMemoryManager(
+            step_history_memory_budget, 
+            checkpoint_interval=step_history_checkpoint_interval
+        ) if step_history_memory_budget is not None else None
+
     @property
     def curr_step(self) -> Step:
         """
@@ -364,15 +583,23 @@ class StepsManager:
         """
         return self.steps_including_skipped[self.curr_step_idx]
 
+    @property
+    def non_skipped_steps(self) -> List[Step]:
+        """
+        Returns the steps that are not skipped, which are the steps 
+        that were actually executed to create the current state
+        """
+        return [step for index, step in enumerate(self.steps_including_skipped) if index not in self.step_indexes_to_skip]
+
     @property
     def dfs(self) -> List[pd.DataFrame]:
         return self.steps_including_skipped[self.curr_step_idx].dfs
 
-    @property
-    def sheet_data_json(self) -> str:
+    def _update_saved_sheet_data(self) -> Optional[Dict[str, Any]]:
         """
-        sheet_json contains a serialized representation of the data
-        frames that is then fed into the Endo in the front-end.
+        Updates the saved sheet data to the sheet data of the current step, and
+        returns the patch from the previous saved sheet data to the new one (or
+        None if the sheet data did not change).
 
         NOTE: we only display the _first_ 1,500 rows of the dataframe
         for speed reasons. This results in way less data getting
@@ -382,23 +609,60 @@ class StepsManager:
             self.steps_including_skipped, self.last_step_index_we_wrote_sheet_json_on, self.curr_step_idx
         )
 
+        dfs = self.curr_step.dfs
         array = dfs_to_array_for_json(
             self.curr_step.final_defined_state,
             modified_sheet_indexes,
             self.saved_sheet_data,
-            self.curr_step.dfs,
+            dfs,
             self.curr_step.df_names,
             self.curr_step.df_sources,
             self.curr_step.column_formulas,
             self.curr_step.column_filters,
             self.curr_step.column_ids,
             self.curr_step.df_formats,
+            previous_displayed_dfs=self.saved_displayed_dfs
         )
 
+        patch = get_sheet_data_patch(self.saved_sheet_data, array)
+        if patch is not None:
+            self.sheet_data_version += 1
+
         self.saved_sheet_data = array
+        sheet_fingerprints = self.curr_step.get_sheet_fingerprints()
+        self.saved_displayed_dfs = [
+            self.saved_displayed_dfs[sheet_index] 
+            if sheet_index < len(self.saved_sheet_fingerprints) and self.saved_sheet_fingerprints[sheet_index] == sheet_fingerprint 
+            else get_displayed_df(dfs[sheet_index])
+            for sheet_index, sheet_fingerprint in enumerate(sheet_fingerprints)
+        ]
+        self.saved_sheet_fingerprints = sheet_fingerprints
         self.last_step_index_we_wrote_sheet_json_on = self.curr_step_idx
 
-        return json.dumps(array, cls=NpEncoder)
+        return patch
+
+    @property
+    def sheet_data_json(self) -> str:
+        """
+        sheet_json contains a serialized representation of the data
+        frames that is then fed into the Endo in the front-end.
+        """
+        with performance_profiler.span(SHEET_DATA_JSON_SPAN, self.curr_step.step_id, self.curr_step.step_type):
+            self._update_saved_sheet_data()
+            return json.dumps(self.saved_sheet_data, cls=NpEncoder)
+
+    @property
+    def sheet_data_patch_json(self) -> str:
+        """
+        A serialized patch from the saved sheet data to the sheet data of the
+        current step (see get_sheet_data_patch). This should only be sent to
+        a frontend that has the saved sheet data, at sheet_data_version.
+        """
+        with performance_profiler.span(SHEET_DATA_JSON_SPAN, self.curr_step.step_id, self.curr_step.step_type):
+            patch = self._update_saved_sheet_data()
+            if patch is None:
+                patch = {'numSheets': len(self.saved_sheet_data), 'sheetPatches': []}
+            return json.dumps(patch, cls=NpEncoder)
 
     @property
     def analysis_data_json(self):
@@ -442,7 +706,6 @@ class StepsManager:
         the skipped steps
         """
         step_summary_list = []
-        step_indexes_to_skip = get_step_indexes_to_skip(self.steps_including_skipped)
         for index, step in enumerate(self.steps_including_skipped):
             if step.step_type == "initialize":
                 step_summary_list.append(
@@ -458,16 +721,12 @@ class StepsManager:
                 )
                 continue
 
-            if index in step_indexes_to_skip:
+            if index in self.step_indexes_to_skip:
                 continue
             
             # NOTE: we cannot and should not optimize the code chunks here, as
             # rely on getting data out of them is to label the steps correctly
-            code_chunks = step.step_performer.transpile(
-                step.prev_state, # type: ignore
-                step.params,
-                step.execution_data,
-            )
+            code_chunks = step.get_code_chunks()
 
             step_summary_list.append(
                 {
@@ -484,7 +743,19 @@ class StepsManager:
         return step_summary_list
     
     def code(self) -> List[str]:
-        return transpile(self, optimize=True)
+        code_cache_key = (
+            tuple(self.steps_including_skipped), 
+            self.curr_step_idx, 
+            self.public_interface_version,
+            json.dumps(self.code_options, sort_keys=True, default=str)
+        )
+        code_cache = self._code_cache
+        if code_cache is not None and code_cache[0] == code_cache_key:
+            return list(code_cache[1])
+
+        code = transpile(self, optimize=True)
+        self._code_cache = (code_cache_key, code)
+        return list(code)
     
     @property
     def fully_parameterized_function(self) -> str:
@@ -591,31 +862,22 @@ class StepsManager:
             # If we are removing steps, then we figure out what skipped steps
             # we are losing, and run from right before where we are no longer
             # skipped steps
-            no_longer_skipped_indexes: Set[int] = set()
-            for step_index, removed_step in enumerate(self.steps_including_skipped[len(new_steps) :]):
-                previous_steps = self.steps_including_skipped[: len(new_steps) + step_index]
-                no_longer_skipped_indexes = no_longer_skipped_indexes.union(
-                    removed_step.step_indexes_to_skip(previous_steps)
-                )
-
-            last_valid_index = (
-                min(no_longer_skipped_indexes.union({len(new_steps)})) - 1
-            )
+            first_no_longer_skipped_index = get_first_step_index_skipped_by_steps(self.steps_including_skipped, len(new_steps))
+            last_valid_index = min(
+                first_no_longer_skipped_index if first_no_longer_skipped_index is not None else len(new_steps), 
+                len(new_steps)
+            ) - 1
         else:
             # Otherwise, if we're adding steps, we figure out which skipped steps
             # we're adding, and run from right before the oldest new skipped step
-
-            # Collect anything that is newly skipped
-            newly_skipped_indexes: Set[int] = set()
-            for step_index, new_step in enumerate(new_steps[len(self.steps_including_skipped) :]):
-                previous_steps = new_steps[: len(self.steps_including_skipped) + step_index]
-                newly_skipped_indexes = newly_skipped_indexes.union(
-                    new_step.step_indexes_to_skip(previous_steps)
-                )
+            first_newly_skipped_index = get_first_step_index_skipped_by_steps(new_steps, len(self.steps_including_skipped))
 
             # The last valid index is the minimum of the newly skipped things - 1
             # or the last valid step (if nothing is skipped)
-            last_valid_index = min(newly_skipped_indexes.union({len(self.steps_including_skipped)})) - 1
+            last_valid_index = min(
+                first_newly_skipped_index if first_newly_skipped_index is not None else len(self.steps_including_skipped),
+                len(self.steps_including_skipped)
+            ) - 1
 
         # Make sure that this step isn't itself skipped, and decrement until it is not
         all_skipped_indexes = get_step_indexes_to_skip(new_steps)
@@ -765,12 +1027,21 @@ class StepsManager:
         if last_valid_index is None:
             last_valid_index = self.find_last_valid_index(new_steps)
 
+        step_indexes_to_skip = get_step_indexes_to_skip(new_steps)
         final_steps = execute_step_list_from_index(
-            new_steps, start_index=last_valid_index
+            new_steps, start_index=last_valid_index, step_indexes_to_skip=step_indexes_to_skip
         )
         self.steps_including_skipped = final_steps
+        self.step_indexes_to_skip = step_indexes_to_skip
         self.curr_step_idx = len(self.steps_including_skipped) - 1
 
+        if self.step_history_memory_manager is not None:
+            # We also manage the steps that can be redone, as they hold states too
+            undone_steps = [step for _, step_list in self.undone_step_list_store for step in step_list]
+            self.step_history_memory_manager.enforce_memory_budget(
+                self.steps_including_skipped + undone_steps, self.curr_step
+            )
+
     def execute_steps_data(self, new_steps_data: Optional[List[Dict[str, Any]]] = None) -> None:
         """
         Given steps data (e.g. from a saved analysis), will turn
@@ -7,10 +7,11 @@ import pandas as pd
 from pandas.testing import assert_frame_equal
 import pytest
 
-from mitosheet.ai.recon import exec_for_recon, get_modified_dataframe_recon_data, exec_and_get_new_state_and_result
+from mitosheet.ai.recon import exec_for_recon, get_modified_dataframe_recon_data, exec_and_get_new_state_and_result, is_column_changed, is_column_recon_consistent, is_df_changed, is_same_column_data
 from mitosheet.errors import MitoError
 from mitosheet.state import State
-from mitosheet.types import ColumnReconData, DataframeReconData, ModifiedDataframeReconData
+from mitosheet.tests.test_utils import create_mito_wrapper_with_data
+from mitosheet.types import FC_NUMBER_GREATER, ColumnReconData, DataframeReconData, ModifiedDataframeReconData
 from mitosheet.utils import df_to_json_dumpsable
 
 EXEC_FOR_RECON_TESTS: List[Tuple[str, Dict[str, pd.DataFrame], DataframeReconData]] = [
@@ -759,4 +760,74 @@ def test_invalid_code_execute(code, error):
     prev_state = State(df_names=list(old_dfs_map.keys()), dfs=list(old_dfs_map.values()), public_interface_version=3)
     with pytest.raises(MitoError) as e:
         exec_and_get_new_state_and_result(prev_state, code)
-    assert error in str(e)
\ No newline at end of file
+    assert error in str(e)
+
+COLUMN_RECON_CONSISTENT_TESTS = [
+    (['A', 'B'], ['A', 'B'], {'created_columns': [], 'deleted_columns': [], 'modified_columns': ['A'], 'renamed_columns': {}}, True),
+    (['A', 'B'], ['A', 'C', 'B'], {'created_columns': ['C'], 'deleted_columns': [], 'modified_columns': [], 'renamed_columns': {}}, True),
+    (['A', 'B'], ['A'], {'created_columns': [], 'deleted_columns': ['B'], 'modified_columns': [], 'renamed_columns': {}}, True),
+    (['A', 'B'], ['A', 'C'], {'created_columns': [], 'deleted_columns': [], 'modified_columns': [], 'renamed_columns': {'B': 'C'}}, True),
+    (['A', 'B'], ['A', 'B', 'C'], {'created_columns': [], 'deleted_columns': [], 'modified_columns': [], 'renamed_columns': {}}, False),
+    (['A', 'B'], ['A', 'B'], {'created_columns': ['C'], 'deleted_columns': [], 'modified_columns': [], 'renamed_columns': {}}, False),
+    (['A', 'B'], ['A', 'B'], {'created_columns': [], 'deleted_columns': [], 'modified_columns': [], 'renamed_columns': {'B': 'C'}}, False),
+]
+@pytest.mark.parametrize("old_columns, new_columns, column_recon, consistent", COLUMN_RECON_CONSISTENT_TESTS)
+def test_is_column_recon_consistent(old_columns, new_columns, column_recon, consistent):
+    old_df = pd.DataFrame({column: [1] for column in old_columns})
+    new_df = pd.DataFrame({column: [1] for column in new_columns})
+    assert is_column_recon_consistent(old_df, new_df, column_recon) == consistent
+
+
+def test_steps_that_know_their_column_changes_do_not_compare_dataframes(monkeypatch):
+    def get_modified_dataframe_recon_data_should_not_be_called(old_df, new_df):
+        raise Exception('Should not compare the dataframes')
+    monkeypatch.setattr('mitosheet.ai.recon.get_modified_dataframe_recon_data', get_modified_dataframe_recon_data_should_not_be_called)
+
+    mito = create_mito_wrapper_with_data([1, 2, 3])
+    mito.add_column(0, 'B')
+    mito.set_formula('=A + 1', 0, 'B')
+    mito.rename_column(0, 'B', 'C')
+    mito.sort(0, 'C', 'descending')
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 1)
+
+    assert mito.dfs[0].equals(pd.DataFrame({'A': [3, 2], 'C': [4, 3]}, index=[2, 1]))
+    assert mito.curr_step.column_ids.get_column_ids(0) == ['A', 'B']
+    assert mito.transpiled_code[2:] == [
+        "df1['C'] = df1['A'] + 1",
+        '',
+        "df1 = df1.sort_values(by='C', ascending=False, na_position='last')",
+        '',
+        "df1 = df1[df1['A'] > 1]",
+        '',
+    ]
+
+
+def test_is_same_column_data():
+    df = pd.DataFrame({'A': [1, 2, 3], 'B': [1.0, None, 3.0], 'C': ['a', 'b', 'c']})
+    shallow_copy = df.copy(deep=False)
+    deep_copy = df.copy(deep=True)
+
+    for column_header in df.columns:
+        assert is_same_column_data(df[column_header], shallow_copy[column_header])
+        assert not is_same_column_data(df[column_header], deep_copy[column_header])
+        assert not is_column_changed(df[column_header], deep_copy[column_header])
+
+    # Views of different rows share memory, but are not the same data
+    assert not is_same_column_data(df['A'].iloc[:2], df['A'].iloc[1:])
+    assert is_column_changed(df['A'].iloc[:2], df['A'].iloc[1:])
+    assert not is_same_column_data(df['A'], df['A'].astype('int32'))
+
+
+def test_recon_does_not_compare_values_of_columns_that_share_memory(monkeypatch):
+    old_df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6], 'C': ['a', 'b', 'c']})
+    new_df = old_df.copy(deep=False)
+    new_df['B'] = [7, 8, 9]
+
+    def equals_should_not_be_called(self, other):
+        raise Exception('Should not compare the values')
+    monkeypatch.setattr(pd.Series, 'equals', equals_should_not_be_called)
+    monkeypatch.setattr(pd.DataFrame, 'equals', equals_should_not_be_called)
+
+    assert not is_df_changed(old_df, old_df.copy(deep=False))
+    assert not is_column_changed(old_df['A'], new_df['A'])
+    assert not is_column_changed(old_df['C'], new_df['C'])
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for the get_performance_profile API call.
+"""
+
+import json
+
+import pandas as pd
+
+from mitosheet.api.get_performance_profile import get_performance_profile
+from mitosheet.performance_profile import PerformanceProfiler
+from mitosheet.tests.test_utils import create_mito_wrapper
+
+
+def test_get_performance_profile_times_each_part_of_each_step():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.sort(0, 'B', 'descending')
+
+    performance_profile = get_performance_profile({}, mito.mito_backend.steps_manager)
+    steps = performance_profile['steps']
+
+    assert [step['stepType'] for step in steps] == ['add_column', 'set_column_formula', 'sort']
+    assert [step['stepID'] for step in steps] == [step.step_id for step in mito.mito_backend.steps_manager.steps_including_skipped[1:]]
+    for step in steps:
+        assert step['numExecutions'] == 1
+        assert step['totalTime'] > 0
+        assert {'step', 'saturate', 'execute', 'state_copy', 'transpile', 'exec', 'recon'}.issubset(step['times'].keys())
+        assert step['times']['step'] == step['totalTime']
+        assert step['times']['exec'] <= step['times']['execute'] <= step['times']['step']
+
+    # The sheet data is created after the last step
+    assert 'sheet_data_json' in steps[-1]['times']
+    assert 'chromeTrace' not in performance_profile
+
+
+def test_get_performance_profile_only_includes_steps_of_this_analysis():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.add_column(0, 'B')
+    other_mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    other_mito.add_column(0, 'C')
+
+    steps = get_performance_profile({}, mito.mito_backend.steps_manager)['steps']
+    assert [step['stepID'] for step in steps] == [mito.mito_backend.steps_manager.steps_including_skipped[1].step_id]
+
+
+def test_get_performance_profile_chrome_trace():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.add_column(0, 'B')
+
+    chrome_trace = get_performance_profile({'include_chrome_trace': True}, mito.mito_backend.steps_manager)['chromeTrace']
+    # Make sure it can be saved as JSON
+    chrome_trace = json.loads(json.dumps(chrome_trace))
+
+    events = chrome_trace['traceEvents']
+    assert {event['name'] for event in events} >= {'add_column', 'saturate', 'execute', 'exec', 'recon'}
+    for event in events:
+        assert event['ph'] == 'X'
+        assert event['dur'] >= 0
+        assert event['args']['step_type'] == 'add_column'
+
+    step_event = [event for event in events if event['name'] == 'add_column'][0]
+    for event in events:
+        assert step_event['ts'] <= event['ts'] and event['ts'] + event['dur'] <= step_event['ts'] + step_event['dur'] or event['name'] == 'sheet_data_json'
+
+
+def test_performance_profiler_spans_belong_to_the_step_they_are_in():
+    profiler = PerformanceProfiler(max_spans=3)
+    with profiler.span('step', 'step_id', 'add_column'):
+        with profiler.span('execute'):
+            pass
+    with profiler.span('sheet_data_json'):
+        pass
+
+    spans = profiler.get_spans()
+    assert [(span['name'], span['step_id'], span['depth']) for span in spans] == [
+        ('step', 'step_id', 0), ('execute', 'step_id', 1), ('sheet_data_json', None, 0)
+    ]
+    assert [span['name'] for span in profiler.get_spans(step_ids=['step_id'])] == ['step', 'execute']
+
+    # We only keep the most recently finished spans
+    with profiler.span('step', 'other_step_id', 'add_column'):
+        pass
+    assert [(span['name'], span['step_id']) for span in profiler.get_spans()] == [
+        ('step', 'step_id'), ('sheet_data_json', None), ('step', 'other_step_id')
+    ]
+
+    profiler.clear()
+    assert profiler.get_spans() == []
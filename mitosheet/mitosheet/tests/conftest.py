@@ -7,6 +7,7 @@ import pytest
 import os
 
 from mitosheet.saved_analyses import _get_all_analysis_filenames, _delete_analyses
+from mitosheet.saved_analyses.save_utils import saved_analysis_writer
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -31,4 +32,15 @@ def cleanup_files():
     # Find all the new analysis file names (generated by tests)
     new_analysis_filenames = curr_analysis_filenames.difference(old_analysis_filenames)
     # Delete them
-    _delete_analyses(new_analysis_filenames)
\ No newline at end of file
+    _delete_analyses(new_analysis_filenames)
+
+
+@pytest.fixture(autouse=True)
+def flush_saved_analyses():
+    """
+    Edits write the analysis in the background. This fixture writes any analyses
+    that are waiting to be written at the end of each test, so that they are not
+    written during a later test (which might have written that file itself).
+    """
+    yield
+    saved_analysis_writer.flush()
@@ -30,12 +30,24 @@ IF_TESTS = [
 
     ([pd.Series(['T', 'F']), pd.Series([1, None]), pd.Series([None, 4])], pd.Series([1.0, 4.0])),
     ([pd.Series([1, 0]), pd.Series([1, None]), pd.Series([None, 4])], pd.Series([1.0, 4.0])),
+    ([pd.Series([True, False]), pd.Series([True, False]), 0], pd.Series([True, 0], dtype='object')),
+    ([pd.Series([True, False]), pd.Series([1, 2]), 'A'], pd.Series([1, 'A'])),
+    ([pd.Series([True, False, True], index=[2, 0, 1]), pd.Series([1, 2, 3]), pd.Series([4, 5, 6])], pd.Series([3, 4, 2], index=[2, 0, 1])),
+    ([pd.Series([True, False]), pd.Series(pd.to_datetime(['2017-01-01', '2017-01-02']).tz_localize('UTC')), pd.NaT], pd.Series(pd.to_datetime(['2017-01-01', None]).tz_localize('UTC'))),
+    ([pd.Series([True, False]), pd.Series(['A', 'B'], dtype='category'), 'C'], pd.Series(['A', 'C'])),
+    ([pd.Series([True, True]), pd.Series([1, 2]), pd.Series([1.5, 2.5])], pd.Series([1, 2])),
+    ([pd.Series([False, False]), pd.Series([1, 2]), pd.Series([1.5, 2.5])], pd.Series([1.5, 2.5])),
+    ([pd.Series([True, False]), pd.Series([1, 2]), pd.Series([1.5, 2.5])], pd.Series([1.0, 2.5])),
+    ([pd.Series([True, True]), 1, 2.5], pd.Series([1, 1])),
+    ([pd.Series([True, False]), 1, 2.5], pd.Series([1.0, 2.5])),
+    ([pd.Series([True, True]), pd.Series([1, 2], dtype=object), 'A'], pd.Series([1, 2])),
 ]
 @pytest.mark.parametrize("_argv, expected", IF_TESTS)
 def test_if_direct(_argv, expected):
     result = IF(*_argv)
     if isinstance(result, pd.Series):
         assert result.equals(expected)
+        assert result.dtype == expected.dtype
     else: 
         assert result == expected
 
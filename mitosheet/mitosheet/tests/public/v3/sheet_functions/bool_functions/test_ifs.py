@@ -83,6 +83,13 @@ IFS_TESTS = [
         ],
         pd.Series(['option1', None])
     ),
+    (
+        [
+            pd.Series([True, False]), pd.Series([None, 'option1']),
+            pd.Series([True, True]), 'option2',
+        ],
+        pd.Series(['option2', 'option2'])
+    ),
     (
         [
             True, 'option1',
@@ -129,6 +136,18 @@ def test_ifs_direct(_argv, expected):
         assert result == expected
 
 
+IFS_DTYPE_TESTS = [
+    ([pd.Series([True, True]), pd.Series([1, 2]), pd.Series([True, True]), 0], 'int64'),
+    ([pd.Series([True, False]), pd.Series([1, 2]), pd.Series([True, True]), 0], 'float64'),
+    ([pd.Series([True, False]), pd.Series([1, 2])], 'float64'),
+    ([pd.Series([True, False]), pd.Series([1.5, 2.5]), pd.Series([False, True]), 1], 'float64'),
+    ([pd.Series([True, False]), pd.Series(['A', 'B'])], 'object'),
+]
+@pytest.mark.parametrize("_argv, expected_dtype", IFS_DTYPE_TESTS)
+def test_ifs_dtype(_argv, expected_dtype):
+    assert IFS(*_argv).dtype == expected_dtype
+
+
 @pytest.mark.parametrize("_argv, expected", TEST_IFS_POST_PANDAS_1_2)
 @pandas_post_1_2_only
 def test_ifs_post_pandas_1_2(_argv, expected):
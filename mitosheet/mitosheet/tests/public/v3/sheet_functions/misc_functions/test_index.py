@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for the INDEX function.
+"""
+
+import pytest
+import pandas as pd
+
+from mitosheet.public.v3.sheet_functions.misc_functions import INDEX, MATCH
+
+from mitosheet.errors import MitoError
+from mitosheet.tests.test_utils import create_mito_wrapper
+
+INDEX_VALID_TESTS = [
+    ([pd.DataFrame({'D': ['a', 'b', 'c']}), pd.Series([3, 1, 2])], pd.Series(['c', 'a', 'b'])),
+    ([pd.DataFrame({'D': ['a', 'b', 'c'], 'E': [1, 2, 3]}), pd.Series([3, 0, None, 4], index=[5, 6, 7, 8]), 2], pd.Series([3, None, None, None], index=[5, 6, 7, 8])),
+    ([pd.Series(['a', 'b', 'c']), 2], 'b'),
+    ([pd.Series(['a', 'b', 'c']), 4], None),
+    ([pd.Series(['a', 'b', 'c']), None], None),
+]
+
+@pytest.mark.parametrize("_argv, expected", INDEX_VALID_TESTS)
+def test_index_direct(_argv, expected):
+    result = INDEX(*_argv)
+    if isinstance(result, pd.Series):
+        pd.testing.assert_series_equal(result, expected, check_names=False, check_dtype=False)
+    else: 
+        assert result == expected
+
+
+def test_index_invalid_column_number_errors():
+    with pytest.raises(MitoError) as e_info:
+        INDEX(pd.DataFrame({'D': [1, 2]}), pd.Series([1]), 2)
+    assert e_info.value.type_ == 'invalid_args_error'
+
+
+def test_index_match():
+    keys = pd.DataFrame({'Key': ['y', 'x', 'y']})
+    values = pd.DataFrame({'Value': [1, 2, 3]})
+
+    result = INDEX(values, MATCH(pd.Series(['x', 'Y', 'z']), keys, 0))
+
+    pd.testing.assert_series_equal(result, pd.Series([2, 1, None]), check_dtype=False)
+
+
+def test_index_match_in_other_sheet():
+    mito = create_mito_wrapper(
+        pd.DataFrame({'A': ['x', 'y', 'z']}),
+        pd.DataFrame({'Key': ['Y', 'X'], 'Value': ['b', 'a']})
+    )
+    mito.set_formula('=INDEX(df2!Value:Value, MATCH(A0, df2!Key:Key, 0))', 0, 'B', add_column=True)
+
+    result = mito.get_column(0, 'B', as_list=True)
+    assert result[:2] == ['a', 'b']
+    assert pd.isna(result[2])
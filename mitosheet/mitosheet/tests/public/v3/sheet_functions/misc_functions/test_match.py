@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for the MATCH function.
+"""
+
+import pytest
+import pandas as pd
+
+from mitosheet.public.v3.sheet_functions.misc_functions import MATCH
+
+from mitosheet.errors import MitoError
+
+MATCH_VALID_TESTS = [
+    ([pd.Series([3, 1, 2]), pd.DataFrame({'D': [1, 2, 3]})], pd.Series([3, 1, 2])),
+    ([pd.Series([3, 1, 4]), pd.Series([1, 2, 3]), 0], pd.Series([3, 1, None])),
+    ([pd.Series(['a', 'B'], index=[5, 6]), pd.Series(['b', 'A', 'a'])], pd.Series([2, 1], index=[5, 6])),
+    (['b', pd.Series(['a', 'B'])], 2),
+    (['c', pd.Series(['a', 'B'])], None),
+]
+
+@pytest.mark.parametrize("_argv, expected", MATCH_VALID_TESTS)
+def test_match_direct(_argv, expected):
+    result = MATCH(*_argv)
+    if isinstance(result, pd.Series):
+        pd.testing.assert_series_equal(result, expected, check_names=False, check_dtype=False)
+    else: 
+        assert result == expected
+
+
+def test_match_only_supports_exact_matches():
+    with pytest.raises(MitoError) as e_info:
+        MATCH(pd.Series([1]), pd.Series([1, 2]), 1)
+    assert e_info.value.type_ == 'invalid_args_error'
@@ -7,9 +7,12 @@
 Contains tests for the TYPE function.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import pandas as pd
 
+from mitosheet.public.v3.lookup_index import MAX_LOOKUP_INDEX_CACHE_SIZE, _lookup_index_cache
 from mitosheet.public.v3.sheet_functions.misc_functions import VLOOKUP
 
 from mitosheet.errors import MitoError
@@ -270,3 +273,24 @@ def test_vlookup_with_datetime():
         })
     )
 
+
+def test_vlookup_after_where_is_edited_in_place():
+    where = pd.DataFrame({'A': ['a', 'b'], 'B': [1, 2]})
+    assert VLOOKUP(pd.Series(['a', 'c']), where, 2).tolist()[0] == 1
+
+    # The lookup index of the where range is cached, so check we don't use the old one
+    where.loc[1, 'A'] = 'c'
+    assert VLOOKUP(pd.Series(['a', 'c']), where, 2).tolist() == [1, 2]
+
+
+def test_vlookup_in_many_threads():
+    # Steps are executed in different threads on replay, and so share the lookup index cache
+    def vlookup(i):
+        where = pd.DataFrame({'A': [f'{i}_{j}' for j in range(100)], 'B': range(100)})
+        return VLOOKUP(pd.Series([f'{i}_{j}' for j in range(99, -1, -1)]), where, 2).tolist()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(vlookup, [i % 12 for i in range(200)]))
+
+    assert all(result == list(range(99, -1, -1)) for result in results)
+    assert len(_lookup_index_cache) <= MAX_LOOKUP_INDEX_CACHE_SIZE
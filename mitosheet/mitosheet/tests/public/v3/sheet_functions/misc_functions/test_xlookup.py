@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for the XLOOKUP function.
+"""
+
+import pytest
+import pandas as pd
+
+from mitosheet.public.v3.sheet_functions.misc_functions import XLOOKUP
+
+from mitosheet.errors import MitoError
+from mitosheet.tests.test_utils import create_mito_wrapper
+
+XLOOKUP_VALID_TESTS = [
+    (
+        [
+            pd.Series([3, 1, 2]),
+            pd.DataFrame({'D': [1, 2, 3]}),
+            pd.DataFrame({'E': ['d', 'e', 'f']}),
+        ],
+        pd.Series(['f', 'd', 'e'])
+    ),
+    # Only the first match is returned, and the lookup is case insensitive
+    (
+        [
+            pd.Series(['a', 'B', 'c']),
+            pd.Series(['A', 'b', 'a']),
+            pd.Series([1, 2, 3]),
+        ],
+        pd.Series([1, 2, None])
+    ),
+    (
+        [
+            pd.Series(['a', 'B', 'c'], index=['i', 'j', 'k']),
+            pd.Series(['A', 'b', 'a'], index=[10, 11, 12]),
+            pd.Series([1, 2, 3], index=[10, 11, 12]),
+            0
+        ],
+        pd.Series([1, 2, 0], index=['i', 'j', 'k'])
+    ),
+    (
+        [
+            pd.Series([pd.Timestamp('2011-02-12'), pd.Timestamp('2018-04-02')]),
+            pd.DataFrame({'a': [pd.Timestamp('2018-04-02'), pd.Timestamp('2011-02-12')]}),
+            pd.DataFrame({'b': [pd.Timestamp('2000-01-01'), pd.Timestamp('2001-01-01')]}),
+        ],
+        pd.Series([pd.Timestamp('2001-01-01'), pd.Timestamp('2000-01-01')])
+    ),
+    # Tests for when the lookup value is a primitive
+    (
+        [
+            'B',
+            pd.Series(['a', 'b']),
+            pd.Series([1, 2]),
+        ],
+        2
+    ),
+    (
+        [
+            'c',
+            pd.Series(['a', 'b']),
+            pd.Series([1, 2]),
+            'missing'
+        ],
+        'missing'
+    ),
+]
+
+@pytest.mark.parametrize("_argv, expected", XLOOKUP_VALID_TESTS)
+def test_xlookup_direct(_argv, expected):
+    result = XLOOKUP(*_argv)
+    if isinstance(result, pd.Series):
+        pd.testing.assert_series_equal(result, expected, check_names=False, check_dtype=False)
+    else: 
+        assert result == expected
+
+
+def test_xlookup_different_lengths_errors():
+    with pytest.raises(MitoError) as e_info:
+        XLOOKUP(pd.Series([1]), pd.Series([1, 2]), pd.Series([1, 2, 3]))
+    assert e_info.value.type_ == 'invalid_args_error'
+
+
+def test_xlookup_in_other_sheet():
+    mito = create_mito_wrapper(
+        pd.DataFrame({'A': ['x', 'y', 'z']}),
+        pd.DataFrame({'Key': ['Y', 'X'], 'Value': [2, 1]})
+    )
+    mito.set_formula('=XLOOKUP(A0, df2!Key:Key, df2!Value:Value, 0)', 0, 'B', add_column=True)
+
+    assert mito.get_column(0, 'B', as_list=True) == [1, 2, 0]
+
+
+RETURN_RANGE_DTYPE_TESTS = [
+    pd.Series([1, 2, 3]),
+    pd.Series([1.5, 2.5, 3.5]),
+    pd.Series(['a', 'b', 'c']),
+    pd.Series([True, False, True]),
+    pd.Series(pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-03'])),
+    pd.Series([1, 2, 3], dtype='Int64'),
+]
+@pytest.mark.filterwarnings('error')
+@pytest.mark.parametrize("return_range", RETURN_RANGE_DTYPE_TESTS)
+def test_xlookup_does_not_warn(return_range):
+    result = XLOOKUP(pd.Series([3, 4, 1]), pd.Series([1, 2, 3]), return_range)
+
+    assert result[0] == return_range[2]
+    assert pd.isna(result[1])
+    assert result[2] == return_range[0]
@@ -13,7 +13,7 @@ import random
 import pandas as pd
 import pytest
 from mitosheet.saved_analyses import SAVED_ANALYSIS_FOLDER, write_save_analysis_file
-from mitosheet.saved_analyses.save_utils import read_and_upgrade_analysis
+from mitosheet.saved_analyses.save_utils import SavedAnalysisWriter, get_saved_analysis, read_analysis, read_and_upgrade_analysis
 from mitosheet.types import FC_NUMBER_EXACTLY
 from mitosheet.tests.test_utils import (create_mito_wrapper_with_data,
                                         create_mito_wrapper)
@@ -369,4 +369,99 @@ def test_replay_failed_analysis_does_not_change_public_interface_version():
     new_mito.replay_analysis(random_name)
 
     assert new_mito.mito_backend.steps_manager.public_interface_version == starting_val
-    assert len(new_mito.optimized_code_chunks) == 0
\ No newline at end of file
+    assert len(new_mito.optimized_code_chunks) == 0
+
+def test_edits_write_analysis_in_background():
+    mito = create_mito_wrapper_with_data([1, 2, 3])
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.set_formula('=A + 2', 0, 'C', add_column=True)
+
+    # Reading the analysis writes any analyses waiting to be written
+    analysis = read_analysis(mito.mito_backend.analysis_name)
+    assert analysis is not None
+    assert len(analysis['steps_data']) == 4
+    assert analysis['code'] == mito.mito_backend.steps_manager.code()
+
+
+def test_saved_analysis_writer_only_writes_most_recent_analysis(tmp_path):
+    writer = SavedAnalysisWriter(delay_seconds=60)
+    analysis_path = str(tmp_path / 'analysis.json')
+
+    writer.write_in_background(analysis_path, {'steps_data': [1]})
+    writer.write_in_background(analysis_path, {'steps_data': [1, 2]})
+    assert not os.path.exists(analysis_path)
+
+    writer.flush()
+    with open(analysis_path) as f:
+        assert json.load(f) == {'steps_data': [1, 2]}
+    assert os.listdir(tmp_path) == ['analysis.json']
+
+
+def test_saved_analysis_writer_writes_after_delay(tmp_path):
+    writer = SavedAnalysisWriter(delay_seconds=0)
+    analysis_path = str(tmp_path / 'analysis.json')
+
+    writer.write_in_background(analysis_path, {'steps_data': [1]})
+    timer = writer._timer
+    if timer is not None:
+        timer.join()
+
+    with open(analysis_path) as f:
+        assert json.load(f) == {'steps_data': [1]}
+
+
+def test_saved_analysis_writer_write_replaces_waiting_analysis(tmp_path):
+    writer = SavedAnalysisWriter(delay_seconds=60)
+    analysis_path = str(tmp_path / 'analysis.json')
+
+    writer.write_in_background(analysis_path, {'steps_data': [1]})
+    writer.write(analysis_path, {'steps_data': [1, 2]})
+    writer.flush()
+
+    with open(analysis_path) as f:
+        assert json.load(f) == {'steps_data': [1, 2]}
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='Windows does not have file permission bits')
+def test_saved_analysis_writer_writes_files_with_default_permissions(tmp_path):
+    writer = SavedAnalysisWriter()
+    analysis_path = str(tmp_path / 'analysis.json')
+    with open(tmp_path / 'file.txt', 'w') as f:
+        f.write('')
+
+    writer.write(analysis_path, {'steps_data': [1]})
+
+    assert os.stat(analysis_path).st_mode & 0o777 == os.stat(tmp_path / 'file.txt').st_mode & 0o777
+
+def test_saved_analysis_writer_leaves_no_temporary_files(tmp_path):
+    writer = SavedAnalysisWriter()
+    analysis_path = str(tmp_path / 'analysis.json')
+
+    writer.write(analysis_path, {'steps_data': [1]})
+    writer.write(analysis_path, {'steps_data': [1, 2]})
+
+    assert os.listdir(tmp_path) == ['analysis.json']
+
+
+def test_edit_transpiles_code_once(monkeypatch):
+    import mitosheet.steps_manager as steps_manager_module
+    mito = create_mito_wrapper_with_data([1])
+
+    transpile_calls = []
+    original_transpile = steps_manager_module.transpile
+    def transpile(*args, **kwargs):
+        transpile_calls.append(args)
+        return original_transpile(*args, **kwargs)
+    monkeypatch.setattr(steps_manager_module, 'transpile', transpile)
+
+    # Both the response to the frontend and the saved analysis use the same code
+    mito.add_column(0, 'B')
+    assert len(transpile_calls) == 1
+
+    code = mito.mito_backend.steps_manager.code()
+    assert get_saved_analysis(mito.mito_backend.steps_manager)['code'] == code
+    assert len(transpile_calls) == 1
+
+    mito.mito_backend.steps_manager.code_options = {**mito.mito_backend.steps_manager.code_options, 'as_function': True}
+    assert mito.mito_backend.steps_manager.code() != code
+    assert len(transpile_calls) == 2
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Contains tests for Recalculate Dependents
+"""
+
+import pandas as pd
+import pytest
+
+from mitosheet.errors import MitoError
+from mitosheet.formula_dependency_graph import (
+    get_dependents_in_topological_order, get_formula_dependency_graph)
+from mitosheet.tests.test_utils import create_mito_wrapper
+
+
+def test_recalculate_dependents_in_order():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.add_column(0, 'C')
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.set_formula('=B * 10', 0, 'C')
+    mito.set_formula('=5', 0, 'D', add_column=True)
+    mito.set_formula('=C + B', 0, 'E', add_column=True)
+    mito.set_cell_value(0, 'A', 0, 10)
+
+    mito.recalculate_dependents(0, 'A')
+
+    assert mito.dfs[0].equals(pd.DataFrame({
+        'A': [10, 2, 3], 'C': [110, 30, 40], 'B': [11, 3, 4], 'D': [5, 5, 5], 'E': [121, 33, 44]
+    }))
+    assert mito.transpiled_code[-4:] == [
+        "df1['B'] = df1['A'] + 1",
+        "df1['C'] = df1['B'] * 10",
+        "df1['E'] = df1['C'] + df1['B']",
+        '',
+    ]
+
+
+def test_recalculate_dependents_with_row_offsets_and_ranges():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3], 'B': [1, 1, 1]}))
+    mito.set_formula('=A0', 0, 'C', add_column=True, formula_label=1)
+    mito.set_formula('=SUM(A:B)', 0, 'D', add_column=True)
+    assert mito.dfs[0]['D'].tolist() == [9, 9, 9]
+    mito.set_cell_value(0, 'A', 0, 10)
+
+    mito.recalculate_dependents(0, 'A')
+
+    assert mito.dfs[0]['C'].tolist() == [0, 10, 2]
+    assert mito.dfs[0]['D'].tolist() == [18, 18, 18]
+
+
+def test_recalculate_dependents_of_specific_index_labels():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.set_formula('=A * 2', 0, 'B', index_labels=[2])
+    mito.set_cell_value(0, 'A', 2, 10)
+
+    mito.recalculate_dependents(0, 'A')
+
+    assert mito.dfs[0]['B'].tolist() == [2, 3, 20]
+
+
+def test_recalculate_dependents_with_no_dependents():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]}))
+    mito.set_formula('=A + 1', 0, 'C', add_column=True)
+
+    mito.recalculate_dependents(0, 'B')
+
+    assert mito.dfs[0].equals(pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6], 'C': [2, 3, 4]}))
+
+
+def test_recalculate_dependents_circular_reference_fails():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3], 'B': [0, 0, 0], 'C': [0, 0, 0]}))
+    mito.set_formula('=A + C', 0, 'B')
+    mito.set_formula('=B + 1', 0, 'C')
+
+    assert not mito.recalculate_dependents(0, 'A')
+    assert mito.dfs[0]['C'].tolist() == [2, 3, 4]
+
+
+
+def test_recalculate_dependents_after_rename():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3], 'C': [1, 1, 1]}))
+    mito.set_formula('=A + C', 0, 'B', add_column=True)
+    mito.rename_column(0, 'A', 'Z')
+    mito.set_cell_value(0, 'Z', 0, 10)
+
+    assert mito.recalculate_dependents(0, 'Z')
+    assert mito.dfs[0]['B'].tolist() == [11, 3, 4]
+
+    mito.set_cell_value(0, 'C', 0, 5)
+    assert mito.recalculate_dependents(0, 'C')
+    assert mito.dfs[0]['B'].tolist() == [15, 3, 4]
+
+
+def test_rename_column_renames_it_in_formulas_in_other_sheets():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}), pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]}))
+    mito.set_formula('=VLOOKUP(A, df2!A:B, 2) + A', 0, 'B', add_column=True)
+    formulas_before_rename = mito.curr_step.column_formulas[0]['B']
+
+    mito.rename_column(1, 'A', 'Z')
+
+    frontend_formula = mito.curr_step.column_formulas[0]['B'][0]['frontend_formula']
+    assert [part['display_column_header'] for part in frontend_formula if 'display_column_header' in part] == ['A', 'Z', 'B', 'A']
+    # The formulas of the previous step are not changed
+    assert mito.steps_including_skipped[-2].column_formulas[0]['B'] is formulas_before_rename
+    assert [part['display_column_header'] for part in formulas_before_rename[0]['frontend_formula'] if 'display_column_header' in part] == ['A', 'A', 'B', 'A']
+
+def test_formula_dependency_graph_ignores_other_sheets():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}), pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]}))
+    mito.set_formula('=VLOOKUP(A, df2!A:B, 2)', 0, 'B', add_column=True)
+
+    graph = get_formula_dependency_graph(mito.mito_backend.steps_manager.curr_step.post_state, 0)
+    assert graph == {'B': {'A'}}
+
+
+def test_get_dependents_in_topological_order():
+    graph = {'B': {'A'}, 'C': {'A'}, 'D': {'B', 'C'}, 'E': {'D'}, 'F': {'G'}}
+    assert get_dependents_in_topological_order(graph, 'A') == ['B', 'C', 'D', 'E']
+    assert get_dependents_in_topological_order(graph, 'C') == ['D', 'E']
+    assert get_dependents_in_topological_order(graph, 'E') == []
+
+    with pytest.raises(MitoError):
+        get_dependents_in_topological_order({'B': {'A', 'C'}, 'C': {'B'}}, 'A')
@@ -6,11 +6,16 @@
 """
 Contains tests for set column formula edit events
 """
+from collections import OrderedDict
+
 import pandas as pd
 import pytest
 
+from mitosheet import parser
 from mitosheet.column_headers import get_column_header_id
+from mitosheet.enterprise.mito_config import MitoConfig
 from mitosheet.step_performers.sort import SORT_DIRECTION_ASCENDING
+from mitosheet.steps_manager import StepsManager
 from mitosheet.tests.test_utils import (create_mito_wrapper_with_data,
                                         create_mito_wrapper)
 from mitosheet.tests.decorators import pandas_post_1_only
@@ -91,6 +96,26 @@ def test_edit_to_same_formula_no_error():
     assert mito.curr_step.column_formulas[0]['B'][0]['frontend_formula'] == [{'string': '=', 'type': 'string part'}, {'display_column_header': 'A', 'row_offset': 0, 'type': '{HEADER}{INDEX}'}]
 
 
+def test_set_formula_without_row_offset_does_not_store_index():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}, index=['x', 'y', 'z']))
+    mito.set_formula('=A', 0, 'B', add_column=True)
+
+    assert mito.curr_step.column_formulas[0]['B'][0]['index'] is None
+
+
+def test_set_formula_with_row_offset_on_range_index_stores_range():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.set_formula('=A0', 0, 'B', add_column=True, formula_label=1)
+
+    assert mito.curr_step.column_formulas[0]['B'][0]['index'] == {'type': 'range', 'start': 0, 'stop': 3, 'step': 1}
+
+
+def test_set_formula_with_row_offset_on_labeled_index_stores_labels():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}, index=['x', 'y', 'z']))
+    mito.set_formula('=Ax', 0, 'B', add_column=True, formula_label='y')
+
+    assert mito.curr_step.column_formulas[0]['B'][0]['index'] == {'type': 'labels', 'labels': ['x', 'y', 'z']}
+
 def test_formulas_fill_missing_parens():
     mito = create_mito_wrapper_with_data([123])
     mito.add_column(0, 'B')
@@ -724,4 +749,31 @@ def test_set_formula_wrong_column_order_wrong_index_order():
     mito.add_column(0, 'D')
     mito.set_formula('=SUM(C1:A0)', 0, 'D')
 
-    assert mito.dfs[0].equals(pd.DataFrame({'A': [1, 2, 3], 'B': [1, 2, 3], 'C': [1, 2, 3], 'D': [9, 15, 9]}))
\ No newline at end of file
+    assert mito.dfs[0].equals(pd.DataFrame({'A': [1, 2, 3], 'B': [1, 2, 3], 'C': [1, 2, 3], 'D': [9, 15, 9]}))
+
+def test_set_formula_parses_formula_once(monkeypatch):
+    parsed_formulas = []
+    _parse_formula = parser._parse_formula
+    def counting_parse_formula(*args):
+        parsed_formulas.append(args[0])
+        return _parse_formula(*args)
+    monkeypatch.setattr(parser, '_parse_formula', counting_parse_formula)
+    monkeypatch.setattr(parser, '_parsed_formula_cache', OrderedDict())
+
+    steps_manager = StepsManager([pd.DataFrame({'A': [1, 2, 3], 'B': [0, 0, 0]})], MitoConfig())
+    steps_manager.execute_steps_data([{
+        'step_type': 'set_column_formula',
+        'params': {
+            'sheet_index': 0,
+            'column_id': get_column_header_id('B'),
+            'formula_label': 0,
+            'index_labels_formula_is_applied_to': {'type': FORMULA_ENTIRE_COLUMN_TYPE},
+            'new_formula': '=A + 1',
+            'public_interface_version': 3
+        }
+    }])
+
+    # Saturating, executing, and transpiling the step all use the same parsed formula
+    assert "df1['B'] = df1['A'] + 1" in steps_manager.code()
+    assert steps_manager.dfs[0]['B'].tolist() == [2, 3, 4]
+    assert parsed_formulas == ['=A + 1']
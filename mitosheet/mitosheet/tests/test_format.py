@@ -101,4 +101,28 @@ def test_sheet_json_holds_timed_deltas_non_standard_dtype():
     assert get_value_helper(sheet_data, 0, 0) == '31 days 00:00:00'
     assert get_value_helper(sheet_data, 1, 0) == '31 days 00:00:00'
     assert get_value_helper(sheet_data, 2, 0) == '31 days 00:00:00'
-    assert get_value_helper(sheet_data, 3, 0) == '31 days 00:00:00'
\ No newline at end of file
+    assert get_value_helper(sheet_data, 3, 0) == '31 days 00:00:00'
+
+DISPLAY_TESTS = [
+    (pd.Series([1.5, float('inf'), float('-inf'), None]), [1.5, 'NaN', 'NaN', 'NaN']),
+    (pd.Series([1, 'a', None, float('inf')]), [1, 'a', 'NaN', 'NaN']),
+    (pd.Series([1, None], dtype='Int64'), [1, 'NaN']),
+    (pd.Series(['a', None], dtype='string'), ['a', 'NaN']),
+    (pd.Series(pd.to_datetime(['2020-01-01 01:02:03.5', None])), ['2020-01-01 01:02:03', 'NaN']),
+    (pd.Series(pd.date_range('2020-01-01', periods=2, freq='37min', tz='US/Eastern')), ['2020-01-01 00:00:00', '2020-01-01 00:37:00']),
+    (pd.Series(pd.to_timedelta(['1 days 00:00:01.5', '-1.5h', '1ns', '1us', None])), ['1 days 00:00:01.500000', '-1 days +22:30:00', '0 days 00:00:00.000000001', '0 days 00:00:00.000001', 'NaT']),
+]
+@pytest.mark.parametrize("column, expected_column_data", DISPLAY_TESTS)
+def test_sheet_json_displays_column(column, expected_column_data):
+    mito = create_mito_wrapper(pd.DataFrame({'A': column}))
+
+    sheet_data = json.loads(mito.sheet_data_json)[0]
+    assert sheet_data['data'][0]['columnData'] == expected_column_data
+
+
+def test_sheet_json_displays_timedelta_index():
+    df = pd.DataFrame({'A': [1, 2]}, index=pd.to_timedelta(['1 days', '-1.5h']))
+    mito = create_mito_wrapper(df)
+
+    sheet_data = json.loads(mito.sheet_data_json)[0]
+    assert sheet_data['index'] == ['1 days 00:00:00', '-1 days +22:30:00']
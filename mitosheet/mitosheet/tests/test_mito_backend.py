@@ -18,7 +18,7 @@ from mitosheet.mito_backend import MitoBackend, get_mito_backend
 from mitosheet.tests.test_utils import create_mito_wrapper_with_data, create_mito_wrapper
 from mitosheet.transpiler.transpile import transpile
 from mitosheet.tests.decorators import pandas_post_1_only
-from mitosheet.utils import MAX_COLUMNS
+from mitosheet.utils import MAX_COLUMNS, MAX_ROWS
 
 
 def test_example_creation_blank():
@@ -204,4 +204,133 @@ def test_create_backend_default_apply_formula_to_column():
     mito_backend = MitoBackend()
     assert mito_backend.steps_manager.default_apply_formula_to_column == True
 
-    
\ No newline at end of file
+    
+
+def apply_sheet_data_patch(sheet_data_array, sheet_data_patch):
+    """Applies a sheet data patch in the same way as applySheetDataPatch in the frontend"""
+    new_sheet_data_array = sheet_data_array[:sheet_data_patch['numSheets']]
+    for sheet_patch in sheet_data_patch['sheetPatches']:
+        sheet_index = sheet_patch['sheetIndex']
+        if 'sheetData' in sheet_patch:
+            if sheet_index == len(new_sheet_data_array):
+                new_sheet_data_array.append(sheet_patch['sheetData'])
+            else:
+                new_sheet_data_array[sheet_index] = sheet_patch['sheetData']
+            continue
+
+        columns = {column['columnID']: column for column in new_sheet_data_array[sheet_index]['data']}
+        columns.update({column['columnID']: column for column in sheet_patch['changedColumns']})
+        new_sheet_data_array[sheet_index] = {
+            **new_sheet_data_array[sheet_index],
+            **sheet_patch['changedFields'],
+            'data': [columns[column_id] for column_id in sheet_patch['columnIDs']]
+        }
+    return new_sheet_data_array
+
+
+SHEET_DATA_PATCH_TESTS = [
+    (lambda mito: mito.set_formula('=A * 2', 0, 'B'), ['B']),
+    (lambda mito: mito.set_formula('=A + 1', 0, 'D', add_column=True), ['D']),
+    (lambda mito: mito.add_column(0, 'D'), ['D']),
+    (lambda mito: mito.rename_column(0, 'C', 'D'), ['C']),
+    (lambda mito: mito.change_column_dtype(0, ['A'], 'float'), ['A']),
+    (lambda mito: mito.delete_columns(0, ['B']), []),
+    (lambda mito: mito.sort(0, 'A', 'descending'), ['A', 'B', 'C']),
+    (lambda mito: mito.filter(0, 'A', 'And', 'greater', 1), ['A', 'B', 'C']),
+    (lambda mito: mito.duplicate_dataframe(0), None),
+    (lambda mito: mito.delete_dataframe(0), None),
+    (lambda mito: mito.undo(), None),
+]
+@pytest.mark.parametrize("edit, expected_changed_column_ids", SHEET_DATA_PATCH_TESTS)
+def test_edit_response_patches_sheet_data_when_frontend_is_up_to_date(edit, expected_changed_column_ids):
+    df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6], 'C': ['a', 'b', 'c']})
+    mito = create_mito_wrapper(df, pd.DataFrame({'X': [1]}))
+    mito.set_formula('=A + 10', 0, 'B')
+    mito_backend = mito.mito_backend
+
+    # The frontend has the current sheet data, sends its version with each message,
+    # and applies the patches it receives
+    frontend = {
+        'sheet_data_array': json.loads(mito_backend.steps_manager.sheet_data_json),
+        'sheet_data_version': mito_backend.steps_manager.sheet_data_version,
+    }
+    sheet_data_patches = []
+    def send(response):
+        shared_variables = response['shared_variables']
+        assert 'sheet_data_json' not in shared_variables
+        sheet_data_patch = json.loads(shared_variables['sheet_data_patch_json'])
+        frontend['sheet_data_array'] = apply_sheet_data_patch(frontend['sheet_data_array'], sheet_data_patch)
+        frontend['sheet_data_version'] = shared_variables['sheet_data_version']
+        sheet_data_patches.append(sheet_data_patch)
+
+    receive_message = mito_backend.receive_message
+    mito_backend.receive_message = lambda event: receive_message({**event, 'sheet_data_version': frontend['sheet_data_version']})
+    mito_backend.mito_send = send
+
+    edit(mito)
+
+    assert len(sheet_data_patches) > 0
+    assert frontend['sheet_data_array'] == json.loads(mito_backend.get_shared_state_variables()['sheet_data_json'])
+
+    if expected_changed_column_ids is not None:
+        # Some edits send more than one message, so a column can change in more than one patch
+        changed_column_ids = list(dict.fromkeys(
+            column['columnID']
+            for sheet_data_patch in sheet_data_patches
+            for sheet_patch in sheet_data_patch['sheetPatches']
+            for column in sheet_patch['changedColumns']
+        ))
+        assert changed_column_ids == expected_changed_column_ids
+
+
+def test_edit_response_sends_all_sheet_data_when_frontend_is_out_of_date():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    mito_backend = mito.mito_backend
+    responses = []
+    mito_backend.mito_send = responses.append
+
+    # A frontend that does not send a version gets all the sheet data
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    assert 'sheet_data_json' in responses[-1]['shared_variables']
+
+    # As does a frontend with an old version
+    receive_message = mito_backend.receive_message
+    old_sheet_data_version = mito_backend.steps_manager.sheet_data_version - 1
+    mito_backend.receive_message = lambda event: receive_message({**event, 'sheet_data_version': old_sheet_data_version})
+    mito.set_formula('=A + 2', 0, 'B')
+    assert 'sheet_data_json' in responses[-1]['shared_variables']
+    assert 'sheet_data_patch_json' not in responses[-1]['shared_variables']
+
+
+def test_sheet_data_version_only_changes_when_sheet_data_changes():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    steps_manager = mito.mito_backend.steps_manager
+
+    steps_manager.sheet_data_json
+    sheet_data_version = steps_manager.sheet_data_version
+    steps_manager.sheet_data_json
+    assert steps_manager.sheet_data_version == sheet_data_version
+
+    mito.add_column(0, 'B')
+    assert steps_manager.sheet_data_version == sheet_data_version + 1
+
+
+def test_saved_sheet_data_only_keeps_displayed_rows_of_dataframes():
+    df = pd.DataFrame({'A': range(MAX_ROWS * 4), 'B': range(MAX_ROWS * 4)})
+    mito = create_mito_wrapper(df, pd.DataFrame({'X': [1]}))
+    steps_manager = mito.mito_backend.steps_manager
+
+    mito.set_formula('=A * 2', 0, 'B')
+    previous_sheet_data_array = steps_manager.saved_sheet_data
+    saved_displayed_dfs = steps_manager.saved_displayed_dfs
+
+    assert saved_displayed_dfs[0].shape == (MAX_ROWS, 2)
+    assert not np.shares_memory(saved_displayed_dfs[0]['A'].to_numpy(), steps_manager.dfs[0]['A'].to_numpy())
+
+    # Editing one sheet reuses the displayed df of the other sheet, and reuses 
+    # the data of the columns that did not change
+    mito.set_formula('=A * 3', 0, 'B')
+    sheet_data_array = steps_manager.saved_sheet_data
+    assert steps_manager.saved_displayed_dfs[1] is saved_displayed_dfs[1]
+    assert sheet_data_array[0]['data'][0]['columnData'] is previous_sheet_data_array[0]['data'][0]['columnData']
+    assert sheet_data_array[0]['data'][1]['columnData'] == [i * 3 for i in range(MAX_ROWS)]
@@ -3,12 +3,14 @@
 
 # Copyright (c) Saga Inc.
 # Distributed under the terms of the GPL License.
+from collections import OrderedDict
 from packaging.version import Version
 from typing import Any, Dict, List
 import warnings
 import pytest
 import pandas as pd
 
+from mitosheet import parser
 from mitosheet.errors import MitoError
 from mitosheet.parser import get_backend_formula_from_frontend_formula, parse_formula, safe_contains, get_frontend_formula
 from mitosheet.types import FORMULA_ENTIRE_COLUMN_TYPE, FORMULA_SPECIFIC_INDEX_LABELS_TYPE
@@ -1135,9 +1137,49 @@ def test_parse(formula, column_header, formula_label, df, python_code, functions
         )
 
 
-# Right now, VLOOKUP is the only formula that allows cross-sheet referencing. In the future, 
-# other cross-sheet references in parser can be added here. 
+# Right now, VLOOKUP, XLOOKUP, MATCH, and INDEX are the only formulas that allow cross-sheet 
+# referencing. In the future, other cross-sheet references in parser can be added here. 
 VLOOKUP_TESTS = [
+    (
+        '=XLOOKUP(A0, df_2!C:C, df_2!D:D)',
+        'B',
+        0,
+        [
+            pd.DataFrame(
+                get_number_data_for_df(['A', 'B'], 2),
+                index=pd.RangeIndex(0, 2)
+            ),
+            pd.DataFrame(
+                get_number_data_for_df(['C', 'D'], 2),
+                index=pd.RangeIndex(0, 2)
+            )
+        ],
+        ['df_1', 'df_2'],
+        0,
+        'df_1[\'B\'] = XLOOKUP(df_1[\'A\'], df_2[[\'C\']], df_2[[\'D\']])',
+        set(['XLOOKUP']),
+        set(['A', 'D', 'C'])
+    ),
+    (
+        '=INDEX(df_2!D:D, MATCH(A0, df_2!C:C, 0))',
+        'B',
+        0,
+        [
+            pd.DataFrame(
+                get_number_data_for_df(['A', 'B'], 2),
+                index=pd.RangeIndex(0, 2)
+            ),
+            pd.DataFrame(
+                get_number_data_for_df(['C', 'D'], 2),
+                index=pd.RangeIndex(0, 2)
+            )
+        ],
+        ['df_1', 'df_2'],
+        0,
+        'df_1[\'B\'] = INDEX(df_2[[\'D\']], MATCH(df_1[\'A\'], df_2[[\'C\']], 0))',
+        set(['INDEX', 'MATCH']),
+        set(['A', 'D', 'C'])
+    ),
     (
         '=VLOOKUP(A0, df_2!C:D, 2)',
         'B',
@@ -1409,7 +1451,6 @@ def test_parse_invalid_cross_sheet_formulas(formula, column_header, formula_labe
 
 PARSE_TEST_ERRORS = [
     ('=HLOOKUP(100, A)', 'B', 'invalid_formula_error', 'HLOOKUP'),
-    ('=XLOOKUP(100, A)', 'B', 'invalid_formula_error', 'XLOOKUP'),
     ('=A <> 100', 'B', 'invalid_formula_error', '<>'),
     ('=SUM(A', 'B', 'invalid_formula_error', 'parentheses'),
     ('=A=B', 'B', 'invalid_formula_error', 'equality'),
@@ -1448,4 +1489,56 @@ def test_get_frontend_formula_reconstucts_properly(formula,column_header,formula
 @pytest.mark.parametrize("formula,column_header,formula_label,dfs,df_names,sheet_index,python_code,functions,columns", VLOOKUP_TESTS)
 def test_get_cross_sheet_frontend_formula_reconstucts_properly(formula,column_header,formula_label,dfs,df_names,sheet_index,python_code,functions,columns):
     frontend_formula = get_frontend_formula(formula, formula_label, dfs, df_names, sheet_index)
-    assert get_backend_formula_from_frontend_formula(frontend_formula, formula_label, dfs[sheet_index]) == formula
\ No newline at end of file
+    assert get_backend_formula_from_frontend_formula(frontend_formula, formula_label, dfs[sheet_index]) == formula
+
+def _count_parses(monkeypatch):
+    parsed_formulas = []
+    _parse_formula = parser._parse_formula
+    def counting_parse_formula(*args):
+        parsed_formulas.append(args[0])
+        return _parse_formula(*args)
+    monkeypatch.setattr(parser, '_parse_formula', counting_parse_formula)
+    monkeypatch.setattr(parser, '_parsed_formula_cache', OrderedDict())
+    return parsed_formulas
+
+def test_parse_formula_caches_parsed_formulas(monkeypatch):
+    parsed_formulas = _count_parses(monkeypatch)
+    df = pd.DataFrame({'A': [1, 2, 3]}, index=['a', 'b', 'c'])
+    code, functions, _, _ = parse_formula('=SUM(A, 1)', 'B', 'a', {'type': FORMULA_ENTIRE_COLUMN_TYPE}, [df], ['df'], 0)
+    functions.add('CHANGED')
+
+    assert parse_formula('=SUM(A, 1)', 'B', 'a', {'type': FORMULA_ENTIRE_COLUMN_TYPE}, [df.copy(deep=False)], ['df'], 0) == (code, {'SUM'}, {'A'}, set())
+    assert len(parsed_formulas) == 1
+
+    # A new index, new column headers, or a different column header type means parsing again
+    parse_formula('=SUM(A, 1)', 'B', 'a', {'type': FORMULA_ENTIRE_COLUMN_TYPE}, [df.sort_index()], ['df'], 0)
+    parse_formula('=SUM(A, 1)', 'B', 'a', {'type': FORMULA_ENTIRE_COLUMN_TYPE}, [df.assign(C=1)], ['df'], 0)
+    parse_formula('=SUM(A, 1)', 1, 'a', {'type': FORMULA_ENTIRE_COLUMN_TYPE}, [df], ['df'], 0)
+    parse_formula('=SUM(A, 1)', True, 'a', {'type': FORMULA_ENTIRE_COLUMN_TYPE}, [df], ['df'], 0)
+    assert len(parsed_formulas) == 5
+
+def test_parse_formula_does_not_cache_errors(monkeypatch):
+    parsed_formulas = _count_parses(monkeypatch)
+    df = pd.DataFrame({'A': [1, 2, 3]})
+    for _ in range(2):
+        with pytest.raises(MitoError):
+            parse_formula('=A = 1', 'B', 0, {'type': FORMULA_ENTIRE_COLUMN_TYPE}, [df], ['df'], 0)
+    assert len(parsed_formulas) == 2
+
+GET_COLUMN_HEADER_OCCURRENCES_TESTS = [
+    ('=A + B', ['A', 'B'], [[(1, 2)], [(5, 6)]]),
+    ('=AAA', ['AA', 'A'], [[(1, 3)], [(1, 2), (2, 3), (3, 4)]]),
+    ('=TRUE + true + 1', [True, 1], [[(8, 12)], [(15, 16)]]),
+    ('=A, B', [('A', 'B')], [[(1, 5)]]),
+    ('=A', ['', 'A'], [[(0, 0), (1, 1), (2, 2)], [(1, 2)]]),
+]
+@pytest.mark.parametrize("formula,column_headers,occurrences", GET_COLUMN_HEADER_OCCURRENCES_TESTS)
+def test_get_column_header_occurrences(formula, column_headers, occurrences):
+    assert parser.get_column_header_occurrences(formula, column_headers) == occurrences
+
+def test_parse_formula_on_wide_sheet():
+    df = pd.DataFrame({f'col_{i}': [1, 2] for i in range(2000)})
+    code, functions, columns, _ = parse_formula('=IF(col_1 > col_10, col_100, col_1999)', 'col_0', 0, {'type': FORMULA_ENTIRE_COLUMN_TYPE}, [df], ['df'], 0)
+    assert code == "df['col_0'] = IF(df['col_1'] > df['col_10'], df['col_100'], df['col_1999'])"
+    assert functions == {'IF'}
+    assert columns == {'col_1', 'col_10', 'col_100', 'col_1999'}
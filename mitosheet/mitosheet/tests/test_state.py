@@ -7,6 +7,8 @@
 Contains tests for the state class
 """
 from mitosheet.state import DATAFRAME_SOURCE_IMPORTED, DATAFRAME_SOURCE_PASSED, State
+from mitosheet.tests.test_utils import create_mito_wrapper_with_data
+import numpy as np
 import pandas as pd
 
 def test_state_can_add_df_to_end():
@@ -29,3 +31,65 @@ def test_state_can_add_df_to_middle():
     
     assert state.df_sources == [DATAFRAME_SOURCE_IMPORTED]
 
+
+def test_state_copy_on_write_only_copies_modified_sheet_metadata():
+    df1 = pd.DataFrame({'A': [123]})
+    df2 = pd.DataFrame({'B': [456]})
+    state = State([df1, df2], 3)
+    new_state = state.copy(deep_sheet_indexes=[0], metadata_sheet_indexes=[0])
+
+    # The modified sheet's metadata is copied
+    assert new_state.column_formulas[0] is not state.column_formulas[0]
+    assert new_state.column_filters[0] is not state.column_filters[0]
+    assert new_state.df_formats[0] is not state.df_formats[0]
+    assert new_state.column_ids.column_id_to_column_header[0] is not state.column_ids.column_id_to_column_header[0]
+
+    # And the other sheet's metadata is shared
+    assert new_state.column_formulas[1] is state.column_formulas[1]
+    assert new_state.column_filters[1] is state.column_filters[1]
+    assert new_state.df_formats[1] is state.df_formats[1]
+    assert new_state.column_ids.column_id_to_column_header[1] is state.column_ids.column_id_to_column_header[1]
+
+def test_state_copy_on_write_does_not_change_original_state():
+    df1 = pd.DataFrame({'A': [123]})
+    df2 = pd.DataFrame({'B': [456]})
+    state = State([df1, df2], 3)
+    new_state = state.copy(deep_sheet_indexes=[0], metadata_sheet_indexes=[0])
+
+    new_state.add_columns_to_state(0, ['C'])
+    new_state.column_filters[0]['A']['filters'].append({'condition': 'greater', 'value': 1})
+    new_state.add_df_to_state(pd.DataFrame({'D': [1]}), DATAFRAME_SOURCE_IMPORTED, overwrite={'sheet_index_to_overwrite': 1, 'attempt_to_save_filter_metadata': False})
+    new_state.add_df_to_state(df1, DATAFRAME_SOURCE_IMPORTED)
+
+    assert state.column_ids.get_column_ids(0) == ['A']
+    assert state.column_ids.get_column_ids(1) == ['B']
+    assert state.column_filters[0]['A']['filters'] == []
+    assert list(state.column_formulas[1].keys()) == ['B']
+    assert len(state.dfs) == 2
+    assert len(state.column_formulas) == 2
+    assert state.df_names == ['df1', 'df2']
+
+def test_state_copy_with_deep_column_ids_only_copies_those_columns():
+    df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6], 'C': ['a', 'b', 'c']})
+    state = State([df], 3)
+    new_state = state.copy(deep_sheet_indexes=[0], metadata_sheet_indexes=[0], deep_column_ids={'B', 'D'})
+    new_df = new_state.dfs[0]
+
+    assert np.shares_memory(new_df['A'].to_numpy(), df['A'].to_numpy())
+    assert not np.shares_memory(new_df['B'].to_numpy(), df['B'].to_numpy())
+
+    # Writing into the copied column does not change the original state
+    new_df.loc[[0, 2], 'B'] = 100
+    new_df.insert(0, 'D', 0)
+    assert df.equals(pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6], 'C': ['a', 'b', 'c']}))
+    assert new_df['B'].tolist() == [100, 5, 100]
+
+def test_set_formula_on_some_index_labels_does_not_change_previous_state():
+    mito = create_mito_wrapper_with_data([1, 2, 3])
+    mito.set_formula('=A', 0, 'B', add_column=True)
+    mito.set_formula('=A * 10', 0, 'B', index_labels=[1])
+
+    steps = mito.mito_backend.steps_manager.steps_including_skipped
+    assert steps[-2].dfs[0]['B'].tolist() == [1, 2, 3]
+    assert steps[-1].dfs[0]['B'].tolist() == [1, 20, 3]
+    assert np.shares_memory(steps[-2].dfs[0]['A'].to_numpy(), steps[-1].dfs[0]['A'].to_numpy())
@@ -55,6 +55,7 @@ from mitosheet.step_performers.transpose import TransposeStepPerformer
 from mitosheet.step_performers.user_defined_import import UserDefinedImportStepPerformer
 from mitosheet.saved_analyses.upgrade import STEP_UPGRADES_FUNCTION_MAPPING_NEW_FORMAT
 from mitosheet.step_performers.replace import ReplaceStepPerformer
+from mitosheet.step_performers.column_steps.recalculate_dependents import RecalculateDependentsStepPerformer
 
 def check_step(
         step_performer: Type[StepPerformer], 
@@ -335,7 +336,13 @@ def test_params_static():
         'replace'
     )
 
-    assert len(STEP_PERFORMERS) == 41
+    check_step(
+        RecalculateDependentsStepPerformer,
+        1,
+        'recalculate_dependents'
+    )
+
+    assert len(STEP_PERFORMERS) == 42
 
 
 def test_upgraders_bump_step_number():
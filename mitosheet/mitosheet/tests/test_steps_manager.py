@@ -6,12 +6,15 @@
 import pandas as pd
 import pytest
 from mitosheet.enterprise.mito_config import MitoConfig
-from mitosheet.types import FORMULA_ENTIRE_COLUMN_TYPE
+from mitosheet.types import FC_NUMBER_GREATER, FORMULA_ENTIRE_COLUMN_TYPE
 
 from mitosheet.utils import get_new_id
 from mitosheet.errors import MitoError
-from mitosheet.steps_manager import StepsManager
-from mitosheet.tests.test_utils import create_mito_wrapper_with_data
+import mitosheet.steps_manager as steps_manager_module
+from mitosheet.steps_manager import StepsManager, get_independent_step_groups, get_step_indexes_to_skip
+from mitosheet.step_history_memory import RecomputedDataframe, SpilledDataframe
+from mitosheet.mito_backend import get_mito_backend
+from mitosheet.tests.test_utils import create_mito_wrapper, create_mito_wrapper_with_data
 from mitosheet.column_headers import get_column_header_id
 
 
@@ -104,3 +107,257 @@ def test_failed_overwrite_rolls_back_to_previous_state():
     assert mito.dfs[0].equals(pd.DataFrame(data={'A': [1, 2, 3], 'B': [0, 0, 0]}))
 
 
+
+
+def test_replay_reuses_steps_on_unchanged_sheets():
+    mito = create_mito_wrapper_with_data([1, 2, 3], [4, 5, 6])
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 1)
+    mito.add_column(1, 'B')
+    add_column_execution_data = mito.steps_including_skipped[2].execution_data
+
+    # Overwriting the filter replays from before the first filter, but the add
+    # column step only reads the second sheet, so it is not reexecuted
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 2)
+
+    assert mito.steps_including_skipped[2].execution_data is add_column_execution_data
+    assert mito.dfs[0].equals(pd.DataFrame(data={'A': [3]}, index=[2]))
+    assert mito.dfs[1].equals(pd.DataFrame(data={'A': [4, 5, 6], 'B': [0, 0, 0]}))
+    assert mito.mito_backend.steps_manager.curr_step.column_ids.get_column_ids(1) == ['A', 'B']
+
+
+def test_replay_reexecutes_steps_on_changed_sheets():
+    mito = create_mito_wrapper_with_data([1, 2, 3], [4, 5, 6])
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 1)
+    mito.add_column(0, 'B')
+    add_column_execution_data = mito.steps_including_skipped[2].execution_data
+
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 2)
+
+    assert mito.steps_including_skipped[2].execution_data is not add_column_execution_data
+    assert mito.dfs[0].equals(pd.DataFrame(data={'A': [3], 'B': [0]}, index=[2]))
+
+
+def test_replay_with_reused_steps_then_undo():
+    mito = create_mito_wrapper_with_data([1, 2, 3], [4, 5, 6])
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 1)
+    mito.add_column(1, 'B')
+    mito.set_formula('=A + 1', 1, 'B')
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 2)
+    mito.undo()
+
+    assert mito.dfs[0].equals(pd.DataFrame(data={'A': [2, 3]}, index=[1, 2]))
+    assert mito.dfs[1].equals(pd.DataFrame(data={'A': [4, 5, 6], 'B': [5, 6, 7]}))
+
+
+def _get_formula_column_headers(column_formulas):
+    return [
+        part['display_column_header'] 
+        for formula in column_formulas for part in formula['frontend_formula'] if 'display_column_header' in part
+    ]
+
+def test_replay_reuses_rename_that_renamed_columns_in_formulas_in_other_sheets():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]}), pd.DataFrame({'A': [1, 2, 3]}), pd.DataFrame({'A': [1, 2, 3]}))
+    mito.set_formula('=VLOOKUP(A, df1!A:B, 2)', 1, 'C', add_column=True)
+    mito.filter(2, 'A', 'And', FC_NUMBER_GREATER, 1)
+    mito.rename_column(0, 'B', 'Z')
+    rename_execution_data = mito.steps_including_skipped[4].execution_data
+    assert _get_formula_column_headers(mito.curr_step.column_formulas[1]['C']) == ['A', 'A', 'Z']
+
+    # Overwriting the filter replays from before the filter, and the rename only
+    # reads sheets that did not change, so it reuses its previous execution
+    mito.filter(2, 'A', 'And', FC_NUMBER_GREATER, 2)
+
+    assert mito.steps_including_skipped[4].execution_data is rename_execution_data
+    assert _get_formula_column_headers(mito.curr_step.column_formulas[1]['C']) == ['A', 'A', 'Z']
+
+    # And a later change to the sheet with the formula gives it a new fingerprint
+    mito.set_formula('=VLOOKUP(A, df1!A:Z, 2) + 1', 1, 'C')
+    assert mito.dfs[1]['C'].tolist() == [5, 6, 7]
+
+
+def test_replay_in_threads_keeps_renamed_columns_in_formulas_in_other_sheets(monkeypatch):
+    monkeypatch.setattr(steps_manager_module, 'MAX_REPLAY_THREADS', 4)
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]}), pd.DataFrame({'A': [1, 2, 3]}), pd.DataFrame({'A': [1, 2, 3]}))
+    mito.set_formula('=VLOOKUP(A, df1!A:B, 2)', 1, 'C', add_column=True)
+    mito.filter(2, 'A', 'And', FC_NUMBER_GREATER, 1)
+    mito.rename_column(0, 'B', 'Z')
+    mito.add_column(1, 'D')
+
+    # The rename reads the sheet with the formula that references the renamed column
+    steps = mito.steps_including_skipped
+    assert get_independent_step_groups(steps, 3, set(), steps[2].final_defined_state) == (6, [[3], [4, 5]])
+
+    steps_manager = StepsManager([pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]}), pd.DataFrame({'A': [1, 2, 3]}), pd.DataFrame({'A': [1, 2, 3]})], MitoConfig())
+    steps_manager.execute_steps_data(_get_steps_data(mito.mito_backend.steps_manager))
+
+    assert _get_formula_column_headers(steps_manager.curr_step.column_formulas[1]['C']) == ['A', 'A', 'Z']
+    assert steps_manager.curr_step.column_formulas == mito.mito_backend.steps_manager.curr_step.column_formulas
+
+
+def test_get_step_indexes_to_skip_multiple_filters_on_same_column():
+    mito = create_mito_wrapper_with_data([1, 2, 3], [4, 5, 6])
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 0)
+    mito.filter(1, 'A', 'And', FC_NUMBER_GREATER, 0)
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 1)
+    mito.add_column(0, 'B')
+    mito.filter(0, 'A', 'And', FC_NUMBER_GREATER, 2)
+
+    assert get_step_indexes_to_skip(mito.steps_including_skipped) == {1, 3}
+    assert mito.mito_backend.steps_manager.step_indexes_to_skip == {1, 3}
+    assert [step.step_type for step in mito.mito_backend.steps_manager.non_skipped_steps] == ['initialize', 'filter_column', 'add_column', 'filter_column']
+    assert mito.dfs[0].equals(pd.DataFrame(data={'A': [3], 'B': [0]}, index=[2]))
+
+
+def _do_steps_for_memory_budget_test(mito):
+    for i in range(6):
+        mito.set_formula(f'=A + {i}', 0, f'B{i}', add_column=True)
+        mito.sort(0, f'B{i}', 'descending' if i % 2 == 0 else 'ascending')
+
+def test_step_history_memory_budget_evicts_old_dataframes():
+    mito = create_mito_wrapper_with_data([1, 2, 3])
+    steps_manager = StepsManager([pd.DataFrame({'A': [1, 2, 3]})], MitoConfig(), step_history_memory_budget=0, step_history_checkpoint_interval=4)
+    mito.mito_backend.steps_manager = steps_manager
+    _do_steps_for_memory_budget_test(mito)
+
+    # The curr step is always in memory, but all old dataframes are evicted
+    assert not steps_manager.curr_step.post_state.has_evicted_dfs
+    evicted_dfs = [step.post_state._dfs[0] for step in steps_manager.steps_including_skipped[:-1]]
+    assert all(isinstance(evicted_df, SpilledDataframe) for evicted_df in evicted_dfs[::4])
+    assert any(isinstance(evicted_df, RecomputedDataframe) for evicted_df in evicted_dfs)
+    assert steps_manager.step_history_memory_manager.get_memory_usage() == sum(
+        steps_manager.curr_step.dfs[0].memory_usage(index=True, deep=True)
+    )
+
+def test_evicted_state_num_sheets_does_not_load_dataframes(monkeypatch):
+    mito = create_mito_wrapper_with_data([1, 2, 3])
+    steps_manager = StepsManager([pd.DataFrame({'A': [1, 2, 3]})], MitoConfig(), step_history_memory_budget=0, step_history_checkpoint_interval=4)
+    mito.mito_backend.steps_manager = steps_manager
+    _do_steps_for_memory_budget_test(mito)
+
+    def read_should_not_be_called(self):
+        raise AssertionError('Evicted dataframe was loaded')
+    monkeypatch.setattr(SpilledDataframe, '_read', read_should_not_be_called)
+    monkeypatch.setattr(RecomputedDataframe, '_read', read_should_not_be_called)
+
+    evicted_state = steps_manager.steps_including_skipped[1].post_state
+    assert evicted_state.has_evicted_dfs
+    assert evicted_state.num_sheets == 1
+
+    with pytest.raises(AssertionError, match='evicted'):
+        evicted_state.add_df_to_state(pd.DataFrame({'A': [1]}), 'passed')
+
+@pytest.mark.parametrize("memory_budget", [0, 500, 10**9])
+def test_step_history_memory_budget_rematerializes_dataframes_on_undo(memory_budget):
+    mito = create_mito_wrapper_with_data([1, 2, 3])
+    _do_steps_for_memory_budget_test(mito)
+
+    mito_with_budget = create_mito_wrapper_with_data([1, 2, 3])
+    mito_with_budget.mito_backend.steps_manager = StepsManager([pd.DataFrame({'A': [1, 2, 3]})], MitoConfig(), step_history_memory_budget=memory_budget, step_history_checkpoint_interval=3)
+    _do_steps_for_memory_budget_test(mito_with_budget)
+
+    assert mito_with_budget.transpiled_code == mito.transpiled_code
+    for step, step_with_budget in zip(mito.mito_backend.steps_manager.steps_including_skipped, mito_with_budget.mito_backend.steps_manager.steps_including_skipped):
+        assert step.dfs[0].equals(step_with_budget.dfs[0])
+
+    mito.undo()
+    mito_with_budget.undo()
+    assert mito_with_budget.dfs[0].equals(mito.dfs[0])
+
+    mito.undo_to_step_index(3)
+    mito_with_budget.undo_to_step_index(3)
+    assert mito_with_budget.dfs[0].equals(mito.dfs[0])
+    assert mito_with_budget.transpiled_code == mito.transpiled_code
+
+    mito.redo()
+    mito_with_budget.redo()
+    assert mito_with_budget.dfs[0].equals(mito.dfs[0])
+
+
+def test_step_history_memory_budget_does_not_reload_dataframes_to_transpile(monkeypatch):
+    mito = create_mito_wrapper(mito_backend=get_mito_backend(pd.DataFrame({'A': [1, 2, 3]}), step_history_memory_budget=0))
+    for i in range(12):
+        mito.set_formula(f'=A + {i}', 0, f'B{i}', add_column=True)
+
+    loaded_fingerprints = []
+    def count_reads(read):
+        def _read(self):
+            loaded_fingerprints.append(self.fingerprint)
+            return read(self)
+        return _read
+    monkeypatch.setattr(SpilledDataframe, '_read', count_reads(SpilledDataframe._read))
+    monkeypatch.setattr(RecomputedDataframe, '_read', count_reads(RecomputedDataframe._read))
+
+    # An edit only reloads each evicted dataframe once, to recompute the dataframes it needs
+    mito.set_formula('=A + 100', 0, 'C', add_column=True)
+    assert len(loaded_fingerprints) == len(set(loaded_fingerprints))
+    assert len(loaded_fingerprints) <= mito.mito_backend.steps_manager.step_history_memory_manager.checkpoint_interval
+
+    # And transpiling the step history only reads the headers of the evicted dataframes
+    loaded_fingerprints.clear()
+    assert "df1['C'] = df1['A'] + 100" in mito.transpiled_code
+    assert loaded_fingerprints == []
+
+
+def _get_steps_data(steps_manager):
+    return [{'step_type': step.step_type, 'params': step.params} for step in steps_manager.steps_including_skipped[1:]]
+
+def test_replay_executes_steps_on_different_sheets_in_threads(monkeypatch):
+    monkeypatch.setattr(steps_manager_module, 'MAX_REPLAY_THREADS', 4)
+    mito = create_mito_wrapper_with_data([1, 2, 3], [4, 5, 6])
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.set_formula('=A * 2', 1, 'B', add_column=True)
+    mito.sort(0, 'B', 'descending')
+    mito.filter(1, 'B', 'And', FC_NUMBER_GREATER, 8)
+
+    # The steps on each sheet are in their own group
+    assert get_independent_step_groups(mito.steps_including_skipped, 1, set(), mito.steps_including_skipped[0].final_defined_state) == (7, [[1, 2, 5], [3, 4, 6]])
+
+    executed_step_groups = []
+    execute_independent_step_groups = steps_manager_module.execute_independent_step_groups
+    def record_execute_independent_step_groups(step_list, step_groups, *args):
+        executed_step_groups.append(step_groups)
+        return execute_independent_step_groups(step_list, step_groups, *args)
+    monkeypatch.setattr(steps_manager_module, 'execute_independent_step_groups', record_execute_independent_step_groups)
+
+    steps_manager = StepsManager([pd.DataFrame({'A': [1, 2, 3]}), pd.DataFrame({'A': [4, 5, 6]})], MitoConfig())
+    steps_manager.execute_steps_data(_get_steps_data(mito.mito_backend.steps_manager))
+
+    assert executed_step_groups == [[[1, 2, 5], [3, 4, 6]]]
+    assert steps_manager.dfs[0].equals(mito.dfs[0])
+    assert steps_manager.dfs[1].equals(mito.dfs[1])
+    assert steps_manager.curr_step.column_formulas == mito.mito_backend.steps_manager.curr_step.column_formulas
+    assert steps_manager.code() == mito.mito_backend.steps_manager.code()
+
+    steps_manager.execute_undo()
+    assert steps_manager.dfs[1].equals(pd.DataFrame({'A': [4, 5, 6], 'B': [8, 10, 12]}))
+
+def test_replay_with_failed_step_in_thread_raises_and_takes_no_steps(monkeypatch):
+    monkeypatch.setattr(steps_manager_module, 'MAX_REPLAY_THREADS', 4)
+    mito = create_mito_wrapper_with_data([1, 2, 3], [4, 5, 6])
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.set_formula('=A * 2', 1, 'B', add_column=True)
+    steps_data = _get_steps_data(mito.mito_backend.steps_manager)
+    steps_data[3]['params'] = {**steps_data[3]['params'], 'new_formula': '=C * 2'}
+
+    steps_manager = StepsManager([pd.DataFrame({'A': [1, 2, 3]}), pd.DataFrame({'A': [4, 5, 6]})], MitoConfig())
+    with pytest.raises(MitoError) as e_info:
+        steps_manager.execute_steps_data(steps_data)
+
+    assert e_info.value.type_ == 'no_column_error'
+    assert len(steps_manager.steps_including_skipped) == 1
+
+def test_get_independent_step_groups():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1]}), pd.DataFrame({'A': [2]}), pd.DataFrame({'A': [3]}))
+    mito.add_column(0, 'B')
+    mito.add_column(1, 'B')
+    mito.add_column(0, 'C')
+    mito.add_column(2, 'B')
+    mito.duplicate_dataframe(0)
+    mito.add_column(1, 'C')
+
+    steps = mito.steps_including_skipped
+    assert get_independent_step_groups(steps, 1, set(), steps[0].final_defined_state) == (5, [[1, 3], [2], [4]])
+    assert get_independent_step_groups(steps, 5, set(), steps[4].final_defined_state) == (5, [])
+    assert get_independent_step_groups(steps, 6, set(), steps[5].final_defined_state) == (7, [[6]])
+    # Skipped steps are in the run, but not in any group
+    assert get_independent_step_groups(steps, 1, {2}, steps[0].final_defined_state) == (5, [[1, 3], [4]])
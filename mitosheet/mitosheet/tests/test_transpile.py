@@ -5,11 +5,13 @@
 # Distributed under the terms of the GPL License.
 import os
 from mitosheet.step_performers.graph_steps.graph_utils import BAR
-from mitosheet.transpiler.transpile_utils import NEWLINE_TAB, TAB, NEWLINE
+from mitosheet.transpiler.transpile_utils import NEWLINE_TAB, TAB, NEWLINE, get_compiled_code_for_exec
 import pytest
 import pandas as pd
 
 from mitosheet.api.get_parameterizable_params import get_parameterizable_params
+from mitosheet.saved_analyses.save_utils import write_save_analysis_file
+from mitosheet.transpiler.optimize_formula_code import optimize_formula_code
 from mitosheet.transpiler.transpile import transpile
 from mitosheet.tests.test_utils import create_mito_wrapper_with_data, create_mito_wrapper
 from mitosheet.tests.decorators import pandas_post_1_2_only, python_post_3_6_only
@@ -1306,4 +1308,124 @@ def test_does_not_reorder_around_empty_code_chunk():
     mito.delete_columns(0, ['A', 'B'])
     result = mito.generate_graph('test', BAR, 0, False, ['C'], [], '400', '400')
     assert result
-    assert mito.dfs[0].equals(pd.DataFrame({'C': [3], 'D': [0]}))
\ No newline at end of file
+    assert mito.dfs[0].equals(pd.DataFrame({'C': [3], 'D': [0]}))
+
+def test_transpile_only_transpiles_changed_steps():
+    mito = create_mito_wrapper_with_data([1, 2, 3])
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.sort(0, 'A', 'descending')
+
+    steps_manager = mito.mito_backend.steps_manager
+    code_chunks = [step.get_code_chunks() for step in steps_manager.steps_including_skipped[1:]]
+    code = transpile(steps_manager)
+
+    mito.set_formula('=A + 2', 0, 'C', add_column=True)
+
+    # The steps before the new step keep their code chunks
+    for step, step_code_chunks in zip(steps_manager.steps_including_skipped[1:], code_chunks):
+        assert all(code_chunk is step_code_chunk for code_chunk, step_code_chunk in zip(step.get_code_chunks(), step_code_chunks))
+
+    assert transpile(steps_manager) == code + [
+        "# Added column 'C'",
+        "df1['C'] = df1['A'] + 2",
+        '',
+    ]
+    assert transpile(steps_manager) == transpile(steps_manager)
+
+
+def test_transpile_after_undo_and_overwriting_step():
+    mito = create_mito_wrapper_with_data([1, 2, 3])
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    code = mito.transpiled_code
+
+    mito.rename_column(0, 'A', 'D')
+    assert mito.transpiled_code != code
+    mito.undo()
+    assert mito.transpiled_code == code
+
+    mito.set_formula('=A + 2', 0, 'B')
+    assert mito.transpiled_code == [
+        'from mitosheet.public.v3 import *',
+        '',
+        "df1['B'] = df1['A'] + 2",
+        '',
+    ]
+
+
+def test_get_compiled_code_for_exec_caches_compiled_code():
+    code = "df1['B'] = df1['A'] + 1"
+    assert get_compiled_code_for_exec(code) is get_compiled_code_for_exec(code)
+    assert get_compiled_code_for_exec(code) is not get_compiled_code_for_exec(code + ' + 1')
+
+
+def test_replaying_analysis_executes_cached_compiled_code():
+    mito = create_mito_wrapper_with_data([1, 2, 3])
+    mito.set_formula('=A + 1', 0, 'B', add_column=True)
+    mito.sort(0, 'B', 'descending')
+    write_save_analysis_file(mito.mito_backend.steps_manager)
+
+    # Replaying the analysis execs the same code again
+    hits = get_compiled_code_for_exec.cache_info().hits
+    new_mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    new_mito.replay_analysis(mito.mito_backend.analysis_name)
+    assert get_compiled_code_for_exec.cache_info().hits > hits
+
+    assert new_mito.get_column(0, 'B', as_list=True) == [4, 3, 2]
+    assert new_mito.transpiled_code == mito.transpiled_code
+
+
+def test_transpile_formula_computes_repeated_functions_once():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.set_formula('=SUM(A, 1) / SUM(A, 1) + 60 * 60', 0, 'B', add_column=True)
+    mito.add_column(0, 'C')
+    mito.set_formula('=MAX(A, 2) * MAX(A, 2)', 0, 'C')
+
+    assert mito.transpiled_code == [
+        'from mitosheet.public.v3 import *',
+        '',
+        "_mito_tmp_0 = SUM(df1['A'], 1)",
+        "df1['B'] = _mito_tmp_0 / _mito_tmp_0 + 60 * 60",
+        'del _mito_tmp_0',
+        '',
+        "_mito_tmp_0 = MAX(df1['A'], 2)",
+        "df1['C'] = _mito_tmp_0 * _mito_tmp_0",
+        'del _mito_tmp_0',
+        '',
+    ]
+    assert mito.dfs[0].equals(pd.DataFrame({'A': [1, 2, 3], 'B': [3601.0, 3601.0, 3601.0], 'C': [4, 4, 9]}))
+
+
+
+def test_transpile_formula_does_not_change_user_variables():
+    mito = create_mito_wrapper(pd.DataFrame({'A': [1, 2, 3]}))
+    mito.set_formula('=SUM(A, 1) * SUM(A, 1)', 0, 'B', add_column=True)
+
+    notebook_variables = {'df1': pd.DataFrame({'A': [1, 2, 3]}), 'tmp_0': 'user value'}
+    exec('\n'.join(mito.transpiled_code), notebook_variables)
+
+    assert notebook_variables['tmp_0'] == 'user value'
+    assert not any(name.startswith('_mito_tmp_') for name in notebook_variables)
+    assert notebook_variables['df1']['B'].tolist() == [4, 9, 16]
+
+OPTIMIZE_FORMULA_CODE_TESTS = [
+    # Nothing to optimize
+    ("df['B'] = SUM(df['A'], 1)", ["df['B'] = SUM(df['A'], 1)"]),
+    ("df['B'] = df['A'] + 1 + 2", ["df['B'] = df['A'] + 1 + 2"]),
+    ("df['B'] = 0.1 + 0.2", ["df['B'] = 0.1 + 0.2"]),
+    ("df['B'] = df['A'] * (60 * 60)", ["df['B'] = df['A'] * (60 * 60)"]),
+    # Repeated calls
+    ("df['B'] = SUM(df['A']) + SUM(df['A'])", ["_mito_tmp_0 = SUM(df['A'])", "df['B'] = _mito_tmp_0 + _mito_tmp_0", "del _mito_tmp_0"]),
+    ("df['B'] = SUM(df['A'], 1 + 1) + SUM(df['A'], 1 + 1)", ["_mito_tmp_0 = SUM(df['A'], 1 + 1)", "df['B'] = _mito_tmp_0 + _mito_tmp_0", "del _mito_tmp_0"]),
+    ("df['B'] = SUM(df['A'], 2) + SUM(df['A'], 1 + 1)", ["df['B'] = SUM(df['A'], 2) + SUM(df['A'], 1 + 1)"]),
+    ("df['B'] = MAX(SUM(df['A'])) - MAX(SUM(df['A']))", ["_mito_tmp_0 = MAX(SUM(df['A']))", "df['B'] = _mito_tmp_0 - _mito_tmp_0", "del _mito_tmp_0"]),
+    ("df['B'] = SUM(df['A']) + SUM(df['A']) + MAX(df['A']) * MAX(df['A'])", ["_mito_tmp_0 = SUM(df['A'])", "_mito_tmp_2 = MAX(df['A'])", "df['B'] = _mito_tmp_0 + _mito_tmp_0 + _mito_tmp_2 * _mito_tmp_2", "del _mito_tmp_0, _mito_tmp_2"]),
+    ("df.insert(1, 'B', SUM(df['A']) + SUM(df['A']))", ["_mito_tmp_0 = SUM(df['A'])", "df.insert(1, 'B', _mito_tmp_0 + _mito_tmp_0)", "del _mito_tmp_0"]),
+    ("_mito_tmp_0['B'] = SUM(_mito_tmp_0['A']) + SUM(_mito_tmp_0['A'])", ["_mito_tmp_2 = SUM(_mito_tmp_0['A'])", "_mito_tmp_0['B'] = _mito_tmp_2 + _mito_tmp_2", "del _mito_tmp_2"]),
+    # Calls that must be computed each time
+    ("df['B'] = TODAY() + TODAY()", ["df['B'] = TODAY() + TODAY()"]),
+    ("df['B'] = df['A'].shift(1) + df['A'].shift(1)", ["df['B'] = df['A'].shift(1) + df['A'].shift(1)"]),
+    ("df['B'] = (lambda: SUM(df['A']))() + SUM(df['A'])", ["df['B'] = (lambda: SUM(df['A']))() + SUM(df['A'])"]),
+]
+@pytest.mark.parametrize("code, optimized_code", OPTIMIZE_FORMULA_CODE_TESTS)
+def test_optimize_formula_code(code, optimized_code):
+    assert optimize_formula_code(code, ['SUM', 'MAX', 'CONCAT', 'TODAY'], ['df', '_mito_tmp_1']) == optimized_code
@@ -728,6 +728,32 @@ class MitoWidgetTestWrapper:
             }
         )
     
+
+    @check_transpiled_code_after_call
+    def recalculate_dependents(
+            self, 
+            sheet_index: int,
+            column_header: ColumnHeader,
+        ) -> bool:
+
+        column_id = self.mito_backend.steps_manager.curr_step.column_ids.get_column_id_by_header(
+            sheet_index,
+            column_header
+        )
+
+        return self.mito_backend.receive_message(
+            {
+                'event': 'edit_event',
+                'id': get_new_id(),
+                'type': 'recalculate_dependents_edit',
+                'step_id': get_new_id(),
+                'params': {
+                    'sheet_index': sheet_index,
+                    'column_id': column_id,
+                }
+            }
+        )
+    
 # AUTOGENERATED LINE: TEST (DO NOT DELETE)
 
     @check_transpiled_code_after_call
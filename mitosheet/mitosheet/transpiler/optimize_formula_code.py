@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) Saga Inc.
+# Distributed under the terms of the GPL License.
+"""
+Optimizes the code that a formula is transpiled into, by computing repeated calls
+to sheet functions once.
+
+e.g. df['C'] = SUM(df['A'], df['B']) / SUM(df['A'], df['B'])
+becomes:
+_mito_tmp_0 = SUM(df['A'], df['B'])
+df['C'] = _mito_tmp_0 / _mito_tmp_0
+del _mito_tmp_0
+
+We only change the parts of the code that we optimize, so that the rest of the code
+is formatted exactly like the formula the user wrote.
+"""
+import ast
+from typing import Any, Collection, Dict, List, Optional, Set, Tuple
+
+# The prefix of the variables that hold the results of repeated calls. These are deleted
+# after they are used, so they have a prefix that user code does not use
+TMP_VARIABLE_NAME_PREFIX = '_mito_tmp_'
+
+# Sheet functions that can return a different value each time they are called
+VOLATILE_FUNCTIONS = {'TODAY'}
+
+# Nodes whose children are not always evaluated, so we cannot compute them before
+UNSAFE_TO_HOIST_FROM_NODES = (ast.Lambda, ast.IfExp, ast.BoolOp, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+
+# Replaces the code from the start byte to the end byte with the given code
+Replacement = Tuple[int, int, str]
+
+
+def _is_hoistable_call(node: ast.AST, functions: Collection[str]) -> bool:
+    return isinstance(node, ast.Call) and \
+        isinstance(node.func, ast.Name) and \
+        node.func.id in functions and \
+        node.func.id not in VOLATILE_FUNCTIONS and \
+        (len(node.args) > 0 or len(node.keywords) > 0)
+
+
+def _get_hoistable_calls(node: ast.AST, functions: Collection[str]) -> List[ast.AST]:
+    """
+    Returns all the calls to sheet functions that are always evaluated when the code is.
+    """
+    if isinstance(node, UNSAFE_TO_HOIST_FROM_NODES):
+        return []
+
+    calls: List[ast.AST] = [node] if _is_hoistable_call(node, functions) else []
+    for child in ast.iter_child_nodes(node):
+        calls.extend(_get_hoistable_calls(child, functions))
+    return calls
+
+
+def _get_repeated_calls(node: ast.AST, functions: Collection[str], repeated_call_keys: Set[str]) -> List[ast.AST]:
+    """
+    Returns the outermost calls that are repeated, as calls inside of them are computed
+    once when they are.
+    """
+    if isinstance(node, UNSAFE_TO_HOIST_FROM_NODES):
+        return []
+
+    if _is_hoistable_call(node, functions) and ast.dump(node) in repeated_call_keys:
+        return [node]
+
+    calls: List[ast.AST] = []
+    for child in ast.iter_child_nodes(node):
+        calls.extend(_get_repeated_calls(child, functions, repeated_call_keys))
+    return calls
+
+
+def _get_tmp_variable_names(number: int, reserved_names: Set[str]) -> List[str]:
+    names: List[str] = []
+    i = 0
+    while len(names) < number:
+        name = f'{TMP_VARIABLE_NAME_PREFIX}{i}'
+        if name not in reserved_names:
+            names.append(name)
+        i += 1
+    return names
+
+
+def _parse_single_statement(code: str) -> Optional[ast.stmt]:
+    try:
+        module = ast.parse(code)
+    except SyntaxError:
+        return None
+
+    # NOTE: the end offsets of nodes are only available on Python 3.8 and above
+    if len(module.body) != 1 or not hasattr(module.body[0], 'end_col_offset'):
+        return None
+    return module.body[0]
+
+
+class _CodeSpans:
+    """
+    Finds the code that each node was parsed from, and replaces it. The ast gives offsets 
+    into the utf-8 encoded lines, so we work with bytes.
+    """
+
+    def __init__(self, code: str):
+        self.code_bytes = code.encode('utf-8')
+        self.line_start_offsets = [0]
+        for line in self.code_bytes.splitlines(keepends=True):
+            self.line_start_offsets.append(self.line_start_offsets[-1] + len(line))
+
+    def get_span(self, node: Any) -> Tuple[int, int]:
+        return (
+            self.line_start_offsets[node.lineno - 1] + node.col_offset,
+            self.line_start_offsets[node.end_lineno - 1] + node.end_col_offset
+        )
+
+    def get_code_with_replacements(self, node: Any, replacements: List[Replacement]) -> str:
+        start, end = self.get_span(node)
+        new_code = b''
+        for replacement_start, replacement_end, replacement_code in sorted(replacements):
+            new_code += self.code_bytes[start:replacement_start] + replacement_code.encode('utf-8')
+            start = replacement_end
+        new_code += self.code_bytes[start:end]
+        return new_code.decode('utf-8')
+
+
+def hoist_repeated_calls(code: str, functions: Collection[str], reserved_names: Collection[str]) -> List[str]:
+    """
+    Returns the lines of code that compute each call to the given functions that is 
+    repeated in the code once, and then use the result in the code. The variables that
+    hold the results are deleted afterwards, so they are not left in the notebook.
+    """
+    statement = _parse_single_statement(code)
+    if statement is None:
+        return [code]
+
+    # Count the calls, and then find the outermost calls that are repeated
+    call_counts: Dict[str, int] = {}
+    for call in _get_hoistable_calls(statement, functions):
+        key = ast.dump(call)
+        call_counts[key] = call_counts.get(key, 0) + 1
+    repeated_calls = _get_repeated_calls(statement, functions, {key for key, count in call_counts.items() if count > 1})
+
+    # A call that is repeated inside of another repeated call is computed once already, 
+    # so we only hoist it if it is also repeated outside of the other repeated calls
+    repeated_call_counts: Dict[str, int] = {}
+    for call in repeated_calls:
+        key = ast.dump(call)
+        repeated_call_counts[key] = repeated_call_counts.get(key, 0) + 1
+    repeated_calls = [call for call in repeated_calls if repeated_call_counts[ast.dump(call)] > 1]
+
+    if len(repeated_calls) == 0:
+        return [code]
+
+    reserved_names = set(reserved_names) | {node.id for node in ast.walk(statement) if isinstance(node, ast.Name)}
+    repeated_call_keys = list(dict.fromkeys(ast.dump(call) for call in repeated_calls))
+    tmp_variable_names = dict(zip(repeated_call_keys, _get_tmp_variable_names(len(repeated_call_keys), reserved_names)))
+
+    code_spans = _CodeSpans(code)
+    lines: List[str] = []
+    for key in repeated_call_keys:
+        first_call = next(call for call in repeated_calls if ast.dump(call) == key)
+        lines.append(f'{tmp_variable_names[key]} = {code_spans.get_code_with_replacements(first_call, [])}')
+
+    lines.append(code_spans.get_code_with_replacements(
+        statement,
+        [(*code_spans.get_span(call), tmp_variable_names[ast.dump(call)]) for call in repeated_calls]
+    ))
+    lines.append(f'del {", ".join(tmp_variable_names.values())}')
+    return lines
+
+
+def optimize_formula_code(code: str, functions: Collection[str], reserved_names: Collection[str]) -> List[str]:
+    """
+    Given a single line of code that sets a column to a formula, returns the lines of
+    code that compute the same thing, with repeated calls to the given functions 
+    computed once.
+
+    The functions must always return the same value for the same arguments, and the
+    reserved names are any variables that the code must not overwrite. If there is
+    nothing to optimize, the code is returned unchanged.
+    """
+    return hoist_repeated_calls(code, functions, reserved_names)
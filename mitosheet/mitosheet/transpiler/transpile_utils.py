@@ -5,8 +5,10 @@
 # Distributed under the terms of the GPL License.
 
 from copy import copy
+from functools import lru_cache
 import inspect
 import re
+from types import CodeType
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from collections import OrderedDict
 
@@ -375,6 +377,51 @@ def get_default_code_options(analysis_name: str) -> CodeOptions:
     }
 
 
+# The maximum number of compiled pieces of code we keep around to exec again
+MAX_COMPILED_CODE_CACHE_SIZE = 2048
+
+# A map from public interface version to the variables exported by Mito for it
+_PUBLIC_INTERFACE_GLOBALS: Dict[int, Dict[str, Any]] = {}
+
+
+@lru_cache(maxsize=MAX_COMPILED_CODE_CACHE_SIZE)
+def get_compiled_code_for_exec(code: str) -> CodeType:
+    """
+    Compiles transpiled code so that it can be exec'ed. 
+
+    Replaying an analysis, e.g. after editing or undoing an earlier step, execs
+    the same transpiled code again, and so we cache the compiled code by the
+    code itself to not pay for parsing and compiling it every time.
+    """
+    return compile(code, '<string>', 'exec')
+
+
+def _get_public_interface_globals(public_interface: int) -> Dict[str, Any]:
+    """
+    Returns the variables exported by Mito for this public interface version. 
+    These never change, and so we only collect them once for each version.
+    """
+    public_interface_globals = _PUBLIC_INTERFACE_GLOBALS.get(public_interface)
+    if public_interface_globals is not None:
+        return public_interface_globals
+
+    if public_interface == 1:
+        import mitosheet.public.v1 as v1
+        public_interface_globals = dict(v1.__dict__)
+    elif public_interface == 2:
+        import mitosheet.public.v2 as v2
+        public_interface_globals = dict(v2.__dict__)
+    elif public_interface == 3:
+        import mitosheet.public.v3 as v3
+        public_interface_globals = dict(v3.__dict__)
+    else:
+        import mitosheet as original
+        public_interface_globals = dict(original.__dict__)
+
+    _PUBLIC_INTERFACE_GLOBALS[public_interface] = public_interface_globals
+    return public_interface_globals
+
+
 def get_globals_for_exec(state: State, public_interface: int) -> Dict[str, Any]:
     """
     Anytime you are exec'ing transpiled code, you need to pass some global variables including:
@@ -392,26 +439,13 @@ def get_globals_for_exec(state: State, public_interface: int) -> Dict[str, Any]:
             state.df_names
         )
     }
-    
-    if public_interface == 1:
-        import mitosheet.public.v1 as v1
-        local_vars = v1.__dict__
-    elif public_interface == 2:
-        import mitosheet.public.v2 as v2
-        local_vars = v2.__dict__
-    elif public_interface == 3:
-        import mitosheet.public.v3 as v3
-        local_vars = v3.__dict__
-    else:
-        import mitosheet as original
-        local_vars = original.__dict__
 
     user_defined_functions = state.user_defined_functions
     user_defined_importers = state.user_defined_importers
     user_defined_editors = state.user_defined_editors
 
     local_vars = {
-        **local_vars,
+        **_get_public_interface_globals(public_interface),
         **df_names_to_df,
         **{f.__name__: f for f in user_defined_functions},
         **{f.__name__: f for f in user_defined_importers},
@@ -303,6 +303,16 @@ if sys.version_info[:3] > (3, 8, 0):
         type: Literal['specific_index_labels']
         index_labels: List[Any]
 
+    class FormulaIndexRange(TypedDict):
+        type: Literal['range']
+        start: int
+        stop: int
+        step: int
+
+    class FormulaIndexLabels(TypedDict):
+        type: Literal['labels']
+        labels: List[Any]
+
     class Selection(TypedDict):
         selected_df_name: str
         selected_column_headers: List[ColumnHeader]
@@ -440,6 +450,8 @@ else:
     FrontendFormulaSheetReference = Any # type:ignore
     FormulaLocationEntireColumn = Any # type:ignore
     FormulaLocationToSpecificIndexLabels = Any # type:ignore
+    FormulaIndexRange = Any # type:ignore
+    FormulaIndexLabels = Any # type:ignore
     Selection = Any # type:ignore
     DataframeReconData = Any # type: ignore
     ColumnReconData = Any # type: ignore
@@ -471,6 +483,7 @@ FrontendFormulaPart = Union[FrontendFormulaString, FrontendFormulaHeaderIndexRef
 FrontendFormula = List[FrontendFormulaPart]
 
 FormulaAppliedToType = Union[FormulaLocationEntireColumn, FormulaLocationToSpecificIndexLabels]
+FormulaIndex = Union[FormulaIndexRange, FormulaIndexLabels]
 
 
 if sys.version_info[:3] > (3, 8, 0):
@@ -479,7 +492,10 @@ if sys.version_info[:3] > (3, 8, 0):
     class FrontendFormulaAndLocation(TypedDict):
         frontend_formula: FrontendFormula
         location: FormulaAppliedToType
-        index: List[Any]
+        # The index the formula was written against, which is only needed to turn the row 
+        # offsets in the frontend formula back into index labels. So it is None if there 
+        # are no row offsets, and only lists the labels if the index is not a RangeIndex
+        index: Optional[FormulaIndex]
 
 else:
     FrontendFormulaAndLocation = Any # type:ignore
\ No newline at end of file
@@ -67,6 +67,8 @@ def do_arg_update(steps_manager: StepsManagerType, args: List[str]) -> None:
     # nonsense), and thus this allows us to filter out Nones that are passed at the 
     # end of the arguments (not creating phantom tabs that cannot be clicked)
     steps_manager.curr_step.post_state.df_names = final_names[:len(steps_manager.curr_step.dfs)] # type: ignore
+    # As we changed the sheets in place, we make sure that no later step reuses an execution that used the old names
+    steps_manager.curr_step.sheet_fingerprints = None
 
     # Save the original args exactly as is, because we might need them for generating a function
     steps_manager.original_args_raw_strings = args
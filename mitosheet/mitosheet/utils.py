@@ -12,7 +12,7 @@ from random import randint
 import random
 import re
 import uuid
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import os
 import keyword
 
@@ -20,7 +20,7 @@ import numpy as np
 import pandas as pd
 
 from mitosheet.column_headers import ColumnIDMap, get_column_header_display
-from mitosheet.is_type_utils import get_float_dt_td_period_columns, is_int_dtype
+from mitosheet.is_type_utils import get_float_dt_td_period_columns, is_float_dtype, is_int_dtype
 from mitosheet.types import (FC_BOOLEAN_IS_FALSE, FC_BOOLEAN_IS_TRUE, FC_DATETIME_EXACTLY, FC_DATETIME_GREATER, FC_DATETIME_GREATER_THAN_OR_EQUAL, FC_DATETIME_LESS,
         FC_DATETIME_LESS_THAN_OR_EQUAL, FC_DATETIME_NOT_EXACTLY, FC_EMPTY,
         FC_LEAST_FREQUENT, FC_MOST_FREQUENT, FC_NOT_EMPTY, FC_NUMBER_EXACTLY,
@@ -141,12 +141,23 @@ def dfs_to_array_for_json(
         column_formulas_array: List[Dict[ColumnID, List[FrontendFormulaAndLocation]]],
         column_filters_array: List[Dict[ColumnID, Any]],
         column_ids: ColumnIDMap,
-        df_formats: List[DataframeFormat]
+        df_formats: List[DataframeFormat],
+        previous_displayed_dfs: Optional[List[pd.DataFrame]]=None
     ) -> List:
+    """
+    Returns the sheet data for each of the dfs, reusing the previous sheet data for the 
+    sheets that are not modified.
+
+    If previous_displayed_dfs are passed, they should be the displayed parts (see 
+    get_displayed_df) of the dataframes that the previous_array was created from, so 
+    that the data of the columns that are unchanged can be reused too.
+    """
 
     new_array = []
     for sheet_index, df in enumerate(dfs):
         if sheet_index in modified_sheet_indexes:
+            previous_df = previous_displayed_dfs[sheet_index] if previous_displayed_dfs is not None and sheet_index < len(previous_displayed_dfs) else None
+            previous_sheet_data = previous_array[sheet_index] if sheet_index < len(previous_array) else None
             new_array.append(
                 df_to_json_dumpsable(
                     state,
@@ -160,7 +171,9 @@ def dfs_to_array_for_json(
                     df_formats[sheet_index],
                     # We only send the first 1500 rows and 1500 columns
                     max_rows=MAX_ROWS,
-                    max_columns=MAX_COLUMNS
+                    max_columns=MAX_COLUMNS,
+                    previous_df=previous_df,
+                    previous_sheet_data=previous_sheet_data
                 ) 
             )
         else:
@@ -411,7 +424,9 @@ def df_to_json_dumpsable(
         column_headers_to_column_ids: Dict[ColumnHeader, ColumnID],
         df_format: DataframeFormat,
         max_rows: Optional[int]=MAX_ROWS, # How many items you want to display. None when using this function to get unique value counts
-        max_columns: int=MAX_COLUMNS # How many columns you want to display. Unlike max_rows, this is always defined
+        max_columns: int=MAX_COLUMNS, # How many columns you want to display. Unlike max_rows, this is always defined
+        previous_df: Optional[pd.DataFrame]=None, # The dataframe that previous_sheet_data was created from, if there is one
+        previous_sheet_data: Optional[Dict[str, Any]]=None
     ) -> Dict[str, Any]:
     """
     Returns a dataframe and other metadata represented in a way that can be turned into a 
@@ -441,7 +456,16 @@ def df_to_json_dumpsable(
 
     (num_rows, num_columns) = original_df.shape 
 
-    json_obj = convert_df_to_parsed_json(original_df, max_rows=max_rows, max_columns=max_columns)
+    # We only convert the columns that have changed since the previous sheet data
+    unchanged_column_data = get_unchanged_column_data(original_df, previous_df, previous_sheet_data, max_rows, max_columns)
+    changed_column_indexes = [column_index for column_index in range(min(num_columns, max_columns)) if column_index not in unchanged_column_data]
+
+    json_obj = convert_df_to_parsed_json(original_df.iloc[:, changed_column_indexes], max_rows=max_rows, max_columns=max_columns)
+    # Transpose the rows into columns
+    changed_columns_data = list(zip(*json_obj['data']))
+    columns_data: Dict[int, Any] = {column_index: changed_columns_data[i] for i, column_index in enumerate(changed_column_indexes) if i < len(changed_columns_data)}
+    columns_data.update(unchanged_column_data)
+    num_displayed_rows = len(original_df.index[:max_rows])
 
     final_data = []
     column_dtype_map = {}
@@ -455,10 +479,9 @@ def df_to_json_dumpsable(
             'columnData': [],
         }
         column_dtype_map[column_id] = str(original_df[column_header].dtype)
-        for row in json_obj['data']:
-            # If we're beyond the max columns, we might not have data, and we leave column data empty
-            # in this case and don't append anything
-            column_final_data['columnData'].append(row[column_index] if column_index < MAX_COLUMNS else None)
+        # If we're beyond the max columns, we don't have data, and so we fill the column with None
+        column_data = columns_data.get(column_index)
+        column_final_data['columnData'] = (column_data if isinstance(column_data, list) else list(column_data)) if column_data is not None else [None] * num_displayed_rows
         
         final_data.append(column_final_data) 
 
@@ -493,6 +516,118 @@ def df_to_json_dumpsable(
     }
 
 
+def get_displayed_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of the rows and columns of the df that are sent in the sheet data, 
+    which is all we need to keep to check which columns changed in the next sheet data. 
+
+    We copy them as a slice of the df can keep the entire df in memory.
+    """
+    return df.iloc[:MAX_ROWS, :MAX_COLUMNS].copy()
+
+
+def get_unchanged_column_data(
+        df: pd.DataFrame,
+        previous_df: Optional[pd.DataFrame],
+        previous_sheet_data: Optional[Dict[str, Any]],
+        max_rows: Optional[int],
+        max_columns: int
+    ) -> Dict[int, List[Any]]:
+    """
+    Returns the column data from the previous_sheet_data for each column of the df 
+    that displays exactly the same as it did in the previous_df, by column index. The
+    previous_df only needs to contain the rows and columns that are displayed.
+    
+    Comparing the displayed rows is much faster than converting them to JSON again, and 
+    so this makes sure that a small edit to a wide dataframe only converts the columns 
+    it changes.
+    """
+    if previous_df is None or previous_sheet_data is None or min(len(previous_sheet_data['data']), max_columns) != min(previous_df.shape[1], max_columns):
+        return {}
+    
+    # If the index changed, e.g. because of a sort, then every column has changed
+    if not df.index[:max_rows].equals(previous_df.index[:max_rows]):
+        return {}
+
+    previous_column_indexes = {}
+    for column_index, column_header in enumerate(previous_df.columns[:max_columns]):
+        previous_column_indexes[column_header] = column_index
+
+    unchanged_column_data = {}
+    for column_index, column_header in enumerate(df.columns[:max_columns]):
+        previous_column_index = previous_column_indexes.get(column_header)
+        if previous_column_index is None:
+            continue
+
+        column = df.iloc[:max_rows, column_index]
+        previous_column = previous_df.iloc[:max_rows, previous_column_index]
+        if column.dtype == previous_column.dtype and column.equals(previous_column):
+            unchanged_column_data[column_index] = previous_sheet_data['data'][previous_column_index]['columnData']
+
+    return unchanged_column_data
+
+
+def get_sheet_data_patch(previous_array: List[Dict[str, Any]], new_array: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Returns a patch that turns the previous_array of sheet data into the new_array, 
+    or None if they are the same. The patch should follow the format:
+    {
+        numSheets: number,
+        sheetPatches: ({
+            sheetIndex: number,
+            sheetData: SheetData // For new sheets
+        } | {
+            sheetIndex: number,
+            changedFields: Partial<SheetData>, // Every changed field, other than data
+            columnIDs: ColumnID[], // The column ids of the sheet, in order
+            changedColumns: SheetData['data'] // Just the columns that changed
+        })[]
+    }
+
+    The frontend applies this patch in applySheetDataPatch.
+    """
+    sheet_patches: List[Dict[str, Any]] = []
+    for sheet_index, sheet_data in enumerate(new_array):
+        previous_sheet_data = previous_array[sheet_index] if sheet_index < len(previous_array) else None
+        # Sheets that are not modified reuse the same sheet data
+        if sheet_data is previous_sheet_data:
+            continue
+
+        if previous_sheet_data is None:
+            sheet_patches.append({'sheetIndex': sheet_index, 'sheetData': sheet_data})
+            continue
+
+        changed_fields = {key: value for key, value in sheet_data.items() if key != 'data' and previous_sheet_data.get(key) != value}
+
+        previous_columns = {column['columnID']: column for column in previous_sheet_data['data']}
+        changed_columns = []
+        for column in sheet_data['data']:
+            previous_column = previous_columns.get(column['columnID'])
+            if previous_column is None or column['columnHeader'] != previous_column['columnHeader'] \
+                or column['columnDtype'] != previous_column['columnDtype'] \
+                or (column['columnData'] is not previous_column['columnData'] and column['columnData'] != previous_column['columnData']):
+                changed_columns.append(column)
+
+        column_ids = [column['columnID'] for column in sheet_data['data']]
+        if len(changed_fields) == 0 and len(changed_columns) == 0 and column_ids == list(previous_columns.keys()):
+            continue
+
+        sheet_patches.append({
+            'sheetIndex': sheet_index,
+            'changedFields': changed_fields,
+            'columnIDs': column_ids,
+            'changedColumns': changed_columns
+        })
+
+    if len(sheet_patches) == 0 and len(new_array) == len(previous_array):
+        return None
+
+    return {
+        'numSheets': len(new_array),
+        'sheetPatches': sheet_patches
+    }
+
+
 def get_row_data_array(df: pd.DataFrame) -> List[Any]:
     """
     Returns just the data of a dataframe in the 2d array format of [row idx][col idx]
@@ -500,31 +635,93 @@ def get_row_data_array(df: pd.DataFrame) -> List[Any]:
     json_obj = convert_df_to_parsed_json(df)
     return json_obj['data']
 
-def convert_df_to_parsed_json(original_df: pd.DataFrame, max_rows: Optional[int]=MAX_ROWS, max_columns: int=MAX_COLUMNS) -> Dict[str, Any]:
+def get_datetime_display_strings(datetimes: Union[pd.Series, pd.Index]) -> pd.Series:
     """
-    Returns a dataframe as a json object with the correct formatting
+    Returns the datetimes formatted as strings, exactly as strftime('%Y-%m-%d %X')
+    would format them, with NaT as NaN.
+
+    This is done on the whole array at once, as strftime formats each cell in Python.
     """
-    if max_rows is None:
-        df = original_df.copy(deep=True) 
-    else:
-        # we only show the first max_rows rows!
-        df = original_df.head(n=max_rows).copy(deep=True)
+    if getattr(datetimes.dtype, 'tz', None) is not None:
+        # Display the local time, as strftime does
+        datetimes = datetimes.dt.tz_localize(None) if isinstance(datetimes, pd.Series) else datetimes.tz_localize(None)
+
+    index = datetimes.index if isinstance(datetimes, pd.Series) else None
+    if len(datetimes) == 0:
+        return pd.Series([], index=index, name=datetimes.name, dtype=object)
+
+    is_nat = np.asarray(pd.isna(datetimes))
+    strings = np.char.replace(np.asarray(datetimes, dtype='datetime64[s]').astype(str), 'T', ' ')
 
-    # we only show the first max_columns columns!
-    df = df.iloc[: , :max_columns]
+    return pd.Series(np.where(is_nat, np.nan, strings.astype(object)), index=index, name=datetimes.name, dtype=object)
 
+
+NANOSECONDS_PER_SECOND = 10**9
+# Lookup table for the zero padded hours, minutes, and seconds of a timedelta
+TWO_DIGIT_STRINGS = np.array([f'{i:02}' for i in range(60)])
+
+def get_timedelta_display_strings(timedeltas: Union[pd.Series, pd.Index]) -> pd.Series:
+    """
+    Returns the timedeltas formatted as strings, exactly as str(pd.Timedelta) would
+    format them (e.g. '-1 days +22:30:00.500000'), with NaT as 'NaT'.
+
+    This is done on the whole array at once, as creating a pd.Timedelta for each cell
+    is very slow for large dataframes.
+    """
+    index = timedeltas.index if isinstance(timedeltas, pd.Series) else None
+    if len(timedeltas) == 0:
+        return pd.Series([], index=index, name=timedeltas.name, dtype=object)
+
+    is_nat = np.asarray(pd.isna(timedeltas))
+    nanoseconds = np.asarray(timedeltas, dtype='timedelta64[ns]').view('i8')
+    nanoseconds = np.where(is_nat, 0, nanoseconds)
+
+    days, remainder = np.divmod(nanoseconds, 24 * 60 * 60 * NANOSECONDS_PER_SECOND)
+    hours, remainder = np.divmod(remainder, 60 * 60 * NANOSECONDS_PER_SECOND)
+    minutes, remainder = np.divmod(remainder, 60 * NANOSECONDS_PER_SECOND)
+    seconds, fraction = np.divmod(remainder, NANOSECONDS_PER_SECOND)
+
+    # Negative timedeltas are displayed as negative days plus a positive time
+    strings = np.char.add(days.astype(str), np.where(days < 0, ' days +', ' days '))
+    strings = np.char.add(strings, TWO_DIGIT_STRINGS[hours])
+    strings = np.char.add(strings, ':')
+    strings = np.char.add(strings, TWO_DIGIT_STRINGS[minutes])
+    strings = np.char.add(strings, ':')
+    strings = np.char.add(strings, TWO_DIGIT_STRINGS[seconds])
+
+    # The fraction of a second is displayed with nanosecond precision if needed, and
+    # otherwise with microsecond precision if it is not zero
+    has_fraction = fraction != 0
+    if has_fraction.any():
+        fraction = fraction[has_fraction]
+        nanosecond_fraction = np.char.add('.', np.char.zfill(fraction.astype(str), 9))
+        microsecond_fraction = np.char.add('.', np.char.zfill((fraction // 1000).astype(str), 6))
+        strings = strings.astype(object)
+        strings[has_fraction] = np.char.add(strings[has_fraction].astype(str), np.where(fraction % 1000 != 0, nanosecond_fraction, microsecond_fraction))
+
+    strings = np.where(is_nat, 'NaT', strings)
+    return pd.Series(strings, index=index, name=timedeltas.name, dtype=object)
+
+
+def format_df_for_display(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the datetime, timedelta, and period columns (and index) of the
+    dataframe to strings, so that they are displayed nicely in the frontend. 
+    
+    NOTE: this modifies the dataframe it is passed, so it should be a copy.
+    """
     float_columns, date_columns, timedelta_columns, period_columns = get_float_dt_td_period_columns(df)
     # We figure out which of the columns contain dates, and we
     # convert them to string columns (for formatting reasons).
     # NOTE: we don't use date_format='iso' in df.to_json call as it appends seconds to the object, 
     # see here: https://stackoverflow.com/questions/52730953/pandas-to-json-output-date-format-in-specific-form
     for column_header in date_columns:
-        df[column_header] = df[column_header].dt.strftime('%Y-%m-%d %X')
+        df[column_header] = get_datetime_display_strings(df[column_header])
 
     # Third, we figure out which of the columns contain timedeltas, and 
     # we format the timedeltas as strings to make them readable
     for column_header in timedelta_columns:
-        df[column_header] = df[column_header].apply(lambda x: str(x))
+        df[column_header] = get_timedelta_display_strings(df[column_header])
         
     # Fourth, we figure out which of the columns contain periods, and 
     # we format the periods as strings to make them readable
@@ -535,22 +732,61 @@ def convert_df_to_parsed_json(original_df: pd.DataFrame, max_rows: Optional[int]
     # the same conversions that we did above
     # Then, if we have a datetime index, we update the index to be jsonified better
     if isinstance(df.index, pd.DatetimeIndex):
-        df.index = df.index.strftime('%Y-%m-%d %X')
+        df.index = get_datetime_display_strings(df.index)
     # Check for Period index and handle it - add this block
     elif isinstance(df.index, pd.PeriodIndex):
         df.index = df.index.astype(str)
     elif isinstance(df.index, pd.TimedeltaIndex):
-        df.index = df.index.to_series().apply(lambda x: str(x))
+        df.index = get_timedelta_display_strings(df.index)
+
+    return df
+
+
+def replace_nulls_for_display(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replaces all the null values in the dataframe, as well as infinities (which
+    to_json turns into null), with 'NaN' for display in the frontend. 
+
+    NOTE: this modifies the dataframe it is passed, so it should be a copy.
+    """
+    for column_index in range(df.shape[1]):
+        column = df.iloc[:, column_index]
+        # NOTE: nullable extension dtypes (e.g. Int64) can contain nulls, so we only
+        # take the fast paths for numpy dtypes
+        is_numpy_dtype = isinstance(column.dtype, np.dtype)
+        if is_numpy_dtype and column.dtype.kind in 'iub':
+            # Integer and boolean columns cannot contain nulls
+            continue
+        elif is_numpy_dtype and column.dtype.kind == 'f':
+            null_mask = ~np.isfinite(column.to_numpy())
+        else:
+            null_mask = np.asarray(column.isna())
+            if column.dtype == object:
+                null_mask |= np.asarray(column.isin([np.inf, -np.inf]))
+
+        if null_mask.any():
+            values = column.to_numpy(dtype=object, copy=True)
+            values[null_mask] = 'NaN'
+            df.isetitem(column_index, values)
+
+    return df
+
+
+def convert_df_to_parsed_json(original_df: pd.DataFrame, max_rows: Optional[int]=MAX_ROWS, max_columns: int=MAX_COLUMNS) -> Dict[str, Any]:
+    """
+    Returns a dataframe as a json object with the correct formatting.
+
+    NOTE: this is called on every edit, so all the formatting is done on whole
+    columns at once, rather than cell by cell.
+    """
+    # We only show the first max_rows rows and first max_columns columns! We take these
+    # before copying, so that we don't copy the rest of the dataframe
+    df = original_df.iloc[:max_rows, :max_columns].copy(deep=True)
 
-    json_obj = json.loads(df.to_json(orient="split"))
-    # Then, we go through and find all the null values (which are infinities),
-    # and set them to 'NaN' for display in the frontend.
-    for d in json_obj['data']:
-        for idx, e in enumerate(d):
-            if e is None:
-                d[idx] = 'NaN'
+    df = format_df_for_display(df)
+    df = replace_nulls_for_display(df)
 
-    return json_obj
+    return json.loads(df.to_json(orient="split"))
 
 
 def get_random_id() -> str:
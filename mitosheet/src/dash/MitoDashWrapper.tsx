@@ -6,7 +6,7 @@
 import Mito from '../mito/Mito';
 import React, { Component } from "react"
 import { MitoResponse, SendFunctionReturnType } from "../mito";
-import { getAnalysisDataFromString, getSheetDataArrayFromString, getUserProfileFromString } from "../jupyter/jupyterUtils";
+import { getAnalysisDataFromString, getSheetDataArrayFromString, getSheetDataFromSharedVariables, getUserProfileFromString } from "../jupyter/jupyterUtils";
 import { getRandomId } from '../mito/api/api';
 
 export const DELAY_BETWEEN_SET_DASH_PROPS = 25;
@@ -104,7 +104,7 @@ export default class MitoDashWrapper extends Component<Props, State> {
                     const sharedVariables = response.shared_variables;
                     
                     return resolve({
-                        sheetDataArray: sharedVariables ? getSheetDataArrayFromString(sharedVariables.sheet_data_json) : undefined,
+                        ...getSheetDataFromSharedVariables(sharedVariables),
                         analysisData: sharedVariables ? getAnalysisDataFromString(sharedVariables.analysis_data_json) : undefined,
                         userProfile: sharedVariables ? getUserProfileFromString(sharedVariables.user_profile_json) : undefined,
                         result: response['data'] as ResultType
@@ -66,6 +66,10 @@ export const getArgsFromMitosheetCallCode = (codeText: string): string[] => {
         nameString = nameString.split('sheet_functions')[0].trim();
     }
 
+    if (nameString.includes('step_history_memory_budget')) {
+        nameString = nameString.split('step_history_memory_budget')[0].trim();
+    }
+
     // Get the args and trim them up
     let args = nameString.split(',').map(dfName => dfName.trim());
     
@@ -47,7 +47,7 @@ import {
     waitUntilConditionReturnsTrueOrTimeout,
 } from "../mito";
 import { isInJupyterLabOrNotebook } from "../mito/utils/location";
-import { getAnalysisDataFromString, getSheetDataArrayFromString, getUserProfileFromString } from "./jupyterUtils";
+import { getAnalysisDataFromString, getSheetDataFromSharedVariables, getUserProfileFromString } from "./jupyterUtils";
 
 /**
  * Since Nobtebook 7 is based on Lab, we no longer need to handle the difference between the 
@@ -215,7 +215,7 @@ export async function getCommSend(kernelID: string, commTargetID: string): Promi
                     const sharedVariables = response.shared_variables;
                     
                     return resolve({
-                        sheetDataArray: sharedVariables ? getSheetDataArrayFromString(sharedVariables.sheet_data_json) : undefined,
+                        ...getSheetDataFromSharedVariables(sharedVariables),
                         analysisData: sharedVariables ? getAnalysisDataFromString(sharedVariables.analysis_data_json) : undefined,
                         userProfile: sharedVariables ? getUserProfileFromString(sharedVariables.user_profile_json) : undefined,
                         result: response['data'] as ResultType
@@ -24,7 +24,8 @@
 import {
     AnalysisData,
     MitoAPI,
-    PublicInterfaceVersion, SheetData, UserProfile
+    MitoResponse,
+    PublicInterfaceVersion, SendFunctionSuccessReturnType, SheetData, SheetDataPatch, UserProfile
 } from "../mito";
 import { isInJupyterLabOrNotebook } from "../mito/utils/location";
 
@@ -120,6 +121,24 @@ export const getSheetDataArrayFromString = (sheet_data_json: string): SheetData[
     return JSON.parse(sheet_data_json);
 }
 
+export const getSheetDataPatchFromString = (sheet_data_patch_json: string): SheetDataPatch => {
+    return JSON.parse(sheet_data_patch_json);
+}
+
+/*
+    The backend either sends the entire sheet data array, or a patch to the 
+    sheet data array the frontend has, along with the version of the sheet data.
+*/
+export const getSheetDataFromSharedVariables = (
+    sharedVariables: Extract<MitoResponse, {event: 'response'}>['shared_variables']
+): Pick<SendFunctionSuccessReturnType<unknown>, 'sheetDataArray' | 'sheetDataPatch' | 'sheetDataVersion'> => {
+    return {
+        sheetDataArray: sharedVariables?.sheet_data_json !== undefined ? getSheetDataArrayFromString(sharedVariables.sheet_data_json) : undefined,
+        sheetDataPatch: sharedVariables?.sheet_data_patch_json !== undefined ? getSheetDataPatchFromString(sharedVariables.sheet_data_patch_json) : undefined,
+        sheetDataVersion: sharedVariables?.sheet_data_version,
+    }
+}
+
 export const getUserProfileFromString = (user_profile_json: string): UserProfile => {
     const userProfile = JSON.parse(user_profile_json)
     if (userProfile['usageTriggeredFeedbackID'] == '') {
@@ -21,7 +21,8 @@ import { convertFrontendtoBackendGraphParams } from "../components/taskpanes/Gra
 import { AvailableSnowflakeOptionsAndDefaults, SnowflakeCredentials, SnowflakeTableLocationAndWarehouse } from "../components/taskpanes/SnowflakeImport/SnowflakeImportTaskpane";
 import { SplitTextToColumnsParams } from "../components/taskpanes/SplitTextToColumns/SplitTextToColumnsTaskpane";
 import { StepImportData } from "../components/taskpanes/UpdateImports/UpdateImportsTaskpane";
-import { AnalysisData, MergeParams, BackendPivotParams, CodeOptions, CodeSnippetAPIResult, ColumnID, DataframeFormat, FeedbackID, FilterGroupType, FilterType, FormulaLocation, GraphID, ParameterizableParams, SheetData, UIState, UserProfile, GraphParamsBackend, GraphParamsFrontend, StepType } from "../types";
+import { AnalysisData, MergeParams, BackendPivotParams, CodeOptions, CodeSnippetAPIResult, ColumnID, DataframeFormat, FeedbackID, FilterGroupType, FilterType, FormulaLocation, GraphID, ParameterizableParams, PerformanceProfile, SheetData, UIState, UserProfile, GraphParamsBackend, GraphParamsFrontend, StepType } from "../types";
+import { applySheetDataPatch } from "../utils/sheetData";
 import { SendFunction, SendFunctionErrorReturnType, SendFunctionSuccessReturnType } from "./send";
 
 export type MitoAPIResult<ResultType> = {result: ResultType} | SendFunctionErrorReturnType 
@@ -101,7 +102,11 @@ interface MitoSuccessOrInplaceErrorResponse {
     'event': 'response',
     'id': string,
     'shared_variables'?: {
-        'sheet_data_json': string,
+        // The backend sends a patch to the sheet data, rather than all of it, if the 
+        // sheet_data_version in the message is the version it last sent
+        'sheet_data_json'?: string,
+        'sheet_data_patch_json'?: string,
+        'sheet_data_version'?: number,
         'analysis_data_json': string,
         'user_profile_json': string
     }
@@ -136,6 +141,9 @@ export class MitoAPI {
     setAnalysisData: React.Dispatch<React.SetStateAction<AnalysisData>>
     setUserProfile: React.Dispatch<React.SetStateAction<UserProfile>>
     setUIState: React.Dispatch<React.SetStateAction<UIState>>
+    // The version of the sheet data array we have, which we send to the backend
+    // so that it only has to send us a patch to the sheet data
+    sheetDataVersion: number | undefined;
     
     constructor(
         getSendFunction: () => Promise<SendFunction | undefined>,
@@ -152,9 +160,25 @@ export class MitoAPI {
     }
 
     _updateSharedStateVariables<ResultType>(response: SendFunctionSuccessReturnType<ResultType>) {
-        if (response.sheetDataArray) {
+        // Responses might arrive out of order, so we never go back to an older version of the 
+        // sheet data
+        const isNewerSheetData = response.sheetDataVersion === undefined || this.sheetDataVersion === undefined || response.sheetDataVersion > this.sheetDataVersion;
+        if (response.sheetDataArray && isNewerSheetData) {
             this.setSheetDataArray(response.sheetDataArray);
-        } 
+            this.sheetDataVersion = response.sheetDataVersion;
+        } else if (response.sheetDataPatch && response.sheetDataVersion !== undefined && this.sheetDataVersion !== undefined) {
+            // Each patch increases the version by one, so we can only apply a patch to the 
+            // version right before it. A patch with the version we have changes nothing
+            if (response.sheetDataVersion === this.sheetDataVersion + 1) {
+                const sheetDataPatch = response.sheetDataPatch;
+                this.setSheetDataArray((prevSheetDataArray) => applySheetDataPatch(prevSheetDataArray, sheetDataPatch));
+                this.sheetDataVersion = response.sheetDataVersion;
+            } else if (response.sheetDataVersion > this.sheetDataVersion + 1) {
+                // If we missed a version, we forget the version we have, so that the backend 
+                // sends all of the sheet data in the response to the next message
+                this.sheetDataVersion = undefined;
+            }
+        }
         if (response.analysisData) {
             this.setAnalysisData(response.analysisData);
         }
@@ -217,6 +241,7 @@ export class MitoAPI {
         // Generate a random id, and add it to the params
         const id = getRandomId();
         msg['id'] = id;
+        msg['sheet_data_version'] = this.sheetDataVersion;
 
         if (this._send === undefined) {
             const _send = await this.getSendFunction();
@@ -302,6 +327,20 @@ export class MitoAPI {
         })
     }
 
+    /*
+        Returns how long each step took to execute, split up by each part
+        of executing it, so that we can find slow steps
+    */
+    async getPerformanceProfile(includeChromeTrace?: boolean): Promise<MitoAPIResult<PerformanceProfile>> {
+        return await this.send<PerformanceProfile>({
+            'event': 'api_call',
+            'type': 'get_performance_profile',
+            'params': {
+                'include_chrome_trace': includeChromeTrace ?? false,
+            },
+        })
+    }
+
     /*
         Returns a string encoding of the excel file to download
 
@@ -857,6 +896,26 @@ export class MitoAPI {
         })
     }
     
+    /*
+        Recalculates the formulas of all the columns that depend on the passed column
+    */
+    async editRecalculateDependents(
+        sheet_index: number,
+        column_id: ColumnID,
+    ): Promise<void> {
+
+        const stepID = getRandomId();
+        await this.send({
+            'event': 'edit_event',
+            'type': 'recalculate_dependents_edit',
+            'step_id': stepID,
+            'params': {
+                sheet_index: sheet_index,
+                column_id: column_id,
+            }
+        })
+    }
+    
     // AUTOGENERATED LINE: API EDIT (DO NOT DELETE)
     
     
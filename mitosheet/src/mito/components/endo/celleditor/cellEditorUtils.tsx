@@ -6,7 +6,7 @@
 // Utilities for the cell editor
 
 import { FunctionDocumentationObject, functionDocumentationObjects } from "../../../data/function_documentation";
-import { AnalysisData, EditorState, FrontendFormulaAndLocation, IndexLabel, MitoSelection, SheetData } from "../../../types";
+import { AnalysisData, EditorState, FormulaIndex, FrontendFormulaAndLocation, IndexLabel, MitoSelection, SheetData } from "../../../types";
 import { getDisplayColumnHeader, isPrimitiveColumnHeader, rowIndexToColumnHeaderLevel } from "../../../utils/columnHeaders";
 import { getUpperLeftAndBottomRight } from "../selectionUtils";
 import { getCellDataFromCellIndexes } from "../utils";
@@ -376,18 +376,44 @@ export const getDocumentationFunction = (formula: string, selectionStart: number
     }
 }
 
-export const getNewIndexLabelAtRowOffsetFromOtherIndexLabel = (index: IndexLabel[], indexLabel: IndexLabel | undefined, rowOffset: number): IndexLabel | undefined => {
+export const getNewIndexLabelAtRowOffsetFromOtherIndexLabel = (index: FormulaIndex | null, indexLabel: IndexLabel | undefined, rowOffset: number): IndexLabel | undefined => {
     if (indexLabel === undefined) {
         return undefined;
     }
+
+    // Formulas without row offsets do not store their index, as they don't need it
+    if (rowOffset === 0) {
+        return indexLabel;
+    }
+    if (index === null) {
+        return undefined;
+    }
+
+    if (index.type === 'range') {
+        // For a RangeIndex, we can find the position of the label without listing all the labels
+        if (typeof indexLabel !== 'number' || index.step === 0) {
+            return undefined;
+        }
+        const length = Math.max(0, Math.ceil((index.stop - index.start) / index.step));
+        const indexOfIndexLabel = (indexLabel - index.start) / index.step;
+        if (!Number.isInteger(indexOfIndexLabel) || indexOfIndexLabel < 0 || indexOfIndexLabel >= length) {
+            return undefined;
+        }
+
+        const indexOfNewLabel = indexOfIndexLabel - rowOffset;
+        if (indexOfNewLabel < 0 || indexOfNewLabel >= length) {
+            return undefined;
+        }
+        return index.start + indexOfNewLabel * index.step;
+    }
     
-    const indexOfIndexLabel = index.indexOf(indexLabel);
+    const indexOfIndexLabel = index.labels.indexOf(indexLabel);
     if (indexOfIndexLabel === -1) {
         return undefined;
     }
 
     const indexOfNewLabel = indexOfIndexLabel - rowOffset;
-    return index[indexOfNewLabel];
+    return index.labels[indexOfNewLabel];
 }
 
 
@@ -5,12 +5,12 @@
 
 export { Mito } from './Mito';
 export { 
-    AnalysisData, GraphData, GraphDataArray as graphDataArray, GraphParamsBackend, PublicInterfaceVersion, SheetData, UserProfile,
+    AnalysisData, GraphData, GraphDataArray as graphDataArray, GraphParamsBackend, PublicInterfaceVersion, SheetData, SheetDataPatch, UserProfile,
     MitoTheme
 } from "./types"
 
 export { MitoAPI, MitoResponse } from './api/api';
-export { MAX_WAIT_FOR_SEND_CREATION, SendFunction, SendFunctionError, SendFunctionReturnType } from "../mito/api/send";
+export { MAX_WAIT_FOR_SEND_CREATION, SendFunction, SendFunctionError, SendFunctionReturnType, SendFunctionSuccessReturnType } from "../mito/api/send";
 
 export { waitUntilConditionReturnsTrueOrTimeout } from "../mito/utils/time";
 
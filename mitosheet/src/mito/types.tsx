@@ -59,6 +59,7 @@ export enum StepType {
     UserDefinedImport = 'user_defined_import',
     Replace = 'replace',
     UserDefinedEdit = 'user_defined_edit',
+    RecalculateDependents = 'recalculate_dependents',
     // AUTOGENERATED LINE: STEPTYPE (DO NOT DELETE)
 }
 
@@ -292,10 +293,16 @@ export type IndexLabel = string | number;
 
 export type FormulaLocation = {'type': 'entire_column'} | {'type': 'specific_index_labels', 'index_labels': IndexLabel[]}
 
+/**
+ * The index a formula was written against, which is only used to turn row offsets
+ * back into index labels. It is null if the formula has no row offsets.
+ */
+export type FormulaIndex = {'type': 'range', 'start': number, 'stop': number, 'step': number} | {'type': 'labels', 'labels': IndexLabel[]}
+
 export type FrontendFormulaAndLocation = {
     'frontend_formula': Formula,
     'location': FormulaLocation,
-    'index': IndexLabel[]
+    'index': FormulaIndex | null
 }
 
 
@@ -333,6 +340,51 @@ export type SheetData = {
     conditionalFormattingResult: ConditionalFormattingResult;
 };
 
+/**
+ * A patch that turns the sheet data array the frontend has into the current
+ * sheet data array, which the backend sends rather than the entire sheet data
+ * array after an edit. See get_sheet_data_patch in the backend.
+ * 
+ * @param numSheets - the number of sheets in the new sheet data array
+ * @param sheetPatches - the changes to each sheet that changed. New sheets include
+ * all of their sheetData, while existing sheets just include the fields that changed, 
+ * the ids of all of their columns in order, and just the columns that changed
+ */
+export type SheetDataPatch = {
+    numSheets: number;
+    sheetPatches: ({
+        sheetIndex: number;
+        sheetData: SheetData;
+    } | {
+        sheetIndex: number;
+        changedFields: Partial<SheetData>;
+        columnIDs: ColumnID[];
+        changedColumns: SheetData['data'];
+    })[];
+};
+
+/**
+ * How long each of the steps in the analysis took to execute.
+ * 
+ * @param steps - the steps, in the order they first executed. The times are the total
+ * seconds spent in each part of executing the step (e.g. saturate, state_copy, transpile, 
+ * exec, recon) and in creating the sheet data (sheet_data_json), over all executions
+ * @param chromeTrace - all the timed parts of steps in the Chrome trace event format, if requested
+ */
+export type PerformanceProfile = {
+    steps: {
+        stepID: string;
+        stepType: StepType;
+        numExecutions: number;
+        totalTime: number;
+        times: Record<string, number>;
+    }[];
+    chromeTrace?: {
+        traceEvents: Record<string, unknown>[];
+        displayTimeUnit: string;
+    };
+};
+
 
 export type GraphPreprocessingParams = {
     safety_filter_turned_on_by_user: boolean
@@ -0,0 +1,39 @@
+/*
+ * Copyright (c) Saga Inc.
+ * Distributed under the terms of the GNU Affero General Public License v3.0 License.
+ */
+
+import { ColumnID, SheetData, SheetDataPatch } from "../types";
+
+/* 
+    Applies a patch that the backend sent to the sheet data array, and 
+    returns the new sheet data array. The patch must have been made from 
+    this sheet data array.
+*/
+export const applySheetDataPatch = (sheetDataArray: SheetData[], sheetDataPatch: SheetDataPatch): SheetData[] => {
+    const newSheetDataArray = sheetDataArray.slice(0, sheetDataPatch.numSheets);
+
+    sheetDataPatch.sheetPatches.forEach((sheetPatch) => {
+        if ('sheetData' in sheetPatch) {
+            newSheetDataArray[sheetPatch.sheetIndex] = sheetPatch.sheetData;
+            return;
+        }
+
+        const prevSheetData = newSheetDataArray[sheetPatch.sheetIndex];
+        const columns: Record<ColumnID, SheetData['data'][number]> = {};
+        prevSheetData.data.forEach((column) => {
+            columns[column.columnID] = column;
+        })
+        sheetPatch.changedColumns.forEach((column) => {
+            columns[column.columnID] = column;
+        })
+
+        newSheetDataArray[sheetPatch.sheetIndex] = {
+            ...prevSheetData,
+            ...sheetPatch.changedFields,
+            data: sheetPatch.columnIDs.map((columnID) => columns[columnID])
+        }
+    })
+
+    return newSheetDataArray;
+}
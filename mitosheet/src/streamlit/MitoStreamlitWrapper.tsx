@@ -12,7 +12,7 @@ import {
 import Mito from '../mito/Mito';
 import React, { ReactNode } from "react"
 import { MitoResponse, MitoTheme, SendFunctionReturnType } from "../mito";
-import { getAnalysisDataFromString, getSheetDataArrayFromString, getUserProfileFromString } from "../jupyter/jupyterUtils";
+import { getAnalysisDataFromString, getSheetDataArrayFromString, getSheetDataFromSharedVariables, getUserProfileFromString } from "../jupyter/jupyterUtils";
 
 
 interface State {
@@ -134,7 +134,7 @@ class MitoStreamlitWrapper extends StreamlitComponentBase<State> {
                     const sharedVariables = response.shared_variables;
                     
                     return resolve({
-                        sheetDataArray: sharedVariables ? getSheetDataArrayFromString(sharedVariables.sheet_data_json) : undefined,
+                        ...getSheetDataFromSharedVariables(sharedVariables),
                         analysisData: sharedVariables ? getAnalysisDataFromString(sharedVariables.analysis_data_json) : undefined,
                         userProfile: sharedVariables ? getUserProfileFromString(sharedVariables.user_profile_json) : undefined,
                         result: response['data'] as ResultType
@@ -6,7 +6,7 @@
 import React from 'react';
 import { Mito } from '../mito';
 import { MitoResponse, SendFunctionReturnType } from '../mito';
-import { getAnalysisDataFromString, getSheetDataArrayFromString, getUserProfileFromString } from '../jupyter/jupyterUtils';
+import { getAnalysisDataFromString, getSheetDataFromSharedVariables, getUserProfileFromString } from '../jupyter/jupyterUtils';
 import { AnalysisData, SheetData, UserProfile } from '../mito/types';
 
 interface MitoVSCodeWrapperProps {
@@ -50,7 +50,7 @@ const MitoVSCodeWrapper = (props: MitoVSCodeWrapperProps): JSX.Element => {
                 const sharedVariables = mitoResponse.shared_variables;
 
                 return {
-                    sheetDataArray: sharedVariables ? getSheetDataArrayFromString(sharedVariables.sheet_data_json) : undefined,
+                    ...getSheetDataFromSharedVariables(sharedVariables),
                     analysisData: sharedVariables ? getAnalysisDataFromString(sharedVariables.analysis_data_json) : undefined,
                     userProfile: sharedVariables ? getUserProfileFromString(sharedVariables.user_profile_json) : undefined,
                     result: mitoResponse['data'] as ResultType,